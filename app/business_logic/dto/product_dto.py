@@ -42,3 +42,17 @@ class ProductDTO(ProductBaseDTO):
     id: uuid.UUID = Field(..., description="Unique identifier for the product")
 
     model_config = ConfigDict(from_attributes=True)
+
+class ProductListItemDTO(BaseModel):
+    """
+    A slim, read-only product row for lists and searches. Built from a column projection
+    rather than a full entity; use ProductManager.get_product for the complete record.
+    """
+    id: uuid.UUID
+    sku: str
+    name: str
+    barcode: Optional[str] = None
+    selling_price: Decimal
+    cost_price: Decimal
+    gst_rate: Decimal
+    is_active: bool
@@ -6,6 +6,7 @@ from uuid import UUID
 from decimal import Decimal
 
 from app.core.result import Result, Success, Failure
+from app.core.pagination import Page
 from app.business_logic.managers.base_manager import BaseManager
 from app.business_logic.dto.customer_dto import CustomerDTO, CustomerCreateDTO, CustomerUpdateDTO
 from app.models.customer import Customer
@@ -96,13 +97,13 @@ class CustomerManager(BaseManager):
             
         return Success(CustomerDTO.from_orm(customer))
 
-    async def get_all_customers(self, company_id: UUID, limit: int = 100, offset: int = 0) -> Result[List[CustomerDTO], str]:
-        """Retrieves all customers for a given company."""
-        result = await self.customer_service.get_all(company_id, limit, offset)
+    async def get_all_customers(self, company_id: UUID, limit: int = 100, cursor: Optional[str] = None) -> Result[Page[CustomerDTO], str]:
+        """Retrieves one page of customers for a given company, ordered by name, with the total count; pass the page's next_cursor to continue."""
+        result = await self.customer_service.get_page(company_id, limit, cursor, order_by_column="name", with_total=True)
         if isinstance(result, Failure):
             return result
         
-        return Success([CustomerDTO.from_orm(c) for c in result.value])
+        return Success(result.value.map(CustomerDTO.from_orm))
     
     async def search_customers(self, company_id: UUID, term: str, limit: int = 100, offset: int = 0) -> Result[List[CustomerDTO], str]:
         """Searches for customers by code, name, email, or phone."""
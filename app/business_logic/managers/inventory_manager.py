@@ -1,12 +1,14 @@
 # File: app/business_logic/managers/inventory_manager.py
 """Business Logic Manager for orchestrating Inventory operations."""
 from __future__ import annotations
+import asyncio
 from typing import TYPE_CHECKING, List, Dict, Any, Optional
 from uuid import UUID
 from decimal import Decimal
 import uuid as uuid_pkg
 
 from app.core.result import Result, Success, Failure
+from app.core.pagination import Page
 from app.business_logic.managers.base_manager import BaseManager
 from app.business_logic.dto.inventory_dto import (
     StockAdjustmentDTO, PurchaseOrderCreateDTO, PurchaseOrderDTO,
@@ -97,11 +99,14 @@ class InventoryManager(BaseManager):
                 supplier_result = await self.supplier_service.get_by_id(dto.supplier_id, session)
                 if isinstance(supplier_result, Failure) or supplier_result.value is None: raise Exception("Supplier not found.")
 
+                # All of the PO's products are checked with one batched query.
+                products_result = await self.product_service.load_many([item_dto.product_id for item_dto in dto.items], session)
+                if isinstance(products_result, Failure): raise Exception(products_result.error)
+
                 po_total_amount = Decimal("0.0")
                 po_items: List[PurchaseOrderItem] = []
-                for item_dto in dto.items:
-                    product_result = await self.product_service.get_by_id(item_dto.product_id, session)
-                    if isinstance(product_result, Failure) or product_result.value is None: raise Exception(f"Product {item_dto.product_id} not found.")
+                for item_dto, product in zip(dto.items, products_result.value, strict=True):
+                    if product is None: raise Exception(f"Product {item_dto.product_id} not found.")
                     po_items.append(PurchaseOrderItem(**item_dto.dict()))
                     po_total_amount += item_dto.quantity_ordered * item_dto.unit_cost
 
@@ -150,11 +155,11 @@ class InventoryManager(BaseManager):
         except Exception as e:
             return Failure(f"Failed to receive PO items: {e}")
 
-    async def get_inventory_summary(self, company_id: UUID, outlet_id: Optional[UUID] = None, limit: int = 100, offset: int = 0, search_term: Optional[str] = None) -> Result[List[InventorySummaryDTO], str]:
-        """Retrieves a summary of inventory levels for display."""
-        summary_result = await self.inventory_service.get_inventory_summary(company_id, outlet_id, limit, offset, search_term)
+    async def get_inventory_summary(self, company_id: UUID, outlet_id: Optional[UUID] = None, limit: int = 100, cursor: Optional[str] = None, search_term: Optional[str] = None) -> Result[Page[InventorySummaryDTO], str]:
+        """Retrieves one page of inventory levels for display, with the total count; pass the page's next_cursor to continue."""
+        summary_result = await self.inventory_service.get_inventory_summary(company_id, outlet_id, limit, cursor, search_term, with_total=True)
         if isinstance(summary_result, Failure): return summary_result
-        return Success([InventorySummaryDTO(**row) for row in summary_result.value])
+        return Success(summary_result.value.map(lambda row: InventorySummaryDTO(**row)))
 
     async def get_all_suppliers(self, company_id: UUID) -> Result[List[SupplierDTO], str]:
         """Retrieves all active suppliers for a given company."""
@@ -168,13 +173,11 @@ class InventoryManager(BaseManager):
         if isinstance(po_results, Failure):
             return po_results
 
-        po_dtos: List[PurchaseOrderDTO] = []
-        for po in po_results.value:
-            supplier_name = po.supplier.name if po.supplier else "Unknown Supplier"
-            po_dto_res = await self._create_po_dto(po, supplier_name)
-            if isinstance(po_dto_res, Success):
-                po_dtos.append(po_dto_res.value)
-        return Success(po_dtos)
+        # Gathered so that the product loads of every PO are batched into a single query.
+        po_dto_results = await asyncio.gather(*(
+            self._create_po_dto(po, po.supplier.name if po.supplier else "Unknown Supplier") for po in po_results.value
+        ))
+        return Success([r.value for r in po_dto_results if isinstance(r, Success)])
         
     async def get_stock_movements_for_product(self, company_id: UUID, product_id: UUID) -> Result[List[StockMovementDTO], str]:
         """
@@ -192,9 +195,9 @@ class InventoryManager(BaseManager):
         if po.items:
             product_ids = [item.product_id for item in po.items]
             # FIX: Pass session to service call
-            products_res = await self.product_service.get_by_ids(product_ids, session)
+            products_res = await self.product_service.load_many(product_ids, session)
             if isinstance(products_res, Failure): return products_res
-            products_map = {p.id: p for p in products_res.value}
+            products_map = {p.id: p for p in products_res.value if p is not None}
 
             for item in po.items:
                 product = products_map.get(item.product_id)
@@ -1,7 +1,8 @@
 # File: app/business_logic/managers/payment_manager.py
 """Business Logic Manager for Payment Method operations."""
 from __future__ import annotations
-from typing import TYPE_CHECKING, List
+import time
+from typing import TYPE_CHECKING, Dict, List, Tuple
 from uuid import UUID
 
 from app.core.result import Result, Success, Failure
@@ -16,10 +17,30 @@ if TYPE_CHECKING:
 class PaymentMethodManager(BaseManager):
     """Orchestrates business logic for payment methods."""
 
+    def __init__(self, core: "ApplicationCore"):
+        super().__init__(core)
+        # Active methods per company: small and read on every sale. Entries expire after
+        # ENTITY_CACHE_TTL_SECONDS so changes made on another terminal are picked up.
+        self._active_methods_cache: Dict[UUID, Tuple[float, List[PaymentMethodDTO]]] = {}
+
     @property
     def payment_method_service(self) -> "PaymentMethodService":
         return self.core.payment_method_service
 
+    async def get_active_payment_methods(self, company_id: UUID) -> Result[List[PaymentMethodDTO], str]:
+        """Retrieves the active payment methods for a company, sorted by name. Cached for ENTITY_CACHE_TTL_SECONDS."""
+        settings = self.core.settings
+        cached = self._active_methods_cache.get(company_id)
+        if cached is not None and cached[0] > time.monotonic():
+            return Success(cached[1])
+        result = await self.payment_method_service.get_all_active_methods(company_id)
+        if isinstance(result, Failure):
+            return result
+        methods = [PaymentMethodDTO.from_orm(pm) for pm in result.value]
+        if settings.ENTITY_CACHE_ENABLED:
+            self._active_methods_cache[company_id] = (time.monotonic() + settings.ENTITY_CACHE_TTL_SECONDS, methods)
+        return Success(methods)
+
     async def get_all_payment_methods(self, company_id: UUID) -> Result[List[PaymentMethodDTO], str]:
         """Retrieves all payment methods for a given company, sorted by name."""
         result = await self.payment_method_service.get_all(company_id, order_by_column='name')
@@ -41,6 +62,7 @@ class PaymentMethodManager(BaseManager):
         create_result = await self.payment_method_service.create(new_method)
         if isinstance(create_result, Failure):
             return create_result
+        self._active_methods_cache.pop(company_id, None)
 
         return Success(PaymentMethodDTO.from_orm(create_result.value))
 
@@ -69,6 +91,7 @@ class PaymentMethodManager(BaseManager):
         update_result = await self.payment_method_service.update(method)
         if isinstance(update_result, Failure):
             return update_result
+        self._active_methods_cache.pop(method.company_id, None)
         
         return Success(PaymentMethodDTO.from_orm(update_result.value))
 
@@ -86,5 +109,6 @@ class PaymentMethodManager(BaseManager):
         update_result = await self.payment_method_service.update(method)
         if isinstance(update_result, Failure):
             return update_result
+        self._active_methods_cache.pop(method.company_id, None)
         
         return Success(True)
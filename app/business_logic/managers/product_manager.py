@@ -6,12 +6,13 @@ This manager orchestrates product-related workflows, enforces business rules,
 and coordinates with the data access layer (ProductService).
 """
 from __future__ import annotations
-from typing import TYPE_CHECKING, List
+from typing import TYPE_CHECKING, List, Optional
 from uuid import UUID
 
 from app.core.result import Result, Success, Failure
+from app.core.pagination import Page
 from app.business_logic.managers.base_manager import BaseManager
-from app.business_logic.dto.product_dto import ProductDTO, ProductCreateDTO, ProductUpdateDTO
+from app.business_logic.dto.product_dto import ProductDTO, ProductCreateDTO, ProductUpdateDTO, ProductListItemDTO
 from app.models.product import Product # Import the ORM model
 
 if TYPE_CHECKING:
@@ -36,22 +37,24 @@ class ProductManager(BaseManager):
         Returns:
             A Success with the created ProductDTO, or a Failure with an error message.
         """
-        # Business rule: Check for duplicate SKU
-        existing_product_result = await self.product_service.get_by_sku(company_id, dto.sku)
-        if isinstance(existing_product_result, Failure):
-            return existing_product_result # Propagate database error
-        if existing_product_result.value is not None:
-            return Failure(f"Business Rule Error: Product with SKU '{dto.sku}' already exists.")
+        # The SKU check and the insert share one session and transaction.
+        async with self.core.unit_of_work():
+            # Business rule: Check for duplicate SKU
+            existing_product_result = await self.product_service.get_by_sku(company_id, dto.sku)
+            if isinstance(existing_product_result, Failure):
+                return existing_product_result # Propagate database error
+            if existing_product_result.value is not None:
+                return Failure(f"Business Rule Error: Product with SKU '{dto.sku}' already exists.")
 
-        # Convert DTO to ORM model instance
-        new_product = Product(company_id=company_id, **dto.dict())
-        
-        # Persist via service
-        create_result = await self.product_service.create(new_product)
-        if isinstance(create_result, Failure):
-            return create_result # Propagate database error from service
+            # Convert DTO to ORM model instance
+            new_product = Product(company_id=company_id, **dto.dict())
 
-        return Success(ProductDTO.from_orm(create_result.value))
+            # Persist via service
+            create_result = await self.product_service.create(new_product)
+            if isinstance(create_result, Failure):
+                return create_result # Propagate database error from service
+
+            return Success(ProductDTO.from_orm(create_result.value))
 
     async def update_product(self, product_id: UUID, dto: ProductUpdateDTO) -> Result[ProductDTO, str]:
         """
@@ -62,33 +65,36 @@ class ProductManager(BaseManager):
         Returns:
             A Success with the updated ProductDTO, or a Failure with an error message.
         """
-        # Retrieve existing product
-        product_result = await self.product_service.get_by_id(product_id)
-        if isinstance(product_result, Failure):
-            return product_result
-        
-        product = product_result.value
-        if not product:
-            return Failure("Product not found.")
+        # The lookup, SKU check and update share one session and transaction.
+        async with self.core.unit_of_work():
+            # Retrieve existing product
+            product_result = await self.product_service.get_by_id(product_id)
+            if isinstance(product_result, Failure):
+                return product_result
 
-        # Business rule: If SKU is changed, check for duplication
-        if dto.sku != product.sku:
-            existing_product_result = await self.product_service.get_by_sku(product.company_id, dto.sku)
-            if isinstance(existing_product_result, Failure):
-                return existing_product_result
-            if existing_product_result.value is not None and existing_product_result.value.id != product_id:
-                return Failure(f"Business Rule Error: New SKU '{dto.sku}' is already in use by another product.")
+            product = product_result.value
+            if not product:
+                return Failure("Product not found.")
 
-        # Update fields from DTO
-        for field, value in dto.dict(exclude_unset=True).items(): # exclude_unset for partial updates
-            setattr(product, field, value)
+            # Business rule: If SKU is changed, check for duplication
+            if dto.sku != product.sku:
+                existing_product_result = await self.product_service.get_by_sku(product.company_id, dto.sku)
+                if isinstance(existing_product_result, Failure):
+                    return existing_product_result
+                if existing_product_result.value is not None and existing_product_result.value.id != product_id:
+                    return Failure(f"Business Rule Error: New SKU '{dto.sku}' is already in use by another product.")
 
-        # Persist update via service
-        update_result = await self.product_service.update(product)
-        if isinstance(update_result, Failure):
-            return update_result # Propagate database error
-        
-        return Success(ProductDTO.from_orm(update_result.value))
+            # Update fields from DTO
+            for field, value in dto.dict(exclude_unset=True).items(): # exclude_unset for partial updates
+                setattr(product, field, value)
+
+            # Persist update via service
+            update_result = await self.product_service.update(product)
+            if isinstance(update_result, Failure):
+                return update_result # Propagate database error
+
+            self.core.catalog_index.forget(product_id) # Scans re-read it until the next index refresh.
+            return Success(ProductDTO.from_orm(update_result.value))
 
     async def get_product(self, product_id: UUID) -> Result[ProductDTO, str]:
         """
@@ -108,38 +114,68 @@ class ProductManager(BaseManager):
             
         return Success(ProductDTO.from_orm(product))
 
-    async def get_all_products(self, company_id: UUID, limit: int = 100, offset: int = 0) -> Result[List[ProductDTO], str]:
+    async def get_all_products(self, company_id: UUID, limit: int = 100, cursor: Optional[str] = None) -> Result[Page[ProductListItemDTO], str]:
         """
-        Retrieves all products for a given company.
+        Retrieves one page of products for a given company, ordered by name.
+        Only the list columns are loaded; use get_product for the full record.
         Args:
             company_id: The UUID of the company.
             limit: Max number of products to return.
-            offset: Number of products to skip.
+            cursor: The previous page's next_cursor, or None for the first page.
         Returns:
-            A Success with a list of ProductDTOs, or a Failure.
+            A Success with a Page of ProductListItemDTOs (page.total counts the whole catalogue), or a Failure.
         """
-        result = await self.product_service.get_all(company_id, limit, offset)
+        result = await self.product_service.get_list_rows_page(company_id, limit, cursor, with_total=True)
         if isinstance(result, Failure):
             return result
         
-        return Success([ProductDTO.from_orm(p) for p in result.value])
+        return Success(result.value.map(lambda row: ProductListItemDTO(**row)))
     
-    async def search_products(self, company_id: UUID, term: str, limit: int = 100, offset: int = 0) -> Result[List[ProductDTO], str]:
+    def find_scanned_product(self, code: str) -> Optional[ProductListItemDTO]:
+        """
+        Resolves a scanned barcode or exact SKU from the in-memory catalog index, without a
+        database round trip. Safe to call from the UI thread.
+        Args:
+            code: The scanned or typed code.
+        Returns:
+            The matching active product, or None on a miss or while the index is still loading
+            (fall back to search_products).
+        """
+        row = self.core.catalog_index.lookup(code)
+        return ProductListItemDTO(**row) if row else None
+
+    async def get_current_list_items(self, product_ids: List[UUID]) -> Result[List[ProductListItemDTO], str]:
+        """
+        Reads the products' list rows straight from the database, bypassing the entity cache,
+        e.g. to re-price a cart whose rows came from the catalog index.
+        Args:
+            product_ids: The UUIDs of the products.
+        Returns:
+            A Success with the ProductListItemDTOs of the products found, or a Failure.
+        """
+        result = await self.product_service.get_by_ids(product_ids, bypass_cache=True)
+        if isinstance(result, Failure):
+            return result
+        fields = ProductListItemDTO.model_fields
+        return Success([ProductListItemDTO(**{field: getattr(product, field) for field in fields}) for product in result.value])
+
+    async def search_products(self, company_id: UUID, term: str, limit: int = 100, offset: int = 0) -> Result[List[ProductListItemDTO], str]:
         """
         Searches for products by SKU, barcode, or name for a given company.
+        Only the list columns are loaded; use get_product for the full record.
         Args:
             company_id: The UUID of the company.
             term: The search term.
             limit: Max number of products to return.
             offset: Number of products to skip.
         Returns:
-            A Success with a list of matching ProductDTOs, or a Failure.
+            A Success with a list of matching ProductListItemDTOs, or a Failure.
         """
-        result = await self.product_service.search(company_id, term, limit, offset)
+        result = await self.product_service.search_list_rows(company_id, term, limit, offset)
         if isinstance(result, Failure):
             return result
         
-        return Success([ProductDTO.from_orm(p) for p in result.value])
+        return Success([ProductListItemDTO(**row) for row in result.value])
 
     async def deactivate_product(self, product_id: UUID) -> Result[bool, str]:
         """
@@ -162,4 +198,5 @@ class ProductManager(BaseManager):
         if isinstance(update_result, Failure):
             return update_result
         
+        self.core.catalog_index.forget(product_id)
         return Success(True)
@@ -13,12 +13,9 @@ from app.business_logic.dto.reporting_dto import (
     DashboardStatsDTO, SalesSummaryReportDTO, SalesByPeriodDTO, ProductPerformanceDTO,
     InventoryValuationReportDTO, InventoryValuationItemDTO, GstReportDTO
 )
-from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Table, TableStyle
-from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
-from reportlab.lib import colors
-from reportlab.lib.units import inch
 
 if TYPE_CHECKING:
+    from reportlab.platypus import Table
     from app.core.application_core import ApplicationCore
     from app.services.report_service import ReportService
     from app.services.company_service import OutletService
@@ -76,16 +73,18 @@ class ReportingManager(BaseManager):
 
     async def generate_inventory_valuation_report(self, company_id: uuid.UUID, outlet_id: Optional[uuid.UUID] = None) -> Result[InventoryValuationReportDTO, str]:
         """Generates a report showing the current value of inventory."""
-        raw_data_res = await self.report_service.get_inventory_valuation_raw_data(company_id, outlet_id)
-        if isinstance(raw_data_res, Failure): return raw_data_res
-        
-        items_data = raw_data_res.value
-        valuation_items = [InventoryValuationItemDTO(**item) for item in items_data]
+        # The valuation query and the outlet lookup share one session and transaction.
+        async with self.core.unit_of_work(readonly=True):
+            raw_data_res = await self.report_service.get_inventory_valuation_raw_data(company_id, outlet_id)
+            if isinstance(raw_data_res, Failure): return raw_data_res
+
+            items_data = raw_data_res.value
+            valuation_items = [InventoryValuationItemDTO(**item) for item in items_data]
 
-        outlet_name = "All Outlets"
-        if outlet_id:
-            outlet_res = await self.outlet_service.get_by_id(outlet_id)
-            if isinstance(outlet_res, Success) and outlet_res.value: outlet_name = outlet_res.value.name
+            outlet_name = "All Outlets"
+            if outlet_id:
+                outlet_res = await self.outlet_service.get_by_id(outlet_id)
+                if isinstance(outlet_res, Success) and outlet_res.value: outlet_name = outlet_res.value.name
 
         return Success(InventoryValuationReportDTO(
             as_of_date=date.today(), outlet_id=outlet_id or uuid.uuid4(), outlet_name=outlet_name,
@@ -96,12 +95,13 @@ class ReportingManager(BaseManager):
     async def export_report_to_pdf(self, report_data: Any, file_path: str) -> Result[str, str]:
         """Exports the provided report data DTO to a PDF file."""
         try:
+            # ReportLab layout is pure-Python CPU work, so it is rendered off the event loop.
             if isinstance(report_data, SalesSummaryReportDTO):
-                self._create_sales_summary_pdf(report_data, file_path)
+                await self.core.run_cpu(_create_sales_summary_pdf, report_data, file_path)
             elif isinstance(report_data, InventoryValuationReportDTO):
-                self._create_inventory_valuation_pdf(report_data, file_path)
+                await self.core.run_cpu(_create_inventory_valuation_pdf, report_data, file_path)
             elif isinstance(report_data, GstReportDTO):
-                self._create_gst_report_pdf(report_data, file_path)
+                await self.core.run_cpu(_create_gst_report_pdf, report_data, file_path)
             else:
                 return Failure("Unsupported report type for PDF export.")
             return Success(f"Report successfully exported to {file_path}")
@@ -112,93 +112,38 @@ class ReportingManager(BaseManager):
         """Exports the provided report data DTO to a CSV file."""
         try:
             if isinstance(report_data, SalesSummaryReportDTO):
-                self._create_product_performance_csv(report_data, file_path)
+                await self.core.run_blocking(self._create_product_performance_csv, report_data, file_path)
             elif isinstance(report_data, InventoryValuationReportDTO):
-                self._create_inventory_valuation_csv(report_data, file_path)
+                await self.core.run_blocking(self._create_inventory_valuation_csv, report_data, file_path)
             else:
                 return Failure("Unsupported report type for CSV export.")
             return Success(f"Report successfully exported to {file_path}")
         except Exception as e:
             return Failure(f"Failed to export CSV: {e}")
 
-    # --- Private PDF Creation Helpers ---
-    def _create_sales_summary_pdf(self, data: SalesSummaryReportDTO, file_path: str):
-        doc = SimpleDocTemplate(file_path, rightMargin=inch/2, leftMargin=inch/2, topMargin=inch/2, bottomMargin=inch/2)
-        styles = getSampleStyleSheet()
-        story = [Paragraph("Sales Summary Report", styles['h1']), Spacer(1, 0.2*inch)]
-        
-        summary_text = f"Period: {data.start_date.strftime('%d %b %Y')} to {data.end_date.strftime('%d %b %Y')}<br/>" \
-                       f"Total Revenue: S${data.total_revenue:.2f}<br/>" \
-                       f"Total Transactions: {data.total_transactions}"
-        story.append(Paragraph(summary_text, styles['Normal']))
-        story.append(Spacer(1, 0.2*inch))
-
-        story.append(Paragraph("Sales by Period", styles['h2']))
-        sales_by_period_headers = ["Date", "Total Sales (S$)", "Transactions", "Avg. Tx Value (S$)"]
-        table_data = [sales_by_period_headers] + [[p.period.strftime('%Y-%m-%d'), f"{p.total_sales:.2f}", str(p.transaction_count), f"{p.average_transaction_value:.2f}"] for p in data.sales_by_period]
-        story.append(self._create_styled_table(table_data))
-        story.append(Spacer(1, 0.2*inch))
-
-        story.append(Paragraph("Top Performing Products", styles['h2']))
-        product_perf_headers = ["SKU", "Product Name", "Qty Sold", "Revenue (S$)", "Margin (S$)", "Margin (%)"]
-        table_data_2 = [product_perf_headers] + [[p.sku, p.name, f"{p.quantity_sold:.2f}", f"{p.total_revenue:.2f}", f"{p.gross_margin:.2f}", f"{p.gross_margin_percentage:.2f}%"] for p in data.top_performing_products]
-        story.append(self._create_styled_table(table_data_2))
-        
-        doc.build(story)
-
-    def _create_inventory_valuation_pdf(self, data: InventoryValuationReportDTO, file_path: str):
-        doc = SimpleDocTemplate(file_path, rightMargin=inch/2, leftMargin=inch/2, topMargin=inch/2, bottomMargin=inch/2)
-        styles = getSampleStyleSheet()
-        story = [Paragraph("Inventory Valuation Report", styles['h1']), Spacer(1, 0.2*inch)]
-        
-        summary_text = f"As of Date: {data.as_of_date.strftime('%d %b %Y')}<br/>" \
-                       f"Outlet: {data.outlet_name}<br/>" \
-                       f"Total Inventory Value: S${data.total_inventory_value:.2f}"
-        story.append(Paragraph(summary_text, styles['Normal']))
-        story.append(Spacer(1, 0.2*inch))
-
-        inv_val_headers = ["SKU", "Product Name", "Qty On Hand", "Cost Price (S$)", "Total Value (S$)"]
-        table_data = [inv_val_headers] + [[i.sku, i.name, f"{i.quantity_on_hand:.4f}", f"{i.cost_price:.4f}", f"{i.total_value:.2f}"] for i in data.items]
-        story.append(self._create_styled_table(table_data))
-        doc.build(story)
-    
-    def _create_gst_report_pdf(self, data: GstReportDTO, file_path: str):
-        doc = SimpleDocTemplate(file_path, rightMargin=inch, leftMargin=inch, topMargin=inch, bottomMargin=inch)
-        styles = getSampleStyleSheet()
-        story = [Paragraph("GST Form 5 Summary", styles['h1']), Spacer(1, 0.2*inch)]
-        
-        company_info = f"Company: {data.company_name} (GST Reg No: {data.company_gst_reg_no or 'N/A'})<br/>" \
-                       f"Period: {data.start_date.strftime('%d %b %Y')} to {data.end_date.strftime('%d %b %Y')}"
-        story.append(Paragraph(company_info, styles['Normal']))
-        story.append(Spacer(1, 0.2*inch))
-
-        gst_data = [
-            ["Box 1: Standard-Rated Supplies", f"S${data.box_1_standard_rated_supplies:.2f}"],
-            ["Box 6: Output Tax Due", f"S${data.box_6_output_tax_due:.2f}"],
-            ["Box 5: Taxable Purchases", f"S${data.box_5_taxable_purchases:.2f}"],
-            ["Box 7: Input Tax Claimed", f"S${data.box_7_input_tax_claimed:.2f}"],
-            ["", ""],
-            [f"Net GST {'Payable' if data.box_13_net_gst_payable >=0 else 'Claimable'}", f"S${abs(data.box_13_net_gst_payable):.2f}"]
-        ]
-        story.append(self._create_styled_table(gst_data, align_right_cols=[1]))
-        doc.build(story)
-
-    def _create_styled_table(self, data: List[List[Any]], align_right_cols: List[int] = []) -> Table:
-        style = TableStyle([
-            ('BACKGROUND', (0,0), (-1,0), colors.grey),
-            ('TEXTCOLOR', (0,0), (-1,0), colors.whitesmoke),
-            ('ALIGN', (0,0), (-1,-1), 'CENTER'),
-            ('FONTNAME', (0,0), (-1,0), 'Helvetica-Bold'),
-            ('BOTTOMPADDING', (0,0), (-1,0), 12),
-            ('BACKGROUND', (0,1), (-1,-1), colors.beige),
-            ('GRID', (0,0), (-1,-1), 1, colors.black)
-        ])
-        for col_idx in align_right_cols:
-            style.add('ALIGN', (col_idx, 1), (col_idx, -1), 'RIGHT')
-        
-        table = Table(data)
-        table.setStyle(style)
-        return table
+    async def export_sales_lines_to_csv(self, company_id: uuid.UUID, start_date: date, end_date: date, file_path: str) -> Result[str, str]:
+        """
+        Exports every completed sales line in the period to CSV. Lines are streamed from the
+        database and written chunk by chunk, so memory use does not grow with the period.
+        """
+        try:
+            line_count = 0
+            f = await self.core.run_blocking(open, file_path, 'w', newline='', encoding='utf-8')
+            try:
+                writer = csv.writer(f)
+                await self.core.run_blocking(writer.writerow, ["Transaction No.", "Date", "SKU", "Product Name", "Qty", "Unit Price (S$)", "Cost Price (S$)", "Line Total (S$)"])
+                async for chunk in self.report_service.stream_sales_lines(company_id, start_date, end_date):
+                    await self.core.run_blocking(writer.writerows, [
+                        [line["transaction_number"], line["transaction_date"].strftime('%Y-%m-%d %H:%M:%S'), line["sku"], line["name"],
+                         f"{line['quantity']:.4f}", f"{line['unit_price']:.4f}", f"{line['cost_price']:.4f}", f"{line['line_total']:.2f}"]
+                        for line in chunk
+                    ])
+                    line_count += len(chunk)
+            finally:
+                await self.core.run_blocking(f.close)
+            return Success(f"{line_count} sales lines exported to {file_path}")
+        except Exception as e:
+            return Failure(f"Failed to export sales lines: {e}")
 
     # --- Private CSV Creation Helpers ---
     def _create_product_performance_csv(self, data: SalesSummaryReportDTO, file_path: str):
@@ -220,3 +165,96 @@ class ReportingManager(BaseManager):
             writer.writerow(headers)
             for i in data.items:
                 writer.writerow([i.sku, i.name, f"{i.quantity_on_hand:.4f}", f"{i.cost_price:.4f}", f"{i.total_value:.2f}"])
+
+
+# --- Private PDF Creation Helpers ---
+# Module-level so they can be pickled and rendered in the CPU offload process pool. ReportLab is
+# imported inside each helper, so it is only loaded (in the worker process) when a PDF is exported.
+def _create_sales_summary_pdf(data: SalesSummaryReportDTO, file_path: str):
+    from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer
+    from reportlab.lib.styles import getSampleStyleSheet
+    from reportlab.lib.units import inch
+    doc = SimpleDocTemplate(file_path, rightMargin=inch/2, leftMargin=inch/2, topMargin=inch/2, bottomMargin=inch/2)
+    styles = getSampleStyleSheet()
+    story = [Paragraph("Sales Summary Report", styles['h1']), Spacer(1, 0.2*inch)]
+
+    summary_text = f"Period: {data.start_date.strftime('%d %b %Y')} to {data.end_date.strftime('%d %b %Y')}<br/>" \
+                   f"Total Revenue: S${data.total_revenue:.2f}<br/>" \
+                   f"Total Transactions: {data.total_transactions}"
+    story.append(Paragraph(summary_text, styles['Normal']))
+    story.append(Spacer(1, 0.2*inch))
+
+    story.append(Paragraph("Sales by Period", styles['h2']))
+    sales_by_period_headers = ["Date", "Total Sales (S$)", "Transactions", "Avg. Tx Value (S$)"]
+    table_data = [sales_by_period_headers] + [[p.period.strftime('%Y-%m-%d'), f"{p.total_sales:.2f}", str(p.transaction_count), f"{p.average_transaction_value:.2f}"] for p in data.sales_by_period]
+    story.append(_create_styled_table(table_data))
+    story.append(Spacer(1, 0.2*inch))
+
+    story.append(Paragraph("Top Performing Products", styles['h2']))
+    product_perf_headers = ["SKU", "Product Name", "Qty Sold", "Revenue (S$)", "Margin (S$)", "Margin (%)"]
+    table_data_2 = [product_perf_headers] + [[p.sku, p.name, f"{p.quantity_sold:.2f}", f"{p.total_revenue:.2f}", f"{p.gross_margin:.2f}", f"{p.gross_margin_percentage:.2f}%"] for p in data.top_performing_products]
+    story.append(_create_styled_table(table_data_2))
+
+    doc.build(story)
+
+def _create_inventory_valuation_pdf(data: InventoryValuationReportDTO, file_path: str):
+    from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer
+    from reportlab.lib.styles import getSampleStyleSheet
+    from reportlab.lib.units import inch
+    doc = SimpleDocTemplate(file_path, rightMargin=inch/2, leftMargin=inch/2, topMargin=inch/2, bottomMargin=inch/2)
+    styles = getSampleStyleSheet()
+    story = [Paragraph("Inventory Valuation Report", styles['h1']), Spacer(1, 0.2*inch)]
+
+    summary_text = f"As of Date: {data.as_of_date.strftime('%d %b %Y')}<br/>" \
+                   f"Outlet: {data.outlet_name}<br/>" \
+                   f"Total Inventory Value: S${data.total_inventory_value:.2f}"
+    story.append(Paragraph(summary_text, styles['Normal']))
+    story.append(Spacer(1, 0.2*inch))
+
+    inv_val_headers = ["SKU", "Product Name", "Qty On Hand", "Cost Price (S$)", "Total Value (S$)"]
+    table_data = [inv_val_headers] + [[i.sku, i.name, f"{i.quantity_on_hand:.4f}", f"{i.cost_price:.4f}", f"{i.total_value:.2f}"] for i in data.items]
+    story.append(_create_styled_table(table_data))
+    doc.build(story)
+
+def _create_gst_report_pdf(data: GstReportDTO, file_path: str):
+    from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer
+    from reportlab.lib.styles import getSampleStyleSheet
+    from reportlab.lib.units import inch
+    doc = SimpleDocTemplate(file_path, rightMargin=inch, leftMargin=inch, topMargin=inch, bottomMargin=inch)
+    styles = getSampleStyleSheet()
+    story = [Paragraph("GST Form 5 Summary", styles['h1']), Spacer(1, 0.2*inch)]
+
+    company_info = f"Company: {data.company_name} (GST Reg No: {data.company_gst_reg_no or 'N/A'})<br/>" \
+                   f"Period: {data.start_date.strftime('%d %b %Y')} to {data.end_date.strftime('%d %b %Y')}"
+    story.append(Paragraph(company_info, styles['Normal']))
+    story.append(Spacer(1, 0.2*inch))
+
+    gst_data = [
+        ["Box 1: Standard-Rated Supplies", f"S${data.box_1_standard_rated_supplies:.2f}"],
+        ["Box 6: Output Tax Due", f"S${data.box_6_output_tax_due:.2f}"],
+        ["Box 5: Taxable Purchases", f"S${data.box_5_taxable_purchases:.2f}"],
+        ["Box 7: Input Tax Claimed", f"S${data.box_7_input_tax_claimed:.2f}"],
+        ["", ""],
+        [f"Net GST {'Payable' if data.box_13_net_gst_payable >=0 else 'Claimable'}", f"S${abs(data.box_13_net_gst_payable):.2f}"]
+    ]
+    story.append(_create_styled_table(gst_data, align_right_cols=[1]))
+    doc.build(story)
+
+def _create_styled_table(data: List[List[Any]], align_right_cols: List[int] = []) -> Table:
+    from reportlab.platypus import Table, TableStyle
+    from reportlab.lib import colors
+    style = TableStyle([
+        ('BACKGROUND', (0,0), (-1,0), colors.grey),
+        ('TEXTCOLOR', (0,0), (-1,0), colors.whitesmoke),
+        ('ALIGN', (0,0), (-1,-1), 'CENTER'),
+        ('FONTNAME', (0,0), (-1,0), 'Helvetica-Bold'),
+        ('BOTTOMPADDING', (0,0), (-1,0), 12),
+        ('BACKGROUND', (0,1), (-1,-1), colors.beige),
+        ('GRID', (0,0), (-1,-1), 1, colors.black)
+    ])
+    for col_idx in align_right_cols:
+        style.add('ALIGN', (col_idx, 1), (col_idx, -1), 'RIGHT')
+
+    table = Table(data)
+    table.setStyle(style)
+    return table
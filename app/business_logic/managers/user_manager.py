@@ -40,7 +40,8 @@ class UserManager(BaseManager):
                 if isinstance(user_res, Failure): return user_res
                 if user_res.value: return Failure(f"Username '{dto.username}' already exists.")
 
-                hashed_password = self._hash_password(dto.password)
+                # bcrypt is deliberately slow; hash off the event loop so other tasks keep running.
+                hashed_password = await self.core.run_blocking(self._hash_password, dto.password)
                 new_user = User(company_id=company_id, password_hash=hashed_password, **dto.dict(exclude={'password', 'roles'}))
                 session.add(new_user)
                 await session.flush() # Flush to get the new_user.id
@@ -88,7 +89,7 @@ class UserManager(BaseManager):
                     setattr(user, key, value)
                 
                 if dto.password:
-                    user.password_hash = self._hash_password(dto.password)
+                    user.password_hash = await self.core.run_blocking(self._hash_password, dto.password)
 
                 existing_role_map = {ur.role_id: ur for ur in user.user_roles}
                 target_role_ids = set(dto.roles)
@@ -5,17 +5,26 @@ The heart of the application's architecture: The Dependency Injection Container.
 from __future__ import annotations
 from typing import TYPE_CHECKING, AsyncIterator, Dict, Any, Optional, Callable
 from contextlib import asynccontextmanager
+import asyncio
+import contextvars
+import functools
+import logging
+import time
 import sqlalchemy as sa
-from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker, AsyncSession, AsyncEngine
+from sqlalchemy.ext.asyncio import async_sessionmaker, AsyncSession, AsyncEngine
 import uuid
 
-from PySide6.QtCore import QObject, Slot
+from PySide6.QtCore import QObject, QTimer, Slot
 
 from app.core.config import Settings
-from app.core.exceptions import DatabaseConnectionError, CoreException, AsyncBridgeError, ConfigurationError
-from app.core.async_bridge import AsyncWorker, AsyncWorkerThread
+from app.core.database import build_engine, PoolMetrics, ReplicaRouter
+from app.core.warmup import warm_up
+from app.core.exceptions import DatabaseConnectionError, CoreException, ConfigurationError, TaskTimeoutError
+from app.core.async_bridge import AsyncWorker, AsyncWorkerPool, BackpressurePolicy, OffloadExecutors, TaskLane, TaskPriority, remaining_task_time
+from app.core.result import Failure
 
 if TYPE_CHECKING:
+    from app.core.catalog_index import CatalogIndex
     from app.services.product_service import ProductService
     from app.services.customer_service import CustomerService
     from app.services.inventory_service import InventoryService
@@ -40,7 +49,40 @@ class CallbackExecutor(QObject):
     """
     A simple QObject to execute callbacks on the thread it lives in. This is a
     robust mechanism for invoking calls from a worker thread onto the main thread.
+    Callbacks are drained from the worker in batches, and the batch sizes achieved
+    are counted so bursts (e.g. rapid barcode scans) can be observed.
     """
+    BATCH_SIZE_BUCKETS = (1, 2, 4, 8, 16, 32)
+
+    def __init__(self, parent: Optional[QObject] = None):
+        super().__init__(parent)
+        self.batches_executed = 0
+        self.callbacks_executed = 0
+        self.max_batch_size = 0
+        self.batch_size_histogram: Dict[str, int] = {self._bucket_label(size): 0 for size in self.BATCH_SIZE_BUCKETS}
+
+    @classmethod
+    def _bucket_label(cls, batch_size: int) -> str:
+        """Maps a batch size to its histogram bucket, e.g. 3 -> '<=4', 100 -> '>32'."""
+        for bound in cls.BATCH_SIZE_BUCKETS:
+            if batch_size <= bound:
+                return f"<={bound}"
+        return f">{cls.BATCH_SIZE_BUCKETS[-1]}"
+
+    @Slot(object)
+    def execute_batch(self, worker: AsyncWorker):
+        """Drains every completed callback queued on the worker in one slot invocation."""
+        batch = worker.take_completed_callbacks()
+        if not batch:
+            return
+        self.batches_executed += 1
+        self.callbacks_executed += len(batch)
+        self.max_batch_size = max(self.max_batch_size, len(batch))
+        label = self._bucket_label(len(batch))
+        self.batch_size_histogram[label] = self.batch_size_histogram.get(label, 0) + 1
+        for callback, result, error in batch:
+            self.execute(callback, result, error)
+
     @Slot(object, object, object)
     def execute(self, callback: Callable, result: Any, error: Optional[Exception]):
         """Executes the given callback with the result or error."""
@@ -51,6 +93,24 @@ class CallbackExecutor(QObject):
                 # To prevent a crash in a callback from crashing the application
                 print(f"Error executing callback {callback.__name__}: {e}")
 
+    def stats(self) -> Dict[str, Any]:
+        """Returns the callback batching counters."""
+        return {
+            "batches": self.batches_executed,
+            "callbacks": self.callbacks_executed,
+            "average_batch_size": (self.callbacks_executed / self.batches_executed) if self.batches_executed else 0.0,
+            "max_batch_size": self.max_batch_size,
+            "batch_size_histogram": dict(self.batch_size_histogram),
+        }
+
+logger = logging.getLogger(__name__)
+
+# Applies a task's remaining deadline to the current PostgreSQL transaction (see _apply_task_deadline).
+_SET_TASK_TIMEOUTS = sa.text("SELECT set_config('statement_timeout', :ms, true), set_config('lock_timeout', :ms, true)")
+
+# The session opened by the innermost active ApplicationCore.unit_of_work(), if any.
+_ambient_session: contextvars.ContextVar[Optional[AsyncSession]] = contextvars.ContextVar("ambient_session", default=None)
+
 class ApplicationCore:
     """
     Central DI container providing lazy-loaded access to services and managers.
@@ -61,64 +121,257 @@ class ApplicationCore:
         self._session_factory: Optional[async_sessionmaker[AsyncSession]] = None
         self._managers: Dict[str, Any] = {}
         self._services: Dict[str, Any] = {}
-        self._async_worker_thread: Optional[AsyncWorkerThread] = None
+        self._lane_engines: Dict[str, AsyncEngine] = {}
+        self._lane_session_factories: Dict[asyncio.AbstractEventLoop, async_sessionmaker[AsyncSession]] = {}
+        self._lane_pool_metrics: Dict[asyncio.AbstractEventLoop, PoolMetrics] = {}
+        self._lane_replica_routers: Dict[asyncio.AbstractEventLoop, ReplicaRouter] = {}
+        self._async_worker_pool: Optional[AsyncWorkerPool] = None
+        self._executors = OffloadExecutors(settings.BLOCKING_POOL_MAX_WORKERS, settings.CPU_POOL_MAX_WORKERS)
         self._async_worker: Optional[AsyncWorker] = None
         self._callback_executor: Optional[CallbackExecutor] = None
+        self._catalog_index: Optional[CatalogIndex] = None
         self._current_company_id: Optional[uuid.UUID] = None
         self._current_outlet_id: Optional[uuid.UUID] = None
         self._current_user_id: Optional[uuid.UUID] = None
+        self._ready = False
+        self.startup_timings: Dict[str, float] = {} # Phase name -> milliseconds.
 
     def initialize(self) -> None:
         """
         Synchronously initializes the application core, including starting the
-        background async worker and running async initialization tasks on it.
+        background async workers and running async initialization tasks on them.
+        Blocks until every lane is connected; see initialize_async for the staged variant.
         """
         try:
-            self._async_worker_thread = AsyncWorkerThread()
-            self._async_worker_thread.start_and_wait()
-            if not self._async_worker_thread.worker:
-                raise AsyncBridgeError("AsyncWorker not initialized within the thread.")
-            self._async_worker = self._async_worker_thread.worker
-
-            # Create and connect the callback executor to safely handle calls from the worker thread.
-            self._callback_executor = CallbackExecutor()
-            # Assumes the worker has a signal named 'callback_ready'.
-            self._async_worker.callback_ready.connect(self._callback_executor.execute)
-
-            self.async_worker.run_task_and_wait(self._initialize_async_components())
-
-            if not self.settings.CURRENT_COMPANY_ID or not self.settings.CURRENT_OUTLET_ID or not self.settings.CURRENT_USER_ID:
-                 raise ConfigurationError("Required IDs (Company, Outlet, User) are not set in the configuration.")
+            self.start_workers()
+            self._load_current_ids()
+
+            # Every lane gets its own engine, bound to that lane's event loop.
+            started = time.perf_counter()
+            for lane, worker in self._async_worker_pool.workers.items():
+                worker.run_task_and_wait(self._initialize_async_components(lane))
+            self.record_startup_phase("database", started)
+
+            if self.settings.DB_WARMUP_ENABLED:
+                started = time.perf_counter()
+                self._async_worker.run_task_and_wait(self._warm_up())
+                self.record_startup_phase("warm_up", started)
+            self._ready = True
+        except Exception as e:
+            if self._async_worker_pool and self._async_worker_pool.is_running():
+                self.shutdown()
+            raise CoreException(f"ApplicationCore initialization failed: {e}") from e
 
-            self._current_company_id = uuid.UUID(self.settings.CURRENT_COMPANY_ID)
-            self._current_outlet_id = uuid.UUID(self.settings.CURRENT_OUTLET_ID)
-            self._current_user_id = uuid.UUID(self.settings.CURRENT_USER_ID)
+    def initialize_async(self, on_finished: Callable[[Optional[Exception]], None]) -> None:
+        """
+        Staged initialization: starts the async workers, then connects every lane to the
+        database (in parallel) and warms up in the background, so the caller can build the
+        UI meanwhile. `on_finished(error)` is called on the main thread once the core is
+        ready (error is None) or has failed to connect (error is a CoreException).
+        Configuration errors are raised immediately as CoreException.
+        """
+        try:
+            self.start_workers()
+            self._load_current_ids()
         except Exception as e:
-            if self._async_worker_thread and self._async_worker_thread.isRunning():
+            if self._async_worker_pool and self._async_worker_pool.is_running():
                 self.shutdown()
             raise CoreException(f"ApplicationCore initialization failed: {e}") from e
 
-    async def _initialize_async_components(self):
-        """Contains the async part of the initialization, run on the worker thread."""
+        started = time.perf_counter()
+        pending_lanes = set(self._async_worker_pool.workers)
+        errors = []
+
+        def _on_warmed_up(warm_up_started: float, result: Any, error: Optional[Exception]):
+            self.record_startup_phase("warm_up", warm_up_started)
+            self._ready = True
+            on_finished(None)
+
+        def _on_lane_connected(lane: str, result: Any, error: Optional[Exception]):
+            pending_lanes.discard(lane)
+            if error:
+                errors.append(error)
+            if pending_lanes:
+                return
+            self.record_startup_phase("database", started)
+            if errors:
+                on_finished(CoreException(f"ApplicationCore initialization failed: {errors[0]}"))
+            elif self.settings.DB_WARMUP_ENABLED:
+                self._async_worker.run_task(self._warm_up(), functools.partial(_on_warmed_up, time.perf_counter()), priority=TaskPriority.CRITICAL)
+            else:
+                self._ready = True
+                on_finished(None)
+
+        for lane, worker in self._async_worker_pool.workers.items():
+            worker.run_task(
+                self._initialize_async_components(lane), functools.partial(_on_lane_connected, lane),
+                priority=TaskPriority.CRITICAL,
+            )
+
+    def start_workers(self) -> None:
+        """Starts the async worker lanes and the callback executor. Does not touch the database."""
+        started = time.perf_counter()
+        concurrency_limits = {
+            TaskPriority.INTERACTIVE: self.settings.ASYNC_MAX_CONCURRENT_INTERACTIVE,
+            TaskPriority.BACKGROUND: self.settings.ASYNC_MAX_CONCURRENT_BACKGROUND,
+        }
+        self._async_worker_pool = AsyncWorkerPool(
+            self.settings.ASYNC_WORKER_LANES, concurrency_limits, self._executors,
+            metrics_log_interval=self.settings.ASYNC_METRICS_LOG_INTERVAL_SECONDS,
+            admission={
+                "max_queued_tasks": self.settings.ASYNC_MAX_QUEUED_TASKS,
+                "backpressure_policy": BackpressurePolicy(self.settings.ASYNC_BACKPRESSURE_POLICY),
+                "block_timeout": self.settings.ASYNC_BLOCK_TIMEOUT_SECONDS,
+            },
+            default_timeouts={
+                TaskPriority.INTERACTIVE: self.settings.ASYNC_TIMEOUT_INTERACTIVE_SECONDS,
+                TaskPriority.BACKGROUND: self.settings.ASYNC_TIMEOUT_BACKGROUND_SECONDS,
+            },
+        )
+        self._async_worker_pool.start_and_wait()
+        self._async_worker = self._async_worker_pool.worker(TaskLane.INTERACTIVE)
+
+        # Create and connect the callback executor to safely handle calls from the worker threads.
+        self._callback_executor = CallbackExecutor()
+        for worker in self._async_worker_pool.workers.values():
+            worker.callbacks_ready.connect(self._callback_executor.execute_batch)
+        self.record_startup_phase("workers", started)
+
+    def _load_current_ids(self) -> None:
+        if not self.settings.CURRENT_COMPANY_ID or not self.settings.CURRENT_OUTLET_ID or not self.settings.CURRENT_USER_ID:
+             raise ConfigurationError("Required IDs (Company, Outlet, User) are not set in the configuration.")
+
+        self._current_company_id = uuid.UUID(self.settings.CURRENT_COMPANY_ID)
+        self._current_outlet_id = uuid.UUID(self.settings.CURRENT_OUTLET_ID)
+        self._current_user_id = uuid.UUID(self.settings.CURRENT_USER_ID)
+
+    @property
+    def is_ready(self) -> bool:
+        """True once every lane is connected to the database and the warm-up has run."""
+        return self._ready
+
+    def record_startup_phase(self, phase: str, started: float) -> None:
+        """Records how long a startup phase took, given its time.perf_counter() start."""
+        self.startup_timings[phase] = round((time.perf_counter() - started) * 1000, 1)
+
+    async def _initialize_async_components(self, lane: str = TaskLane.INTERACTIVE):
+        """Contains the async part of the initialization, run on the given lane's worker thread."""
         try:
-            self._engine = create_async_engine(self.settings.DATABASE_URL, echo=self.settings.DEBUG)
-            async with self._engine.connect() as conn:
+            started = time.perf_counter()
+            engine = build_engine(self.settings)
+            self.record_startup_phase(f"engine_creation.{lane}", started)
+            started = time.perf_counter()
+            async with engine.connect() as conn:
                 await conn.execute(sa.text("SELECT 1"))
-            self._session_factory = async_sessionmaker(self._engine, class_=AsyncSession, expire_on_commit=False)
+            self.record_startup_phase(f"first_query.{lane}", started)
+            session_factory = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
         except Exception as e:
             raise DatabaseConnectionError(f"Failed to connect to database: {e}")
 
+        self._lane_engines[lane] = engine
+        self._lane_session_factories[asyncio.get_running_loop()] = session_factory
+        self._lane_pool_metrics[asyncio.get_running_loop()] = PoolMetrics(engine, lane, self.settings.DB_POOL_SLOW_CHECKOUT_MS)
+        if lane == TaskLane.INTERACTIVE:
+            self._engine = engine
+            self._session_factory = session_factory
+
+        # The replica is optional and may be down at startup; ReplicaRouter falls back to the primary.
+        if self.settings.DATABASE_REPLICA_URL:
+            replica_engine = build_engine(self.settings, self.settings.DATABASE_REPLICA_URL)
+            self._lane_replica_routers[asyncio.get_running_loop()] = ReplicaRouter(
+                replica_engine, async_sessionmaker(replica_engine, class_=AsyncSession, expire_on_commit=False), lane,
+                max_lag_seconds=self.settings.DB_REPLICA_MAX_LAG_SECONDS,
+                retry_seconds=self.settings.DB_REPLICA_RETRY_SECONDS,
+                slow_checkout_ms=self.settings.DB_POOL_SLOW_CHECKOUT_MS,
+            )
+
+    async def _warm_up(self) -> None:
+        """Primes the interactive lane's pool, statement caches and reference data before the first sale."""
+        connections = min(self.settings.DB_WARMUP_CONNECTIONS, self.settings.DB_POOL_SIZE)
+        try:
+            timings = await warm_up(self, self._lane_engines[TaskLane.INTERACTIVE], connections)
+        except Exception as e:
+            logger.warning("Database warm-up failed, continuing without it: %s", e)
+            return
+        logger.info(
+            "Database warm-up finished in %.0f ms (connections %.0f ms, hot statements %.0f ms, reference data %.0f ms)",
+            timings["total_ms"], timings["connections_ms"], timings["statements_ms"], timings["reference_data_ms"],
+        )
+
+    async def _dispose_lane_engines(self, lane: str) -> None:
+        """Disposes a lane's primary engine and, if configured, its replica engine."""
+        await self._lane_engines[lane].dispose()
+        replica = self._lane_replica_routers.get(asyncio.get_running_loop())
+        if replica:
+            await replica.engine.dispose()
+
+    def start_catalog_index(self) -> None:
+        """
+        Loads the POS catalog index on the maintenance lane and keeps refreshing it every
+        CATALOG_INDEX_REFRESH_SECONDS until shutdown. Call once the core is ready.
+        """
+        if not self.settings.CATALOG_INDEX_ENABLED:
+            return
+        if not (self._async_worker_pool and self._async_worker_pool.is_running()):
+            return # Shut down since the refresh was scheduled.
+        self.get_async_worker(TaskLane.MAINTENANCE).run_task(
+            self.catalog_index.refresh(), self._on_catalog_index_refreshed, priority=TaskPriority.BACKGROUND,
+        )
+
+    def _on_catalog_index_refreshed(self, result: Any, error: Optional[Exception]) -> None:
+        if error or isinstance(result, Failure):
+            logger.warning("Catalog index refresh failed: %s", error or result.error)
+        else:
+            logger.debug("Catalog index refreshed: %d rows in %.1f ms", result.value, self.catalog_index.last_refresh_ms)
+        QTimer.singleShot(int(self.settings.CATALOG_INDEX_REFRESH_SECONDS * 1000), self.start_catalog_index)
+
     def shutdown(self) -> None:
         """Synchronously shuts down all core resources."""
-        if self._async_worker_thread and self._async_worker_thread.isRunning():
-            final_coro = self._engine.dispose() if self._engine else None
-            self._async_worker_thread.stop_and_wait(final_coro)
+        for table, stats in self.entity_cache_stats().items():
+            logger.info("Entity cache %s: %d hits, %d misses (%.0f%% hit rate)", table, stats["hits"], stats["misses"], stats["hit_rate"] * 100)
+        if self._catalog_index is not None:
+            stats = self._catalog_index.stats()
+            logger.info("Catalog index: %d products, %d hits, %d misses (%.0f%% hit rate)", stats["products"], stats["hits"], stats["misses"], stats["hit_rate"] * 100)
+        if self._async_worker_pool and self._async_worker_pool.is_running():
+            final_coros = {lane: self._dispose_lane_engines(lane) for lane in self._lane_engines}
+            self._async_worker_pool.stop_and_wait(final_coros)
+            self._lane_engines.clear()
+            self._lane_session_factories.clear()
+            self._lane_pool_metrics.clear()
+            self._lane_replica_routers.clear()
+        self._executors.shutdown(wait=False)
 
     @asynccontextmanager
-    async def get_session(self) -> AsyncIterator[AsyncSession]:
-        if not self._session_factory: raise CoreException("Database not initialized.")
-        session: AsyncSession = self._session_factory()
+    async def get_session(self, readonly: bool = False) -> AsyncIterator[AsyncSession]:
+        """
+        Provides a transactional session on the calling lane's engine. With readonly=True the
+        session is routed to the read replica when one is configured, reachable and within the
+        lag limit; otherwise it falls back to the primary. Never write through a readonly session.
+
+        Inside unit_of_work() the ambient session is returned instead (reads included, so they
+        see the unit's own uncommitted writes); the unit of work commits or rolls it back.
+        """
+        ambient = _ambient_session.get()
+        if ambient is not None:
+            yield ambient
+            return
+
+        loop = asyncio.get_running_loop()
+        replica = self._lane_replica_routers.get(loop) if readonly else None
+        session: Optional[AsyncSession] = await replica.open_session() if replica else None
+        on_replica = session is not None
+        if not on_replica:
+            session_factory = self._lane_session_factories.get(loop, self._session_factory)
+            if not session_factory: raise CoreException("Database not initialized.")
+            session = session_factory()
         try:
+            pool_metrics = None if on_replica else self._lane_pool_metrics.get(loop)
+            if pool_metrics:
+                # Check the connection out up front so the time spent waiting on the pool is measured.
+                started = time.perf_counter()
+                await session.connection()
+                pool_metrics.record_checkout_wait(time.perf_counter() - started)
+            await self._apply_task_deadline(session)
             yield session
             await session.commit()
         except Exception:
@@ -127,11 +380,96 @@ class ApplicationCore:
         finally:
             await session.close()
             
+    @asynccontextmanager
+    async def unit_of_work(self, readonly: bool = False) -> AsyncIterator[AsyncSession]:
+        """
+        Opens one session (one connection checkout, one transaction) shared by every
+        get_session() call, and therefore every service call, made inside the block.
+        It commits when the outermost block exits and rolls back if it raises or a flush
+        inside it failed (a service returned the error as a Failure); nested
+        blocks simply join the outer unit. A readonly unit may be served by the replica
+        and must not write. Do not run queries concurrently (e.g. with asyncio.gather)
+        inside a unit of work: an AsyncSession is not safe for that.
+        """
+        ambient = _ambient_session.get()
+        if ambient is not None:
+            yield ambient
+            return
+
+        async with self.get_session(readonly=readonly) as session:
+            token = _ambient_session.set(session)
+            try:
+                yield session
+            finally:
+                _ambient_session.reset(token)
+            transaction = session.sync_session.get_transaction()
+            if transaction is not None and not transaction.is_active:
+                # A flush failed inside the block (e.g. a unique violation a service turned into a
+                # Failure) and the block returned normally. Committing would raise PendingRollbackError.
+                await session.rollback()
+
+    async def _apply_task_deadline(self, session: AsyncSession) -> None:
+        """
+        Bounds the transaction by the calling task's deadline (see AsyncWorker.run_task).
+        On PostgreSQL the remaining time becomes the transaction's statement_timeout and
+        lock_timeout, so a hung query or a blocked SELECT ... FOR UPDATE is cancelled by
+        the server instead of pinning a connection after the task has given up.
+        """
+        remaining = remaining_task_time()
+        if remaining is None:
+            return
+        if remaining <= 0:
+            raise TaskTimeoutError("Task deadline passed before the database session was opened.")
+        if session.bind.dialect.name == "postgresql":
+            # One round trip; set_config(..., true) is SET LOCAL with a bound value.
+            await session.execute(_SET_TASK_TIMEOUTS, {"ms": str(max(1, int(remaining * 1000)))})
+
+    async def run_blocking(self, func: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+        """Runs blocking I/O on the shared thread pool so the calling event loop never stalls."""
+        return await self._executors.run_blocking(func, *args, **kwargs)
+
+    async def run_cpu(self, func: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+        """Runs a picklable, module-level CPU-bound function on the shared process pool."""
+        return await self._executors.run_cpu(func, *args, **kwargs)
+
+    @property
+    def ambient_session(self) -> Optional[AsyncSession]:
+        """The session of the unit_of_work() the calling task is inside, if any."""
+        return _ambient_session.get()
+
+    def entity_cache_stats(self) -> Dict[str, Dict[str, Any]]:
+        """Returns the hit/miss counters of each service's entity cache, keyed by table name."""
+        return {
+            service.model.__tablename__: service.entity_cache.stats()
+            for service in list(self._services.values()) if getattr(service, "entity_cache", None)
+        }
+
+    def pool_stats(self) -> Dict[str, Dict[str, Any]]:
+        """Returns each lane's connection pool occupancy and checkout wait statistics."""
+        stats = {metrics.name: metrics.snapshot() for metrics in self._lane_pool_metrics.values()}
+        stats.update({router.pool_metrics.name: router.pool_metrics.snapshot() for router in self._lane_replica_routers.values()})
+        return stats
+
     @property
     def async_worker(self) -> AsyncWorker:
+        """The interactive lane's worker, used for everything a cashier waits on."""
         if self._async_worker is None: raise CoreException("Async worker not initialized.")
         return self._async_worker
 
+    @property
+    def callback_executor(self) -> CallbackExecutor:
+        if self._callback_executor is None: raise CoreException("Callback executor not initialized.")
+        return self._callback_executor
+
+    @property
+    def async_worker_pool(self) -> AsyncWorkerPool:
+        if self._async_worker_pool is None: raise CoreException("Async worker pool not initialized.")
+        return self._async_worker_pool
+
+    def get_async_worker(self, lane: str = TaskLane.INTERACTIVE) -> AsyncWorker:
+        """Returns the worker for a lane (see TaskLane); unconfigured lanes fall back to interactive."""
+        return self.async_worker_pool.worker(lane)
+
     @property
     def current_company_id(self) -> uuid.UUID:
         if self._current_company_id is None: raise CoreException("Current company ID is not set.")
@@ -147,6 +485,17 @@ class ApplicationCore:
         if self._current_user_id is None: raise CoreException("Current user ID is not set.")
         return self._current_user_id
 
+    @property
+    def catalog_index(self) -> "CatalogIndex":
+        """The current company's in-memory barcode/SKU index; empty until start_catalog_index has loaded it."""
+        if self._catalog_index is None:
+            from app.core.catalog_index import CatalogIndex
+            from app.services.product_service import CATALOG_FIELDS
+            self._catalog_index = CatalogIndex(
+                lambda since: self.product_service.get_catalog_rows(self.current_company_id, since), CATALOG_FIELDS,
+            )
+        return self._catalog_index
+
     # --- Service Properties (lazy-loaded) ---
     @property
     def company_service(self) -> "CompanyService":
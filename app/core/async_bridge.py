@@ -4,30 +4,179 @@ Provides a robust, thread-safe bridge between the PySide6 (Qt) event loop
 and the asyncio event loop. This prevents UI freezes during I/O-bound operations.
 """
 import asyncio
+import contextvars
 import threading
-from typing import Coroutine, Any, Callable, Optional
+from collections import deque
+from enum import Enum, IntEnum
+from typing import Coroutine, Any, Callable, Optional, Dict, Iterable, List, Hashable
 import inspect
 import sys
-from concurrent.futures import Future
+import functools
+import logging
+import multiprocessing
+import time
+from concurrent.futures import Future, ThreadPoolExecutor, ProcessPoolExecutor
 
 from PySide6.QtCore import QObject, QThread, Signal, Slot
 from PySide6.QtWidgets import QApplication
 
-from app.core.exceptions import AsyncBridgeError
+from app.core.exceptions import AsyncBridgeError, TaskRejectedError, TaskTimeoutError
+from app.core.task_metrics import TaskMetrics
+
+logger = logging.getLogger(__name__)
+
+# The running task's deadline, in its event loop's clock (loop.time()). ApplicationCore.get_session
+# reads it to bound each transaction's statement and lock waits on the database server.
+task_deadline: contextvars.ContextVar[Optional[float]] = contextvars.ContextVar("task_deadline", default=None)
+
+def remaining_task_time() -> Optional[float]:
+    """Seconds left before the current task's deadline, or None if it has none. Call from a running loop."""
+    deadline = task_deadline.get()
+    if deadline is None:
+        return None
+    return deadline - asyncio.get_running_loop().time()
+
+class TaskLane:
+    """
+    Names of the worker lanes coroutines are routed to. Each lane owns its own
+    event loop (and its own database engine), so slow back-office work on one
+    lane never holds up callbacks on another.
+    """
+    INTERACTIVE = "interactive" # Checkout, lookups and anything a cashier waits on.
+    BACKGROUND = "background"   # Reports, dashboards and exports.
+    MAINTENANCE = "maintenance" # Housekeeping such as cache refreshes.
+    ALL = (INTERACTIVE, BACKGROUND, MAINTENANCE)
+
+class TaskPriority(IntEnum):
+    """
+    Scheduling classes for AsyncWorker.run_task. Lower values are started first;
+    CRITICAL tasks are never throttled by a concurrency limit.
+    """
+    CRITICAL = 0    # Tenders and anything that must complete a sale.
+    INTERACTIVE = 1 # Lookups and screens the user is waiting on.
+    BACKGROUND = 2  # Reports, KPIs and other work nobody is blocked on.
+
+class BackpressurePolicy(str, Enum):
+    """What an AsyncWorker does with a new task once its admission queue is full."""
+    REJECT = "reject"           # Refuse the new task.
+    DROP_OLDEST = "drop_oldest" # Drop the oldest queued task with the same run_latest key, else refuse.
+    BLOCK = "block"             # Make the submitting thread wait for room, up to a timeout, else refuse.
+
+class OffloadExecutors:
+    """
+    Thread and process pools, shared by every lane, for work that must not run on an
+    event loop: blocking I/O and C calls go to the thread pool, pure-Python CPU-bound
+    work goes to the process pool. Both pools are created on first use.
+    """
+    def __init__(self, max_blocking_workers: int = 4, max_cpu_workers: int = 2):
+        self._max_blocking_workers = max_blocking_workers
+        self._max_cpu_workers = max_cpu_workers
+        self._thread_pool: Optional[ThreadPoolExecutor] = None
+        self._process_pool: Optional[ProcessPoolExecutor] = None
+        self._lock = threading.Lock()
+
+    @property
+    def thread_pool(self) -> ThreadPoolExecutor:
+        with self._lock:
+            if self._thread_pool is None:
+                self._thread_pool = ThreadPoolExecutor(max_workers=self._max_blocking_workers, thread_name_prefix="sgpos-blocking")
+            return self._thread_pool
+
+    @property
+    def process_pool(self) -> ProcessPoolExecutor:
+        with self._lock:
+            if self._process_pool is None:
+                # 'spawn' avoids forking a process that is running Qt and several event loop threads.
+                self._process_pool = ProcessPoolExecutor(max_workers=self._max_cpu_workers, mp_context=multiprocessing.get_context("spawn"))
+            return self._process_pool
+
+    async def run_blocking(self, func: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+        """Runs a blocking callable on the thread pool without stalling the running loop."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self.thread_pool, functools.partial(func, *args, **kwargs))
+
+    async def run_cpu(self, func: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+        """
+        Runs a CPU-bound callable on the process pool. The callable must be a module-level
+        function, and its arguments and return value must be picklable.
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self.process_pool, functools.partial(func, *args, **kwargs))
+
+    def shutdown(self, wait: bool = True):
+        with self._lock:
+            for pool in (self._thread_pool, self._process_pool):
+                if pool is not None:
+                    pool.shutdown(wait=wait, cancel_futures=True)
+            self._thread_pool = None
+            self._process_pool = None
+
+class _QueuedTask:
+    """A coroutine waiting to be started by an AsyncWorker."""
+    __slots__ = ("coro", "callback", "priority", "key", "generation", "task", "name", "enqueued_at", "started_at", "timeout", "holds_admission")
+
+    def __init__(self, coro: Coroutine, callback: Optional[Callable], priority: TaskPriority, key: Optional[Hashable] = None, generation: int = 0, timeout: Optional[float] = None):
+        self.coro = coro
+        self.callback = callback
+        self.priority = priority
+        self.key = key
+        self.generation = generation
+        self.task: Optional[asyncio.Task] = None
+        self.name: str = getattr(coro, "__qualname__", type(coro).__name__)
+        self.enqueued_at = time.perf_counter()
+        self.started_at = 0.0
+        self.timeout = timeout
+        self.holds_admission = True # Until the task finishes, is dropped, or hands its slot to its successor.
 
 class AsyncWorker(QObject):
     """
     An object that lives in a QThread and runs an asyncio event loop.
     It accepts coroutines for execution and signals results back to the main thread.
     """
-    # FIX: A new signal specifically to carry the callback and its results
-    # This is the key to safe, cross-thread callback invocation.
-    callback_ready = Signal(object, object, object)
+    # Emitted (carrying the worker itself) when completed callbacks are waiting to be
+    # run on the main thread. It fires once per batch: results that complete before the
+    # main thread drains the queue ride along with the pending signal instead of each
+    # posting their own event, which keeps bursts from flooding the Qt event queue.
+    callbacks_ready = Signal(object)
+    # Emitted with (lane name, saturated) when the admission queue fills up, and again
+    # once it has drained to a quarter below capacity, so views can show a busy state.
+    saturation_changed = Signal(str, bool)
 
-    def __init__(self, loop: asyncio.AbstractEventLoop, parent: Optional[QObject] = None):
+    def __init__(self, loop: asyncio.AbstractEventLoop, concurrency_limits: Optional[Dict[TaskPriority, int]] = None, executors: Optional[OffloadExecutors] = None, name: str = TaskLane.INTERACTIVE, metrics_log_interval: float = 0,
+                 max_queued_tasks: int = 0, backpressure_policy: BackpressurePolicy = BackpressurePolicy.REJECT, block_timeout: float = 5.0,
+                 default_timeouts: Optional[Dict[TaskPriority, float]] = None, parent: Optional[QObject] = None):
         super().__init__(parent)
         self._loop = loop
+        self._executors = executors or OffloadExecutors()
+        self.name = name
+        self.metrics = TaskMetrics()
+        self._metrics_log_interval = metrics_log_interval
+        if metrics_log_interval > 0:
+            self._loop.call_later(metrics_log_interval, self._log_metrics)
         self._tasks = set()
+        # Limits of 0 (or missing) mean unlimited. CRITICAL is always unlimited.
+        self._concurrency_limits = {p: limit for p, limit in (concurrency_limits or {}).items() if p != TaskPriority.CRITICAL}
+        # Deadlines applied to tasks submitted without an explicit timeout (0 or missing = none).
+        self._default_timeouts = {p: t for p, t in (default_timeouts or {}).items() if t}
+        self._pending: Dict[TaskPriority, deque] = {p: deque() for p in TaskPriority}
+        self._pending_lock = threading.Lock()
+        self._running_counts: Dict[TaskPriority, int] = {p: 0 for p in TaskPriority}
+        # Admission control: queued plus running non-CRITICAL tasks may not exceed max_queued_tasks (0 = unbounded).
+        # A sale being finalized (CRITICAL) is always admitted.
+        self._max_queued_tasks = max_queued_tasks
+        self._backpressure_policy = BackpressurePolicy(backpressure_policy)
+        self._block_timeout = block_timeout
+        self._admitted_count = 0
+        self._saturated = False
+        self._capacity_available = threading.Condition(self._pending_lock)
+        self._loop_thread_id = threading.get_ident()
+        # Keyed (supersede-and-cancel) tasks: latest generation per key, and the task running for it.
+        self._key_generations: Dict[Hashable, int] = {}
+        self._keyed_tasks: Dict[Hashable, _QueuedTask] = {}
+        # Completed (callback, result, error, posted_at, task name) entries waiting for the main thread.
+        self._completed: deque = deque()
+        self._completed_lock = threading.Lock()
+        self._drain_scheduled = False
 
     def stop(self, final_coro: Optional[Coroutine] = None):
         """Gracefully stops the asyncio event loop, optionally running one final coroutine."""
@@ -39,6 +188,16 @@ class AsyncWorker(QObject):
                     except Exception as e:
                         print(f"Error during final shutdown coroutine: {e}", file=sys.stderr)
                 
+                with self._pending_lock:
+                    pending = [item for queue in self._pending.values() for item in queue]
+                    for queue in self._pending.values():
+                        queue.clear()
+                    for queued in pending:
+                        self._release_admission(queued)
+                for queued in pending:
+                    queued.coro.close()
+                    self.metrics.record_dropped(queued.name)
+
                 tasks = [task for task in self._tasks if not task.done()]
                 for task in tasks:
                     task.cancel()
@@ -47,18 +206,221 @@ class AsyncWorker(QObject):
 
             self._loop.call_soon_threadsafe(lambda: asyncio.create_task(_stop_coro()))
 
-    def run_task(self, coro: Coroutine[Any, Any, Any], on_done_callback: Optional[Callable] = None):
-        """Submits a fire-and-forget coroutine to be run on the event loop."""
+    def run_task(self, coro: Coroutine[Any, Any, Any], on_done_callback: Optional[Callable] = None, priority: TaskPriority = TaskPriority.INTERACTIVE, timeout: Optional[float] = None) -> bool:
+        """
+        Submits a fire-and-forget coroutine to be run on the event loop.
+        Tasks are started in priority order, subject to the per-class concurrency limits.
+        Returns False if the worker is saturated and the task was refused; its callback
+        then receives a TaskRejectedError.
+
+        `timeout` (seconds from submission, defaulting to the priority's default) is the
+        task's deadline: it bounds database statement and lock waits inside the task and,
+        once passed, cancels the task and delivers a TaskTimeoutError to its callback.
+        """
         if not inspect.iscoroutine(coro):
             raise TypeError("Input must be a coroutine.")
-        
-        def _task_wrapper():
-            task = self._loop.create_task(coro)
-            self._tasks.add(task)
-            task.add_done_callback(lambda fut: self._on_task_completed(fut, on_done_callback))
-            task.add_done_callback(lambda fut: self._tasks.discard(fut))
 
-        self._loop.call_soon_threadsafe(_task_wrapper)
+        priority = TaskPriority(priority)
+        return self._enqueue(_QueuedTask(coro, on_done_callback, priority, timeout=self._resolve_timeout(priority, timeout)))
+
+    def run_latest(self, key: Hashable, coro: Coroutine[Any, Any, Any], on_done_callback: Optional[Callable] = None, priority: TaskPriority = TaskPriority.INTERACTIVE, timeout: Optional[float] = None) -> bool:
+        """
+        Submits a coroutine that supersedes any earlier task submitted with the same key.
+        The earlier task is dropped if still queued or cancelled if running (which also
+        cancels its in-flight database statement), and its callback is never invoked.
+        Use this for typeahead searches and other "only the latest result matters" loads.
+        """
+        if not inspect.iscoroutine(coro):
+            raise TypeError("Input must be a coroutine.")
+
+        with self._pending_lock:
+            generation = self._key_generations.get(key, 0) + 1
+            self._key_generations[key] = generation
+            superseded_running = self._keyed_tasks.get(key)
+            for queue in self._pending.values():
+                superseded = [queued for queued in queue if queued.key == key]
+                for queued in superseded:
+                    queue.remove(queued)
+                    self._release_admission(queued)
+                    queued.coro.close()
+                    self.metrics.record_dropped(queued.name)
+        self._loop.call_soon_threadsafe(self._cancel_superseded_task, key, generation)
+        priority = TaskPriority(priority)
+        return self._enqueue(_QueuedTask(coro, on_done_callback, priority, key, generation, self._resolve_timeout(priority, timeout)), superseded_running)
+
+    def _resolve_timeout(self, priority: TaskPriority, timeout: Optional[float]) -> Optional[float]:
+        return timeout if timeout is not None else self._default_timeouts.get(priority)
+
+    def is_current(self, key: Hashable, generation: int) -> bool:
+        """Returns True if no newer task has been submitted for the key."""
+        return self._key_generations.get(key) == generation
+
+    @property
+    def is_saturated(self) -> bool:
+        return self._saturated
+
+    def _enqueue(self, queued: _QueuedTask, superseded_running: Optional[_QueuedTask] = None) -> bool:
+        dropped: Optional[_QueuedTask] = None
+        with self._pending_lock:
+            if not self._has_capacity(queued):
+                if self._backpressure_policy == BackpressurePolicy.DROP_OLDEST:
+                    dropped = self._drop_oldest_with_same_key(queued, superseded_running)
+                elif self._backpressure_policy == BackpressurePolicy.BLOCK and threading.get_ident() != self._loop_thread_id:
+                    # Never block the loop thread itself: nothing could free a slot while it waits.
+                    self._capacity_available.wait_for(lambda: self._has_capacity(queued), self._block_timeout)
+            admitted = self._has_capacity(queued)
+            if admitted:
+                self._pending[queued.priority].append(queued)
+                if queued.priority != TaskPriority.CRITICAL:
+                    self._admitted_count += 1
+            saturation_change = self._check_saturation()
+
+        if dropped is not None:
+            self._reject(dropped, "Task dropped: superseded by a newer request while the worker was saturated.")
+        if admitted:
+            self._loop.call_soon_threadsafe(self._start_pending_tasks)
+        else:
+            self._reject(queued, f"Task rejected: the '{self.name}' worker is saturated ({self._max_queued_tasks} tasks in flight).")
+        if saturation_change is not None:
+            self.saturation_changed.emit(self.name, saturation_change)
+        return admitted
+
+    def _has_capacity(self, queued: _QueuedTask) -> bool:
+        return queued.priority == TaskPriority.CRITICAL or not self._max_queued_tasks or self._admitted_count < self._max_queued_tasks
+
+    def _drop_oldest_with_same_key(self, queued: _QueuedTask, superseded_running: Optional[_QueuedTask]) -> Optional[_QueuedTask]:
+        """
+        Makes room for a run_latest task by dropping the oldest queued task with the same key, or
+        else by taking over the slot of the same-key task it superseded, which is still running
+        while its cancellation lands. Returns the dropped queued task, if any. Unkeyed tasks (e.g.
+        writes for different records) are never interchangeable: nothing is dropped for them and
+        the new task is rejected. Called under the lock.
+        """
+        if queued.key is None:
+            return None
+        for priority in reversed(TaskPriority):
+            for candidate in self._pending[priority]:
+                if candidate.key == queued.key:
+                    self._pending[priority].remove(candidate)
+                    self._release_admission(candidate)
+                    return candidate
+        if superseded_running is not None and superseded_running.generation < queued.generation:
+            self._release_admission(superseded_running) # Its result is already discarded.
+        return None
+
+    def _release_admission(self, queued: _QueuedTask):
+        """Frees the admission slot held by a task, at most once. Called under the lock."""
+        if not queued.holds_admission:
+            return
+        queued.holds_admission = False
+        if queued.priority != TaskPriority.CRITICAL:
+            self._admitted_count -= 1
+            self._capacity_available.notify()
+
+    def _check_saturation(self) -> Optional[bool]:
+        """Updates the saturated flag with hysteresis; returns the new state if it changed. Called under the lock."""
+        if not self._max_queued_tasks:
+            return None
+        if not self._saturated and self._admitted_count >= self._max_queued_tasks:
+            self._saturated = True
+            return True
+        if self._saturated and self._admitted_count <= self._max_queued_tasks * 3 // 4:
+            self._saturated = False
+            return False
+        return None
+
+    def _reject(self, queued: _QueuedTask, message: str):
+        queued.coro.close()
+        self.metrics.record_dropped(queued.name)
+        if queued.callback:
+            self._post_callback(queued.callback, None, TaskRejectedError(message), queued.name)
+
+    def _cancel_superseded_task(self, key: Hashable, generation: int):
+        """Cancels the running task for a key if it is older than the given generation."""
+        running = self._keyed_tasks.get(key)
+        if running and running.generation < generation:
+            del self._keyed_tasks[key]
+            running.task.cancel()
+
+    def _start_pending_tasks(self):
+        """Starts queued tasks, highest priority first, until each class reaches its limit. Runs on the loop thread."""
+        for priority in TaskPriority:
+            limit = self._concurrency_limits.get(priority) or 0
+            while True:
+                if limit and self._running_counts[priority] >= limit:
+                    break
+                with self._pending_lock:
+                    if not self._pending[priority]:
+                        break
+                    queued = self._pending[priority].popleft()
+                self._start_task(queued)
+
+    def _start_task(self, queued: _QueuedTask):
+        queued.started_at = time.perf_counter()
+        self.metrics.record_started(queued.name, queued.started_at - queued.enqueued_at)
+        coro = queued.coro
+        if queued.timeout is not None:
+            # The deadline counts from submission, so time spent queued uses up the budget.
+            deadline = self._loop.time() + queued.timeout - (queued.started_at - queued.enqueued_at)
+            coro = self._run_with_deadline(queued.coro, queued.name, deadline)
+        task = self._loop.create_task(coro)
+        self._tasks.add(task)
+        self._running_counts[queued.priority] += 1
+        on_done_callback = queued.callback
+        if queued.key is not None:
+            queued.task = task
+            self._cancel_superseded_task(queued.key, queued.generation)
+            self._keyed_tasks[queued.key] = queued
+            on_done_callback = self._latest_only(queued.key, queued.generation, on_done_callback)
+        task.add_done_callback(lambda fut: self._on_task_completed(fut, on_done_callback, queued))
+        task.add_done_callback(lambda fut: self._on_task_finished(fut, queued))
+
+    async def _run_with_deadline(self, coro: Coroutine, name: str, deadline: float) -> Any:
+        """Runs a task's coroutine under its deadline, publishing the deadline to get_session."""
+        if deadline <= self._loop.time():
+            coro.close()
+            raise TaskTimeoutError(f"Task '{name}' expired before it could start.")
+        task_deadline.set(deadline)
+        timeout = asyncio.timeout_at(deadline)
+        try:
+            async with timeout:
+                return await coro
+        except TimeoutError:
+            if timeout.expired():
+                raise TaskTimeoutError(f"Task '{name}' exceeded its deadline.") from None
+            raise
+
+    def _latest_only(self, key: Hashable, generation: int, callback: Optional[Callable]) -> Optional[Callable]:
+        """Wraps a callback so it is skipped if the key was superseded before it reaches the main thread."""
+        if callback is None:
+            return None
+        def _callback(result: Any, error: Optional[Exception]):
+            if self.is_current(key, generation):
+                callback(result, error)
+        _callback.__name__ = getattr(callback, "__name__", "callback")
+        return _callback
+
+    def _on_task_finished(self, fut: asyncio.Future, queued: _QueuedTask):
+        cancelled = fut.cancelled()
+        self.metrics.record_finished(queued.name, time.perf_counter() - queued.started_at, failed=not cancelled and fut.exception() is not None, cancelled=cancelled)
+        with self._pending_lock:
+            self._release_admission(queued)
+            saturation_change = self._check_saturation()
+        if saturation_change is not None:
+            self.saturation_changed.emit(self.name, saturation_change)
+        self._tasks.discard(fut)
+        self._running_counts[queued.priority] -= 1
+        if queued.key is not None and self._keyed_tasks.get(queued.key) is queued:
+            del self._keyed_tasks[queued.key]
+        self._start_pending_tasks()
+
+    async def run_blocking(self, func: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+        """Awaitable: runs blocking I/O (file writes, C calls) on the shared thread pool."""
+        return await self._executors.run_blocking(func, *args, **kwargs)
+
+    async def run_cpu(self, func: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+        """Awaitable: runs a picklable, module-level CPU-bound function on the shared process pool."""
+        return await self._executors.run_cpu(func, *args, **kwargs)
 
     def run_task_and_wait(self, coro: Coroutine) -> Any:
         """Submits a coroutine and blocks until it returns a result."""
@@ -68,7 +430,10 @@ class AsyncWorker(QObject):
         future = asyncio.run_coroutine_threadsafe(coro, self._loop)
         return future.result()
 
-    def _on_task_completed(self, fut: asyncio.Future, on_done_callback: Optional[Callable]):
+    def _on_task_completed(self, fut: asyncio.Future, on_done_callback: Optional[Callable], queued: Optional[_QueuedTask] = None):
+        if queued and queued.key is not None and not self.is_current(queued.key, queued.generation):
+            return # Superseded by a newer task for the same key; its result is stale.
+
         result, error = None, None
         try:
             result = fut.result()
@@ -78,14 +443,48 @@ class AsyncWorker(QObject):
             error = e
         
         if on_done_callback:
-            # FIX: Emit a signal containing the callback and its arguments.
-            # This is thread-safe and lets the main thread execute the callback.
-            self.callback_ready.emit(on_done_callback, result, error)
+            self._post_callback(on_done_callback, result, error, queued.name if queued else None)
+
+    def _post_callback(self, callback: Callable, result: Any, error: Optional[Exception], name: Optional[str] = None):
+        """Queues a callback for the main thread, signalling only if no drain is already pending."""
+        with self._completed_lock:
+            self._completed.append((callback, result, error, time.perf_counter(), name))
+            if self._drain_scheduled:
+                return
+            self._drain_scheduled = True
+        self.callbacks_ready.emit(self)
+
+    def take_completed_callbacks(self) -> List[tuple]:
+        """Removes and returns every queued (callback, result, error). Called from the main thread."""
+        with self._completed_lock:
+            batch = list(self._completed)
+            self._completed.clear()
+            self._drain_scheduled = False
+        now = time.perf_counter()
+        for _, _, _, posted_at, name in batch:
+            if name:
+                self.metrics.record_callback_dispatched(name, now - posted_at)
+        return [(callback, result, error) for callback, result, error, _, _ in batch]
+
+    def _log_metrics(self):
+        """Periodically logs the slowest tasks on this lane. Runs on the loop thread."""
+        summary = self.metrics.format_summary()
+        if summary:
+            logger.info("async lane '%s': %s", self.name, summary)
+        self._loop.call_later(self._metrics_log_interval, self._log_metrics)
 
 class AsyncWorkerThread(QThread):
     """A QThread that manages an asyncio event loop and an AsyncWorker."""
-    def __init__(self, parent: Optional[QObject] = None):
+    def __init__(self, name: str = TaskLane.INTERACTIVE, concurrency_limits: Optional[Dict[TaskPriority, int]] = None, executors: Optional[OffloadExecutors] = None, metrics_log_interval: float = 0,
+                 admission: Optional[Dict[str, Any]] = None, default_timeouts: Optional[Dict[TaskPriority, float]] = None, parent: Optional[QObject] = None):
         super().__init__(parent)
+        self.name = name
+        self._concurrency_limits = concurrency_limits
+        self._executors = executors
+        self._metrics_log_interval = metrics_log_interval
+        self._admission = admission or {}
+        self._default_timeouts = default_timeouts
+        self.setObjectName(f"AsyncWorkerThread-{name}")
         self.loop: Optional[asyncio.AbstractEventLoop] = None
         self.worker: Optional[AsyncWorker] = None
         self._thread_started_event = threading.Event()
@@ -93,7 +492,7 @@ class AsyncWorkerThread(QThread):
     def run(self):
         self.loop = asyncio.new_event_loop()
         asyncio.set_event_loop(self.loop)
-        self.worker = AsyncWorker(self.loop)
+        self.worker = AsyncWorker(self.loop, self._concurrency_limits, self._executors, self.name, self._metrics_log_interval, **self._admission, default_timeouts=self._default_timeouts)
         # The worker's signals will be connected from the main thread after it starts.
         self._thread_started_event.set()
         self.loop.run_forever()
@@ -112,3 +511,66 @@ class AsyncWorkerThread(QThread):
         if not self.wait(5000):
             print("Warning: AsyncWorkerThread did not terminate gracefully.", file=sys.stderr)
             self.terminate()
+
+class AsyncWorkerPool:
+    """
+    Owns one AsyncWorkerThread per lane and routes coroutines to them.
+    Lanes that are not configured fall back to the interactive lane, so callers
+    can always name the lane that describes their work.
+    """
+    def __init__(self, lanes: Iterable[str] = TaskLane.ALL, concurrency_limits: Optional[Dict[TaskPriority, int]] = None, executors: Optional[OffloadExecutors] = None, metrics_log_interval: float = 0,
+                 admission: Optional[Dict[str, Any]] = None, default_timeouts: Optional[Dict[TaskPriority, float]] = None):
+        """
+        `admission` holds the AsyncWorker admission-control keyword arguments
+        (max_queued_tasks, backpressure_policy, block_timeout) applied to every lane.
+        `default_timeouts` gives each priority class its default task deadline.
+        """
+        lane_names = list(dict.fromkeys(lanes))
+        if TaskLane.INTERACTIVE not in lane_names:
+            lane_names.insert(0, TaskLane.INTERACTIVE)
+        self._owns_executors = executors is None
+        self.executors = executors or OffloadExecutors()
+        self._threads: Dict[str, AsyncWorkerThread] = {name: AsyncWorkerThread(name, concurrency_limits, self.executors, metrics_log_interval, admission, default_timeouts) for name in lane_names}
+
+    @property
+    def lanes(self) -> List[str]:
+        return list(self._threads.keys())
+
+    @property
+    def workers(self) -> Dict[str, AsyncWorker]:
+        """The running workers keyed by lane name."""
+        return {name: thread.worker for name, thread in self._threads.items() if thread.worker}
+
+    def start_and_wait(self):
+        for thread in self._threads.values():
+            thread.start_and_wait()
+            if not thread.worker:
+                raise AsyncBridgeError(f"AsyncWorker for lane '{thread.name}' not initialized within the thread.")
+
+    def stop_and_wait(self, final_coros: Optional[Dict[str, Coroutine]] = None):
+        """Stops every lane, running the lane's final coroutine (if any) on its own loop."""
+        final_coros = final_coros or {}
+        for name, thread in self._threads.items():
+            thread.stop_and_wait(final_coros.pop(name, None))
+        for coro in final_coros.values():
+            coro.close() # Never scheduled; close it to avoid a "never awaited" warning.
+        if self._owns_executors:
+            self.executors.shutdown()
+
+    def is_running(self) -> bool:
+        return any(thread.isRunning() for thread in self._threads.values())
+
+    def worker(self, lane: str = TaskLane.INTERACTIVE) -> AsyncWorker:
+        """Returns the worker for a lane, falling back to the interactive lane."""
+        thread = self._threads.get(lane) or self._threads[TaskLane.INTERACTIVE]
+        if not thread.worker:
+            raise AsyncBridgeError(f"AsyncWorker for lane '{thread.name}' is not running.")
+        return thread.worker
+
+    def metrics_snapshot(self) -> Dict[str, Dict[str, Dict]]:
+        """Returns each running lane's per-task counters and p50/p95/p99 latencies (ms)."""
+        return {name: worker.metrics.snapshot() for name, worker in self.workers.items()}
+
+    def run_task(self, coro: Coroutine[Any, Any, Any], on_done_callback: Optional[Callable] = None, lane: str = TaskLane.INTERACTIVE, priority: TaskPriority = TaskPriority.INTERACTIVE, timeout: Optional[float] = None) -> bool:
+        """Submits a fire-and-forget coroutine to the given lane. Returns False if the lane refused it."""
+        return self.worker(lane).run_task(coro, on_done_callback, priority, timeout)
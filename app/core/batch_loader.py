@@ -0,0 +1,71 @@
+# File: app/core/batch_loader.py
+"""
+DataLoader-style batching of lookups by key.
+
+Code that resolves ids one at a time (per item of a purchase order, per PO in a list)
+normally costs one query per id. A BatchLoader collects every load(key) made during the
+same event-loop tick - typically the branches of an asyncio.gather - and resolves them
+with a single fetch_many(keys) call, i.e. one IN (...) query.
+
+Batches are kept per event loop (each worker lane has its own) and per session, so loads
+bound to different sessions or transactions are never mixed. Because the loads of a batch
+become one query, gathering them over a shared session is safe; gathering other
+coroutines that use the same session concurrently is not.
+"""
+from __future__ import annotations
+import asyncio
+from typing import Any, Awaitable, Callable, Dict, Generic, Hashable, List, Optional, Set, Tuple, TypeVar
+
+from app.core.result import Result, Success, Failure
+
+K = TypeVar('K', bound=Hashable)
+V = TypeVar('V')
+
+class BatchLoader(Generic[K, V]):
+    """
+    Coalesces load(key, session) calls made in the same tick into one fetch_many(keys, session).
+    fetch_many returns a Result holding the records found; key_of maps a record to its key.
+    Keys with no record resolve to Success(None).
+    """
+
+    def __init__(self, fetch_many: Callable[[List[K], Any], Awaitable[Result[List[V], str]]], key_of: Callable[[V], K]):
+        self._fetch_many = fetch_many
+        self._key_of = key_of
+        self._batches: Dict[Tuple[asyncio.AbstractEventLoop, Any], Dict[K, List[asyncio.Future]]] = {}
+        self._dispatches: Set[asyncio.Task] = set()
+
+    async def load(self, key: K, session: Any = None) -> Result[Optional[V], str]:
+        loop = asyncio.get_running_loop()
+        batch_key = (loop, session)
+        batch = self._batches.get(batch_key)
+        if batch is None:
+            batch = self._batches[batch_key] = {}
+            # Runs after every coroutine already scheduled for this tick has had a chance to add its key.
+            loop.call_soon(self._dispatch, batch_key)
+        future = loop.create_future()
+        batch.setdefault(key, []).append(future)
+        return await future
+
+    async def load_many(self, keys: List[K], session: Any = None) -> Result[List[Optional[V]], str]:
+        """Loads several keys in one batch; the values are in key order (None where not found)."""
+        results = await asyncio.gather(*(self.load(key, session) for key in keys))
+        failure = next((r for r in results if isinstance(r, Failure)), None)
+        return failure or Success([r.value for r in results])
+
+    def _dispatch(self, batch_key: Tuple[asyncio.AbstractEventLoop, Any]) -> None:
+        batch = self._batches.pop(batch_key)
+        task = batch_key[0].create_task(self._resolve(batch, batch_key[1]))
+        self._dispatches.add(task)
+        task.add_done_callback(self._dispatches.discard)
+
+    async def _resolve(self, batch: Dict[K, List[asyncio.Future]], session: Any) -> None:
+        try:
+            result = await self._fetch_many(list(batch), session)
+        except Exception as e:
+            result = Failure(f"Batched load failed: {e}")
+        found = {self._key_of(record): record for record in result.value} if isinstance(result, Success) else {}
+        for key, futures in batch.items():
+            outcome = result if isinstance(result, Failure) else Success(found.get(key))
+            for future in futures:
+                if not future.done():
+                    future.set_result(outcome)
@@ -0,0 +1,142 @@
+# File: app/core/catalog_index.py
+"""
+A resident barcode/SKU index of the product catalogue for the POS till.
+
+Looking up a scanned code in the database means a round trip and a three-column
+ILIKE scan per scan. The index keeps every active product's list row in memory,
+in hash maps keyed by barcode and by SKU (case-insensitively), so a scan resolves
+with a dict lookup and no I/O. Lookups are synchronous and thread-safe, so the
+UI thread can call them directly.
+
+The first refresh loads the whole catalogue; later ones fetch only the rows whose
+updated_at is at or after the newest one already seen, minus an overlap: updated_at
+is stamped when a transaction writes, not when it commits, so a slow transaction can
+commit a row older than the watermark. Exact-code misses (partial names, products
+created moments ago) fall back to the database search. Rows may be up to one refresh
+interval stale, so they are only used for display: the cart sends no price override and
+finalize_sale prices every line from an uncached read in the sale's own transaction. If
+that price differs and the sale fails, the POS re-reads the cart's rows and shows the
+new total.
+"""
+from __future__ import annotations
+import threading
+import time
+from datetime import datetime, timedelta
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Sequence, Tuple
+
+from app.core.result import Result, Success, Failure
+
+# How far back each incremental refresh looks before the newest updated_at already seen.
+_REFRESH_OVERLAP = timedelta(seconds=60)
+
+class CatalogIndex:
+    """
+    Scan-code lookup maps over one company's product rows. fetch_rows(updated_since) returns
+    tuples of the named fields followed by updated_at: all active products when updated_since
+    is None, otherwise every product (active or not) changed since then.
+    """
+
+    def __init__(self, fetch_rows: Callable[[Optional[datetime]], Awaitable[Result[List[Tuple], str]]], fields: Sequence[str]):
+        self._fetch_rows = fetch_rows
+        self.fields = tuple(fields)
+        self._id_at, self._sku_at, self._barcode_at, self._active_at = (
+            self.fields.index(name) for name in ("id", "sku", "barcode", "is_active")
+        )
+        self._rows: Dict[Any, Tuple] = {}
+        self._by_barcode: Dict[str, Tuple] = {}
+        self._by_sku: Dict[str, Tuple] = {}
+        self._watermark: Optional[datetime] = None
+        self._loaded = False
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.last_refresh_ms = 0.0
+
+    @property
+    def is_loaded(self) -> bool:
+        """True once the full catalogue has been loaded."""
+        return self._loaded
+
+    def lookup(self, code: str) -> Optional[Dict[str, Any]]:
+        """Returns the row of the active product whose barcode, or else SKU, is exactly code; None on a miss."""
+        code = code.strip()
+        with self._lock:
+            row = self._by_barcode.get(code) or self._by_sku.get(code.casefold())
+            if row is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+        return dict(zip(self.fields, row))
+
+    def forget(self, product_id: Any) -> None:
+        """Drops a product until the next refresh, e.g. after a local edit, so scans fall back to the database."""
+        with self._lock:
+            row = self._rows.pop(product_id, None)
+            if row is not None:
+                self._unmap(row)
+
+    async def refresh(self) -> Result[int, str]:
+        """Loads the full catalogue on the first call and applies changed rows after that. Returns the row count applied."""
+        started = time.perf_counter()
+        since = self._watermark - _REFRESH_OVERLAP if self._watermark is not None else None
+        result = await self._fetch_rows(since)
+        if isinstance(result, Failure):
+            return result
+
+        watermark = self._watermark
+        rows = []
+        for *row, updated_at in result.value:
+            rows.append(tuple(row))
+            if updated_at is not None and (watermark is None or updated_at > watermark):
+                watermark = updated_at
+
+        if since is None:
+            # Full load: build the maps off the lock and swap them in, so scans never wait on it.
+            by_id: Dict[Any, Tuple] = {}
+            by_barcode: Dict[str, Tuple] = {}
+            by_sku: Dict[str, Tuple] = {}
+            for row in rows:
+                by_id[row[self._id_at]] = row
+                if row[self._barcode_at]:
+                    by_barcode[row[self._barcode_at]] = row
+                by_sku[row[self._sku_at].casefold()] = row
+            with self._lock:
+                self._rows, self._by_barcode, self._by_sku = by_id, by_barcode, by_sku
+        else:
+            with self._lock:
+                for row in rows:
+                    self._apply(row)
+
+        self._watermark = watermark
+        self._loaded = True
+        self.last_refresh_ms = (time.perf_counter() - started) * 1000
+        return Success(len(rows))
+
+    def stats(self) -> Dict[str, Any]:
+        """Returns the product count, hit/miss counters and the duration of the last refresh."""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "products": len(self._rows), "hits": self.hits, "misses": self.misses,
+                "hit_rate": self.hits / lookups if lookups else 0.0, "last_refresh_ms": self.last_refresh_ms,
+            }
+
+    def _apply(self, row: Tuple) -> None:
+        """Replaces a product's row, or removes it if it is no longer active. Called under the lock."""
+        previous = self._rows.pop(row[self._id_at], None)
+        if previous is not None:
+            self._unmap(previous)
+        if not row[self._active_at]:
+            return
+        self._rows[row[self._id_at]] = row
+        if row[self._barcode_at]:
+            self._by_barcode[row[self._barcode_at]] = row
+        self._by_sku[row[self._sku_at].casefold()] = row
+
+    def _unmap(self, row: Tuple) -> None:
+        # Only remove keys still pointing at this row: another product may have taken the code since.
+        barcode, sku = row[self._barcode_at], row[self._sku_at].casefold()
+        if barcode and self._by_barcode.get(barcode) is row:
+            del self._by_barcode[barcode]
+        if self._by_sku.get(sku) is row:
+            del self._by_sku[sku]
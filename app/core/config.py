@@ -6,6 +6,8 @@ This module uses Pydantic's BaseSettings to provide a strongly-typed configurati
 model that loads settings from environment variables and a .env file. This ensures
 that all configuration is validated at startup.
 """
+import time
+from typing import List, Optional
 from pydantic import Field
 from pydantic_settings import BaseSettings, SettingsConfigDict # Use pydantic_settings for newer Pydantic versions
 
@@ -24,12 +26,50 @@ class Settings(BaseSettings):
     # Database Configuration
     DATABASE_URL: str = Field(..., description="PostgreSQL database connection URL")
 
+    DATABASE_REPLICA_URL: Optional[str] = Field(None, description="Optional read replica URL for reports, dashboards, inventory summaries and searches")
+    DB_REPLICA_MAX_LAG_SECONDS: float = Field(5.0, description="Read from the primary while the replica is further behind than this")
+    DB_REPLICA_RETRY_SECONDS: float = Field(30.0, description="After a replica connection failure, read from the primary for this long before retrying")
+
+    # Connection pool (applies to each worker lane's engine)
+    DB_POOL_SIZE: int = Field(5, description="Connections kept open in each lane's pool")
+    DB_MAX_OVERFLOW: int = Field(10, description="Extra connections a lane may open beyond DB_POOL_SIZE under load")
+    DB_POOL_PRE_PING: bool = Field(True, description="Test connections on checkout so dropped connections are replaced transparently")
+    DB_POOL_RECYCLE_SECONDS: int = Field(1800, description="Replace pooled connections older than this many seconds (-1 = never)")
+    DB_POOL_TIMEOUT_SECONDS: float = Field(30.0, description="How long a checkout waits for a free connection before failing")
+    DB_POOL_SLOW_CHECKOUT_MS: float = Field(100.0, description="Log a warning when a connection checkout waits longer than this (0 = never)")
+    DB_STATEMENT_CACHE_SIZE: int = Field(100, description="asyncpg prepared statement cache size per connection (0 disables it, e.g. behind PgBouncer)")
+    DB_WARMUP_ENABLED: bool = Field(True, description="Prime pool connections, hot statements and reference data during startup")
+    DB_WARMUP_CONNECTIONS: int = Field(2, description="Connections the warm-up opens and primes on the interactive lane (capped at DB_POOL_SIZE)")
+    DB_ECHO: bool = Field(False, description="Log every SQL statement (SQLAlchemy echo)")
+
+    # Entity cache (products, users, outlets and payment methods looked up by id)
+    ENTITY_CACHE_ENABLED: bool = Field(True, description="Serve get_by_id/get_by_ids of reference entities from an in-memory cache")
+    ENTITY_CACHE_TTL_SECONDS: float = Field(300.0, description="How long a cached entity is served before it is re-read (bounds staleness from other terminals)")
+    ENTITY_CACHE_MAX_ENTRIES: int = Field(5000, description="Entities kept per cached model; the least recently used are evicted beyond this")
+
+    # POS catalog index (barcode/SKU scans resolved from memory)
+    CATALOG_INDEX_ENABLED: bool = Field(True, description="Keep the product catalogue in memory so barcode/SKU scans resolve without a database query")
+    CATALOG_INDEX_REFRESH_SECONDS: float = Field(30.0, description="Seconds between incremental refreshes of the catalog index (bounds staleness from other terminals)")
+
     # Application-level settings
     APP_ENV: str = Field("development", description="Application environment (e.g., 'development', 'production')")
-    DEBUG: bool = Field(True, description="Enable debug mode (e.g., SQLAlchemy echoing)")
+    DEBUG: bool = Field(True, description="Enable debug mode")
     LOG_LEVEL: str = Field("DEBUG", description="Logging level (e.g., 'DEBUG', 'INFO', 'WARNING', 'ERROR', 'CRITICAL')")
     SECRET_KEY: str = Field(..., description="Secret key for security purposes (e.g., session management, hashing)")
 
+    # Async Worker Configuration
+    ASYNC_WORKER_LANES: List[str] = Field(["interactive", "background", "maintenance"], description="Worker lanes to start; each lane runs its own event loop and database engine")
+    ASYNC_MAX_CONCURRENT_INTERACTIVE: int = Field(8, description="Max concurrently running INTERACTIVE-priority tasks per lane (0 = unlimited)")
+    ASYNC_MAX_CONCURRENT_BACKGROUND: int = Field(2, description="Max concurrently running BACKGROUND-priority tasks per lane (0 = unlimited)")
+    ASYNC_MAX_QUEUED_TASKS: int = Field(200, description="Max queued plus running tasks per lane before backpressure applies (0 = unbounded); CRITICAL tasks are always admitted")
+    ASYNC_BACKPRESSURE_POLICY: str = Field("drop_oldest", description="What a full lane does with new tasks: 'reject', 'drop_oldest' (per run_latest key; unkeyed tasks are rejected) or 'block'")
+    ASYNC_BLOCK_TIMEOUT_SECONDS: float = Field(5.0, description="With the 'block' policy, how long a submitter waits for room before the task is rejected")
+    ASYNC_TIMEOUT_INTERACTIVE_SECONDS: float = Field(30.0, description="Default deadline for INTERACTIVE tasks, also applied as the DB statement/lock timeout (0 = none)")
+    ASYNC_TIMEOUT_BACKGROUND_SECONDS: float = Field(300.0, description="Default deadline for BACKGROUND tasks such as reports (0 = none); CRITICAL tasks have no default deadline")
+    ASYNC_METRICS_LOG_INTERVAL_SECONDS: float = Field(60, description="How often each async lane logs p50/p95/p99 task latencies (0 = never)")
+    BLOCKING_POOL_MAX_WORKERS: int = Field(4, description="Threads available for blocking I/O offloaded from the event loops (file exports, bcrypt)")
+    CPU_POOL_MAX_WORKERS: int = Field(2, description="Processes available for CPU-bound work offloaded from the event loops (PDF rendering)")
+
     # Context IDs for current company/outlet/user (for development/testing convenience)
     # In production, these would be derived from authentication/session.
     CURRENT_COMPANY_ID: str = Field("00000000-0000-0000-0000-000000000001", description="Placeholder for current company UUID")
@@ -38,4 +78,6 @@ class Settings(BaseSettings):
 
 # Create a single, importable instance of the settings.
 # The application will import this `settings` object to access configuration.
+_load_started = time.perf_counter()
 settings = Settings()
+SETTINGS_LOAD_MS = (time.perf_counter() - _load_started) * 1000 # Reported by --profile-startup.
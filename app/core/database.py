@@ -0,0 +1,140 @@
+# File: app/core/database.py
+"""
+Database engine construction, connection pool instrumentation and read-replica routing.
+
+Every worker lane owns its own engine (an asyncpg connection cannot be shared between
+event loops), so the pool settings below apply per lane.
+"""
+import logging
+import threading
+import time
+from typing import Any, Dict, Optional
+
+from sqlalchemy import text
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker, AsyncEngine, AsyncSession
+
+from app.core.config import Settings
+from app.core.task_metrics import RollingSeries
+
+logger = logging.getLogger(__name__)
+
+def build_engine(settings: Settings, url: str = None) -> AsyncEngine:
+    """Creates an AsyncEngine for the given URL (default: DATABASE_URL) using the pool settings."""
+    url = make_url(url or settings.DATABASE_URL)
+    options: Dict[str, Any] = {"echo": settings.DB_ECHO, "pool_pre_ping": settings.DB_POOL_PRE_PING}
+    if url.get_backend_name() != "sqlite":
+        # SQLite engines use a single-connection or null pool, which take no sizing arguments.
+        options.update(
+            pool_size=settings.DB_POOL_SIZE,
+            max_overflow=settings.DB_MAX_OVERFLOW,
+            pool_recycle=settings.DB_POOL_RECYCLE_SECONDS,
+            pool_timeout=settings.DB_POOL_TIMEOUT_SECONDS,
+        )
+    if url.get_driver_name() == "asyncpg":
+        options["connect_args"] = {"statement_cache_size": settings.DB_STATEMENT_CACHE_SIZE}
+    return create_async_engine(url, **options)
+
+class PoolMetrics:
+    """
+    Live statistics for one engine's connection pool. Checkout wait times are recorded
+    by ApplicationCore.get_session, which times how long it takes to obtain a connection.
+    """
+    def __init__(self, engine: AsyncEngine, name: str, slow_checkout_ms: float = 100.0, window: int = 512):
+        self._engine = engine
+        self.name = name
+        self._slow_checkout_ms = slow_checkout_ms
+        self._wait_ms = RollingSeries(window)
+        self._lock = threading.Lock()
+        self.checkouts = 0
+        self.slow_checkouts = 0
+        self.max_wait_ms = 0.0
+
+    def record_checkout_wait(self, seconds: float):
+        wait_ms = seconds * 1000
+        with self._lock:
+            self.checkouts += 1
+            self._wait_ms.samples.append(wait_ms)
+            self.max_wait_ms = max(self.max_wait_ms, wait_ms)
+            slow = self._slow_checkout_ms and wait_ms > self._slow_checkout_ms
+            if slow:
+                self.slow_checkouts += 1
+        if slow:
+            logger.warning(
+                "Connection checkout on '%s' waited %.1f ms (threshold %.0f ms); pool: %s",
+                self.name, wait_ms, self._slow_checkout_ms, self._engine.pool.status(),
+            )
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Returns pool occupancy, checkout counters and p50/p95/p99 checkout wait (ms)."""
+        pool = self._engine.pool
+        with self._lock:
+            stats: Dict[str, Any] = {
+                "checkouts": self.checkouts,
+                "slow_checkouts": self.slow_checkouts,
+                "wait_ms": self._wait_ms.percentiles(),
+                "max_wait_ms": round(self.max_wait_ms, 3),
+            }
+        # Only queue pools report sizing; single-connection pools (SQLite) do not.
+        for key, method in (("size", "size"), ("checked_out", "checkedout"), ("checked_in", "checkedin"), ("overflow", "overflow")):
+            if hasattr(pool, method):
+                stats[key] = getattr(pool, method)()
+        return stats
+
+# Replication lag in seconds; 0 on a primary or on a replica that has replayed everything it received.
+_PG_REPLICA_LAG_SQL = text(
+    "SELECT CASE WHEN NOT pg_is_in_recovery() OR pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn() THEN 0 "
+    "ELSE COALESCE(EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp()), 0) END"
+)
+
+class ReplicaRouter:
+    """
+    Hands out sessions on one lane's read replica while it is reachable and not lagging.
+    When the replica fails or falls behind by more than max_lag_seconds, open_session
+    returns None (so the caller uses the primary) until retry_seconds have passed.
+    """
+    def __init__(self, engine: AsyncEngine, session_factory: async_sessionmaker, name: str, max_lag_seconds: float = 5.0,
+                 retry_seconds: float = 30.0, lag_check_interval: float = 5.0, slow_checkout_ms: float = 100.0):
+        self.engine = engine
+        self._session_factory = session_factory
+        self.name = name
+        self._max_lag_seconds = max_lag_seconds
+        self._retry_seconds = retry_seconds
+        self._lag_check_interval = lag_check_interval
+        self._unavailable_until = 0.0
+        self._lag_checked_at: Optional[float] = None
+        self.pool_metrics = PoolMetrics(engine, f"{name}-replica", slow_checkout_ms)
+
+    @property
+    def available(self) -> bool:
+        return time.monotonic() >= self._unavailable_until
+
+    async def open_session(self) -> Optional[AsyncSession]:
+        """Returns a session with a replica connection checked out, or None to use the primary."""
+        now = time.monotonic()
+        if now < self._unavailable_until:
+            return None
+        session: AsyncSession = self._session_factory()
+        try:
+            started = time.perf_counter()
+            await session.connection()
+            self.pool_metrics.record_checkout_wait(time.perf_counter() - started)
+            if self._lag_checked_at is None or now - self._lag_checked_at >= self._lag_check_interval:
+                self._lag_checked_at = now
+                lag = await self._replication_lag(session)
+                if lag > self._max_lag_seconds:
+                    logger.warning("Replica for '%s' is %.1f s behind (limit %.1f s); reading from the primary.", self.name, lag, self._max_lag_seconds)
+                    self._unavailable_until = now + self._lag_check_interval
+                    await session.close()
+                    return None
+            return session
+        except Exception as e:
+            logger.warning("Replica for '%s' is unavailable (%s); reading from the primary for %.0f s.", self.name, e, self._retry_seconds)
+            self._unavailable_until = now + self._retry_seconds
+            await session.close()
+            return None
+
+    async def _replication_lag(self, session: AsyncSession) -> float:
+        if session.bind.dialect.name != "postgresql":
+            return 0.0
+        return float((await session.execute(_PG_REPLICA_LAG_SQL)).scalar_one())
@@ -0,0 +1,136 @@
+# File: app/core/entity_cache.py
+"""
+A read-through cache for reference entities (products, users, outlets, payment methods).
+
+Entries are column snapshots - plain dicts of column values - rather than ORM instances,
+so no instance is ever shared between sessions or worker lanes: each hit builds a fresh
+detached instance that the caller may attach to its own session. Entries expire after a
+TTL and the least recently used ones are evicted beyond a size limit.
+
+Invalidation: any flush that updates or deletes rows of a cached model drops them, and
+drops them again once the transaction commits, so a reader on another lane cannot keep
+the pre-commit row cached. Rows changed by another terminal are picked up when the TTL
+runs out.
+"""
+from __future__ import annotations
+import threading
+import time
+import weakref
+from collections import OrderedDict
+from itertools import chain
+from typing import Any, Dict, Iterable, Optional, Tuple, Type
+
+from sqlalchemy import event, inspect
+from sqlalchemy.orm import Session, make_transient_to_detached
+
+# Every live cache, so session events can invalidate entries without knowing the services.
+_caches: "weakref.WeakSet[EntityCache]" = weakref.WeakSet()
+
+# session.info key holding the (model, id) pairs to invalidate again when the session commits.
+_PENDING_KEY = "entity_cache_pending"
+
+class EntityCache:
+    """Thread-safe LRU + TTL cache of column snapshots for one model, keyed by primary key."""
+
+    def __init__(self, model: Type[Any], max_entries: int, ttl_seconds: float):
+        self.model = model
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._mapper = inspect(model)
+        self._column_keys = [attr.key for attr in self._mapper.column_attrs]
+        self._entries: "OrderedDict[Any, Tuple[float, Dict[str, Any]]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        _caches.add(self)
+
+    def get(self, record_id: Any) -> Optional[Any]:
+        """Returns a new detached instance built from the cached snapshot, or None on a miss."""
+        with self._lock:
+            entry = self._entries.get(record_id)
+            if entry is None or entry[0] <= time.monotonic():
+                if entry is not None:
+                    del self._entries[record_id]
+                self.misses += 1
+                return None
+            self._entries.move_to_end(record_id)
+            self.hits += 1
+            snapshot = entry[1]
+
+        instance = self._mapper.class_manager.new_instance()
+        for key, value in snapshot.items():
+            setattr(instance, key, value)
+        # Marks the instance persistent-but-detached with the snapshot as its committed state.
+        make_transient_to_detached(instance)
+        return instance
+
+    def put(self, instance: Any) -> None:
+        """Caches an instance's column values. Instances with expired or deferred columns are skipped."""
+        loaded = inspect(instance).dict
+        if any(key not in loaded for key in self._column_keys):
+            return
+        snapshot = {key: loaded[key] for key in self._column_keys}
+        with self._lock:
+            self._entries[snapshot["id"]] = (time.monotonic() + self.ttl_seconds, snapshot)
+            self._entries.move_to_end(snapshot["id"])
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def invalidate(self, record_ids: Iterable[Any]) -> None:
+        with self._lock:
+            for record_id in record_ids:
+                self._entries.pop(record_id, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        """Returns the entry count and hit/miss/eviction counters."""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "entries": len(self._entries), "hits": self.hits, "misses": self.misses,
+                "evictions": self.evictions, "hit_rate": self.hits / lookups if lookups else 0.0,
+            }
+
+def _invalidate_everywhere(model: Type[Any], record_ids: Iterable[Any]) -> None:
+    record_ids = list(record_ids)
+    for cache in list(_caches):
+        if issubclass(model, cache.model):
+            cache.invalidate(record_ids)
+
+def invalidate_on_commit(session: Session, model: Type[Any], record_ids: Iterable[Any]) -> None:
+    """
+    Drops the records from every cache of model now and again when session commits. For writes
+    that bypass the unit of work (bulk statements); ORM flushes are tracked automatically.
+    """
+    record_ids = list(record_ids)
+    if not record_ids or not _caches:
+        return
+    _invalidate_everywhere(model, record_ids)
+    session.info.setdefault(_PENDING_KEY, []).append((model, record_ids))
+
+@event.listens_for(Session, "after_flush")
+def _invalidate_flushed(session: Session, flush_context: Any) -> None:
+    if not _caches:
+        return
+    cached_models = {cache.model for cache in list(_caches)}
+    changed: Dict[Type[Any], list] = {}
+    for instance in chain(session.dirty, session.deleted):
+        if type(instance) in cached_models:
+            changed.setdefault(type(instance), []).append(inspect(instance).identity[0])
+    for model, record_ids in changed.items():
+        invalidate_on_commit(session, model, record_ids)
+
+@event.listens_for(Session, "after_commit")
+def _invalidate_committed(session: Session) -> None:
+    for model, record_ids in session.info.pop(_PENDING_KEY, ()):
+        _invalidate_everywhere(model, record_ids)
+
+@event.listens_for(Session, "after_soft_rollback")
+def _discard_pending(session: Session, previous_transaction: Any) -> None:
+    # The rolled-back rows were already dropped at flush time; the cache may refill from the database.
+    session.info.pop(_PENDING_KEY, None)
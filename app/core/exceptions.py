@@ -23,6 +23,14 @@ class AsyncBridgeError(CoreException):
     """Raised when there is an error in the asynchronous bridge setup or operation."""
     pass
 
+class TaskRejectedError(AsyncBridgeError):
+    """Delivered to a task's callback when a saturated AsyncWorker refuses or drops the task."""
+    pass
+
+class TaskTimeoutError(AsyncBridgeError):
+    """Raised (and delivered to the task's callback) when a task runs past its deadline."""
+    pass
+
 # TODO: Add more specific exceptions as needed for different domains (e.g., SalesError, InventoryError)
 # These would typically be subclasses of a higher-level business exception,
 # distinct from CoreException. For example:
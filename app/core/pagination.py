@@ -0,0 +1,130 @@
+# File: app/core/pagination.py
+"""
+Keyset (seek) pagination helpers.
+
+Instead of OFFSET, which makes the database walk past every skipped row, a keyset
+page continues strictly after the last row of the previous page on a stable
+ordering of (order column, id). Each page costs the same however deep the user
+scrolls. The position is handed to callers as an opaque cursor string, so the UI
+never needs to know which columns it encodes.
+
+The first page can also count every matching row in the same query, with a
+count(*) OVER () column; the cursor carries that total on to later pages, so the
+count is taken once per listing and never with a second COUNT query.
+"""
+import base64
+import json
+import uuid
+from dataclasses import dataclass, field
+from datetime import date, datetime
+from decimal import Decimal
+from typing import Any, Dict, Generic, List, Optional, Tuple, TypeVar
+
+import sqlalchemy as sa
+
+T = TypeVar('T')
+
+@dataclass(frozen=True)
+class Page(Generic[T]):
+    """
+    One page of results. next_cursor is None on the last page. total is the number of
+    rows matching the query across all pages (as of the first page), or None if not counted.
+    """
+    items: List[T] = field(default_factory=list)
+    next_cursor: Optional[str] = None
+    total: Optional[int] = None
+
+    def map(self, fn) -> "Page":
+        """Returns the same page with fn applied to every item (e.g. ORM model -> DTO)."""
+        return Page([fn(item) for item in self.items], self.next_cursor, self.total)
+
+class InvalidCursorError(ValueError):
+    """Raised when a cursor is malformed or was issued for a different ordering."""
+
+# Label of the count(*) OVER () column apply_keyset(with_total=True) adds to the first page.
+TOTAL_LABEL = "page_total"
+
+# Tagged encoders keep Decimal/UUID/datetime values exact through the JSON round trip.
+_ENCODERS = {
+    str: ("s", str), int: ("i", str), Decimal: ("d", str), uuid.UUID: ("u", str),
+    datetime: ("t", datetime.isoformat), date: ("D", date.isoformat), bool: ("b", str),
+}
+_DECODERS = {
+    "s": str, "i": int, "d": Decimal, "u": uuid.UUID,
+    "t": datetime.fromisoformat, "D": date.fromisoformat, "b": lambda v: v == "True",
+}
+
+def _encode_value(value: Any) -> List[Optional[str]]:
+    if value is None:
+        return ["n", None]
+    tag, encode = _ENCODERS[type(value)]
+    return [tag, encode(value)]
+
+def _decode_value(tagged: List[Optional[str]]) -> Any:
+    tag, raw = tagged
+    return None if tag == "n" else _DECODERS[tag](raw)
+
+def encode_cursor(ordering: str, key: Tuple[Any, ...], total: Optional[int] = None) -> str:
+    """Encodes the sort key of the last row on a page, and the listing's total if known, into an opaque cursor."""
+    payload: Dict[str, Any] = {"o": ordering, "k": [_encode_value(v) for v in key]}
+    if total is not None:
+        payload["t"] = total
+    return base64.urlsafe_b64encode(json.dumps(payload, separators=(",", ":")).encode()).decode()
+
+def _load_cursor(cursor: str) -> Dict[str, Any]:
+    try:
+        payload = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+        payload["k"] = tuple(_decode_value(v) for v in payload["k"])
+        total = payload.get("t")
+        if total is not None and not isinstance(total, int):
+            raise ValueError(f"total {total!r} is not an integer")
+    except Exception as e:
+        raise InvalidCursorError(f"Malformed pagination cursor: {e}") from e
+    return payload
+
+def decode_cursor(cursor: str, ordering: str) -> Tuple[Any, ...]:
+    """Decodes a cursor, checking it was issued for the same ordering."""
+    payload = _load_cursor(cursor)
+    if payload.get("o") != ordering:
+        raise InvalidCursorError(f"Cursor was issued for ordering '{payload.get('o')}', not '{ordering}'.")
+    return payload["k"]
+
+def cursor_total(cursor: str) -> Optional[int]:
+    """Returns the total carried by a cursor, or None if its listing was not counted."""
+    return _load_cursor(cursor).get("t")
+
+def apply_keyset(stmt: sa.Select, order_column, id_column, limit: int, cursor: Optional[str], ordering: str, with_total: bool = False) -> sa.Select:
+    """
+    Orders stmt by (order_column, id_column), continues after the cursor's position and
+    fetches one row beyond the limit so that page_from_rows can tell if more remain.
+    order_column must be NOT NULL: row comparisons never match NULL keys.
+
+    With with_total, the first page (no cursor) also selects count(*) OVER () as TOTAL_LABEL.
+    The window is evaluated before LIMIT, so every row carries the count of all rows matching
+    stmt's filters. Later pages leave the column out and read the total from the cursor.
+    """
+    if cursor:
+        last_value, last_id = decode_cursor(cursor, ordering)
+        stmt = stmt.where(sa.tuple_(order_column, id_column) > sa.tuple_(
+            sa.bindparam(None, last_value, type_=order_column.type), sa.bindparam(None, last_id, type_=id_column.type)
+        ))
+    elif with_total:
+        stmt = stmt.add_columns(sa.func.count().over().label(TOTAL_LABEL))
+    return stmt.order_by(order_column, id_column).limit(limit + 1)
+
+def pop_total(rows: List[Dict[str, Any]], cursor: Optional[str]) -> Optional[int]:
+    """
+    Removes the TOTAL_LABEL column from the dict rows of an apply_keyset(with_total=True)
+    statement and returns the total: from the rows on the first page, from the cursor after.
+    """
+    counts = [row.pop(TOTAL_LABEL, None) for row in rows]
+    if cursor:
+        return cursor_total(cursor)
+    return counts[0] if counts else 0
+
+def page_from_rows(rows: List[T], limit: int, ordering: str, key_of, total: Optional[int] = None) -> Page[T]:
+    """Builds a Page from up to limit + 1 rows fetched by an apply_keyset statement."""
+    if len(rows) <= limit:
+        return Page(list(rows), None, total)
+    rows = list(rows[:limit])
+    return Page(rows, encode_cursor(ordering, key_of(rows[-1]), total), total)
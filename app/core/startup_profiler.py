@@ -0,0 +1,138 @@
+# File: app/core/startup_profiler.py
+"""
+Startup diagnostics for `python -m app.main --profile-startup`.
+
+StartupProfiler collects the wall time of each startup phase and, through ImportTimer
+(a sys.meta_path hook installed before the application's own imports), how long each
+module took to import. The report is logged and written as JSON so that startup can be
+compared across releases and till hardware.
+
+This module must stay cheap to import: app.main loads it before anything else.
+"""
+import argparse
+import json
+import logging
+import platform
+import sys
+import threading
+import time
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+class ImportTimer:
+    """
+    A meta path finder that times module execution. It resolves specs through the
+    other finders and wraps each loader's exec_module, recording the cumulative time
+    per module and its self time (excluding the imports it triggered).
+    """
+    def __init__(self):
+        self.cumulative_ms: Dict[str, float] = {}
+        self.self_ms: Dict[str, float] = {}
+        self._local = threading.local()
+
+    def find_spec(self, fullname, path, target=None):
+        for finder in sys.meta_path:
+            if finder is self or not hasattr(finder, "find_spec"):
+                continue
+            spec = finder.find_spec(fullname, path, target)
+            if spec is not None:
+                break
+        else:
+            return None
+        loader = spec.loader
+        # Class-level loaders (builtins, frozen modules) are shared and cheap; leave them alone.
+        if loader is not None and not isinstance(loader, type) and "exec_module" not in vars(loader):
+            loader.exec_module = self._timed(loader.exec_module)
+        return spec
+
+    def _timed(self, exec_module):
+        def _exec_module(module):
+            stack: List[float] = self._local.__dict__.setdefault("stack", [])
+            stack.append(0.0) # Time spent in nested imports.
+            started = time.perf_counter()
+            try:
+                exec_module(module)
+            finally:
+                elapsed = time.perf_counter() - started
+                nested = stack.pop()
+                if stack:
+                    stack[-1] += elapsed
+                self.cumulative_ms[module.__name__] = elapsed * 1000
+                self.self_ms[module.__name__] = (elapsed - nested) * 1000
+        return _exec_module
+
+    def top(self, by: str = "cumulative", limit: int = 25) -> List[Dict[str, Any]]:
+        """Returns the slowest modules, ranked by cumulative or self time."""
+        ranking = self.cumulative_ms if by == "cumulative" else self.self_ms
+        names = sorted(ranking, key=ranking.get, reverse=True)[:limit]
+        return [
+            {"module": name, "cumulative_ms": round(self.cumulative_ms[name], 2), "self_ms": round(self.self_ms[name], 2)}
+            for name in names
+        ]
+
+class StartupProfiler:
+    """Records startup phase timings and module import times, and writes the JSON report."""
+    DEFAULT_OUTPUT = "startup-profile.json"
+
+    def __init__(self, output_path: str = DEFAULT_OUTPUT, top: int = 25):
+        self.output_path = output_path
+        self.top = top
+        self.phases: Dict[str, float] = {} # Phase name -> milliseconds.
+        self.import_timer = ImportTimer()
+
+    @classmethod
+    def from_argv(cls, argv: List[str]) -> Optional["StartupProfiler"]:
+        """
+        Returns an installed profiler if --profile-startup is in argv, else None. The
+        profiler's own options are removed from argv so Qt never sees them.
+        """
+        parser = argparse.ArgumentParser(add_help=False, allow_abbrev=False)
+        parser.add_argument("--profile-startup", action="store_true")
+        parser.add_argument("--profile-output", default=cls.DEFAULT_OUTPUT)
+        parser.add_argument("--profile-top", type=int, default=25)
+        options, remaining = parser.parse_known_args(argv[1:])
+        argv[1:] = remaining
+        if not options.profile_startup:
+            return None
+        profiler = cls(options.profile_output, options.profile_top)
+        profiler.install()
+        return profiler
+
+    def install(self) -> None:
+        sys.meta_path.insert(0, self.import_timer)
+
+    def uninstall(self) -> None:
+        if self.import_timer in sys.meta_path:
+            sys.meta_path.remove(self.import_timer)
+
+    def record_phase(self, phase: str, started: float) -> None:
+        """Records how long a phase took, given its time.perf_counter() start."""
+        self.phases[phase] = round((time.perf_counter() - started) * 1000, 1)
+
+    def build_report(self, core_phases: Optional[Dict[str, float]] = None) -> Dict[str, Any]:
+        return {
+            "generated_at": datetime.now(timezone.utc).isoformat(),
+            "python": sys.version.split()[0],
+            "platform": platform.platform(),
+            "phases_ms": {**self.phases, **(core_phases or {})},
+            "imports": {
+                "modules_timed": len(self.import_timer.cumulative_ms),
+                "top_cumulative": self.import_timer.top("cumulative", self.top),
+                "top_self": self.import_timer.top("self", self.top),
+            },
+        }
+
+    def finish(self, core_phases: Optional[Dict[str, float]] = None) -> Dict[str, Any]:
+        """Stops timing imports, logs a summary and writes the JSON report."""
+        self.uninstall()
+        report = self.build_report(core_phases)
+        with open(self.output_path, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+
+        logger.info("Startup phases (ms): %s", ", ".join(f"{k}={v:.1f}" for k, v in report["phases_ms"].items()))
+        for entry in report["imports"]["top_cumulative"][:10]:
+            logger.info("  import %-55s cumulative %8.1f ms  self %7.1f ms", entry["module"], entry["cumulative_ms"], entry["self_ms"])
+        logger.info("Startup profile written to %s", self.output_path)
+        return report
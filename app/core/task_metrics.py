@@ -0,0 +1,120 @@
+# File: app/core/task_metrics.py
+"""
+Rolling latency metrics for coroutines run by the async bridge.
+
+Every task is tagged by its coroutine's qualname (e.g. 'ProductManager.search_products')
+and records three latencies: how long it waited in the worker's queue before starting,
+how long it ran on the event loop, and how long its callback waited for the main thread.
+"""
+import threading
+from collections import deque
+from typing import Deque, Dict, List, Optional
+
+class RollingSeries:
+    """A bounded window of recent samples (in milliseconds) with percentile helpers."""
+    __slots__ = ("samples",)
+
+    def __init__(self, window: int):
+        self.samples: Deque[float] = deque(maxlen=window)
+
+    def percentiles(self) -> Dict[str, Optional[float]]:
+        if not self.samples:
+            return {"p50": None, "p95": None, "p99": None}
+        ordered = sorted(self.samples)
+        last = len(ordered) - 1
+        return {name: round(ordered[min(last, int(q * len(ordered)))], 3) for name, q in (("p50", 0.50), ("p95", 0.95), ("p99", 0.99))}
+
+class _TaskStats:
+    __slots__ = ("completed", "failed", "cancelled", "queue_ms", "run_ms", "callback_ms")
+
+    def __init__(self, window: int):
+        self.completed = 0
+        self.failed = 0
+        self.cancelled = 0
+        self.queue_ms = RollingSeries(window)
+        self.run_ms = RollingSeries(window)
+        self.callback_ms = RollingSeries(window)
+
+class TaskMetrics:
+    """
+    Thread-safe per-task latency recorder. The event loop thread records queue and run
+    times; the main thread records callback dispatch delays.
+    """
+    DEFAULT_WINDOW = 512
+
+    def __init__(self, window: int = DEFAULT_WINDOW):
+        self._window = window
+        self._stats: Dict[str, _TaskStats] = {}
+        self._lock = threading.Lock()
+        self._recorded_since_report = 0
+
+    def _get(self, name: str) -> _TaskStats:
+        stats = self._stats.get(name)
+        if stats is None:
+            stats = self._stats[name] = _TaskStats(self._window)
+        return stats
+
+    def record_started(self, name: str, queue_seconds: float):
+        with self._lock:
+            self._get(name).queue_ms.samples.append(queue_seconds * 1000)
+
+    def record_finished(self, name: str, run_seconds: float, failed: bool = False, cancelled: bool = False):
+        with self._lock:
+            stats = self._get(name)
+            stats.run_ms.samples.append(run_seconds * 1000)
+            if cancelled:
+                stats.cancelled += 1
+            elif failed:
+                stats.failed += 1
+            else:
+                stats.completed += 1
+            self._recorded_since_report += 1
+
+    def record_dropped(self, name: str):
+        """Records a task that was cancelled before it ever started (e.g. superseded while queued)."""
+        with self._lock:
+            self._get(name).cancelled += 1
+            self._recorded_since_report += 1
+
+    def record_callback_dispatched(self, name: str, delay_seconds: float):
+        with self._lock:
+            self._get(name).callback_ms.samples.append(delay_seconds * 1000)
+
+    def snapshot(self) -> Dict[str, Dict]:
+        """Returns counters and p50/p95/p99 latencies (ms) for every task name seen so far."""
+        with self._lock:
+            return {
+                name: {
+                    "completed": s.completed, "failed": s.failed, "cancelled": s.cancelled,
+                    "queue_ms": s.queue_ms.percentiles(), "run_ms": s.run_ms.percentiles(),
+                    "callback_ms": s.callback_ms.percentiles(),
+                }
+                for name, s in self._stats.items()
+            }
+
+    def reset(self):
+        with self._lock:
+            self._stats.clear()
+            self._recorded_since_report = 0
+
+    def format_summary(self, top: int = 5) -> Optional[str]:
+        """
+        Returns a one-line summary of the slowest tasks by p95 run time, or None if no
+        task has finished since the previous summary (so idle lanes stay quiet).
+        """
+        with self._lock:
+            if not self._recorded_since_report:
+                return None
+            self._recorded_since_report = 0
+        snapshot = self.snapshot()
+        ranked = sorted(snapshot.items(), key=lambda item: item[1]["run_ms"]["p95"] or 0.0, reverse=True)[:top]
+
+        def _fmt(p: Dict[str, Optional[float]]) -> str:
+            return "/".join("-" if p[k] is None else f"{p[k]:.1f}" for k in ("p50", "p95", "p99"))
+
+        parts: List[str] = [
+            f"{name} n={s['completed'] + s['failed']} cancelled={s['cancelled']} "
+            f"queue={_fmt(s['queue_ms'])} run={_fmt(s['run_ms'])} callback={_fmt(s['callback_ms'])}"
+            for name, s in ranked
+        ]
+        return "p50/p95/p99 ms | " + " | ".join(parts)
@@ -0,0 +1,106 @@
+# File: app/core/warmup.py
+"""
+Startup warm-up for the interactive lane.
+
+The first sale after launch otherwise pays for opening pool connections, compiling the
+SQLAlchemy statements it uses and (on PostgreSQL) asyncpg preparing them on the server.
+The warm-up does that work up front: it opens the configured number of connections and
+runs the till's hot statements on each one, inside transactions that are always rolled
+back, then preloads small reference data. Nothing it does is ever committed, and any
+failure is logged and ignored: warm-up must never prevent the application from starting.
+"""
+from __future__ import annotations
+import asyncio
+import logging
+import time
+import uuid
+from decimal import Decimal
+from typing import TYPE_CHECKING, Dict
+
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncEngine, AsyncSession
+
+from app.core.result import Success, Failure
+from app.models.sales import SalesTransaction, SalesTransactionItem, Payment
+
+if TYPE_CHECKING:
+    from app.core.application_core import ApplicationCore
+
+logger = logging.getLogger(__name__)
+
+async def warm_up(core: "ApplicationCore", engine: AsyncEngine, connections: int) -> Dict[str, float]:
+    """Runs every warm-up phase and returns their durations in milliseconds."""
+    timings: Dict[str, float] = {}
+    if engine.dialect.name == "sqlite":
+        connections = 1 # SQLite pools hand out a single shared connection.
+
+    started = time.perf_counter()
+    conns = []
+    try:
+        conns = await asyncio.gather(*(engine.connect() for _ in range(max(1, connections))))
+        timings["connections_ms"] = (time.perf_counter() - started) * 1000
+
+        phase_started = time.perf_counter()
+        for conn in conns:
+            await _prime_hot_statements(core, conn)
+        timings["statements_ms"] = (time.perf_counter() - phase_started) * 1000
+    finally:
+        for conn in conns:
+            await conn.close() # Returns the now-primed connection to the pool.
+
+    phase_started = time.perf_counter()
+    result = await core.payment_method_manager.get_active_payment_methods(core.current_company_id)
+    timings["reference_data_ms"] = (time.perf_counter() - phase_started) * 1000
+    if isinstance(result, Failure):
+        logger.warning("Warm-up could not preload payment methods: %s", result.error)
+
+    timings["total_ms"] = (time.perf_counter() - started) * 1000
+    return timings
+
+async def _prime_hot_statements(core: "ApplicationCore", conn: AsyncConnection) -> None:
+    """
+    Runs the statements a sale depends on against one connection, rolling everything back.
+    The writes (stock row lock and upsert, sale header, line item and payment inserts) need
+    a real product and payment method to satisfy their foreign keys; a company with neither
+    gets only the reads primed.
+    """
+    company_id, outlet_id, user_id = core.current_company_id, core.current_outlet_id, core.current_user_id
+    probe_id = uuid.uuid4() # Matches no row, so the reads that use it return nothing.
+    session = AsyncSession(bind=conn, expire_on_commit=False)
+    try:
+        # Product lookups: barcode/SKU scan, search and the cart re-fetch in finalize_sale.
+        await core.product_service.get_by_sku(company_id, "", session)
+        products = await core.product_service.search(company_id, "", limit=1, session=session)
+        await core.product_service.get_by_ids([probe_id], session, bypass_cache=True)
+        methods = await core.payment_method_service.get_all_active_methods(company_id, session)
+        await core.inventory_service.get_stock_level(outlet_id, probe_id, None, session)
+        # Read the ids before the rollback expires the instances.
+        product_id = products.value[0].id if isinstance(products, Success) and products.value else None
+        method_id = methods.value[0].id if isinstance(methods, Success) and methods.value else None
+        await session.rollback()
+
+        if product_id is None or method_id is None:
+            logger.debug("Warm-up found no product or payment method; sale writes not primed.")
+            return
+
+        # Stock adjustment: SELECT ... FOR UPDATE, then the insert/update it flushes.
+        result = await core.inventory_service.adjust_stock_level(outlet_id, product_id, None, Decimal("0"), session)
+        if isinstance(result, Failure):
+            logger.debug("Warm-up stock adjustment failed (ignored): %s", result.error)
+        await session.rollback()
+
+        # Sale insert: header, line item and payment, flushed as finalize_sale does.
+        sale = SalesTransaction(
+            company_id=company_id, outlet_id=outlet_id, cashier_id=user_id,
+            transaction_number=f"WARMUP-{probe_id.hex[:8].upper()}",
+            subtotal=Decimal("0"), tax_amount=Decimal("0"), total_amount=Decimal("0"), status="VOIDED",
+        )
+        sale.items = [SalesTransactionItem(product_id=product_id, quantity=Decimal("1"), unit_price=Decimal("0"), cost_price=Decimal("0"), line_total=Decimal("0"))]
+        sale.payments = [Payment(payment_method_id=method_id, amount=Decimal("0"))]
+        result = await core.sales_service.create_full_transaction(sale, session)
+        if isinstance(result, Failure):
+            logger.debug("Warm-up sale insert failed (ignored): %s", result.error)
+    except Exception as e:
+        logger.debug("Warm-up statement failed (ignored): %s", e)
+    finally:
+        await session.rollback()
+        await session.close()
@@ -4,35 +4,75 @@ SG-POS Application Entry Point.
 
 This script initializes the core application components, sets up the asynchronous
 bridge, creates the main UI window, and starts the Qt event loop.
+
+Startup is staged: the async workers start connecting to the database in the
+background while the main thread builds and shows the window. POS actions stay
+disabled until the core reports ready.
+
+Run with --profile-startup (optionally --profile-output PATH, --profile-top N) to
+time every startup phase and module import, write a JSON report and exit once
+the core is ready.
 """
 import sys
 import os
+import logging
+import time
+_SCRIPT_STARTED = time.perf_counter()
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
+# Installed before any other application import so that their import times are recorded.
+from app.core.startup_profiler import StartupProfiler
+profiler = StartupProfiler.from_argv(sys.argv)
+
 from typing import Optional
 from PySide6.QtWidgets import QApplication, QMessageBox
 
 from app.core.application_core import ApplicationCore
-from app.core.config import settings
+from app.core.config import settings, SETTINGS_LOAD_MS
 from app.core.exceptions import CoreException
 from app.ui.main_window import MainWindow
 
+logger = logging.getLogger(__name__)
+
+if profiler:
+    profiler.record_phase("imports", _SCRIPT_STARTED)
+    profiler.phases["settings_load"] = round(SETTINGS_LOAD_MS, 1)
+
 def main():
     """Initializes and runs the SG-POS application."""
+    logging.basicConfig(level=settings.LOG_LEVEL, format="%(asctime)s %(levelname)s %(name)s: %(message)s")
     app = QApplication(sys.argv)
     
     # The previous call to qRegisterMetaType(object) has been removed because
     # the newer versions of PySide6 handle type registration automatically.
 
     core: Optional[ApplicationCore] = None
+    main_window: Optional[MainWindow] = None
     exit_code = 0
 
     try:
         core = ApplicationCore(settings)
-        core.initialize()
 
+        def _on_core_ready(error: Optional[Exception]):
+            # Delivered through the event loop, so the window below always exists by now.
+            if error is None:
+                core.record_startup_phase("launch_to_ready", _SCRIPT_STARTED)
+                logger.info("Startup phases (ms): %s", core.startup_timings)
+                core.start_catalog_index()
+            if profiler:
+                profiler.finish(core.startup_timings)
+            main_window.on_core_ready(error)
+            if profiler and error is None:
+                QApplication.quit() # Diagnostic run: exit once the POS is usable.
+
+        # Stage 1: start the workers; they connect and warm up the database in the background...
+        core.initialize_async(_on_core_ready)
+
+        # Stage 2: ...while the main thread builds and shows the UI.
+        ui_started = time.perf_counter()
         main_window = MainWindow(core)
         main_window.show()
+        core.record_startup_phase("main_window", ui_started)
 
         exit_code = app.exec()
 
@@ -59,7 +59,36 @@ class Product(Base, TimestampMixin):
     sales_transaction_items = relationship("SalesTransactionItem", back_populates="product", cascade="all, delete-orphan")
     purchase_order_items = relationship("PurchaseOrderItem", back_populates="product", cascade="all, delete-orphan")
     stock_movements = relationship("StockMovement", back_populates="product", cascade="all, delete-orphan")
-    __table_args__ = (sa.UniqueConstraint('company_id', 'sku', name='uq_product_company_sku'),)
+    __table_args__ = (
+        sa.UniqueConstraint('company_id', 'sku', name='uq_product_company_sku'),
+        # Trigram indexes serving ProductService.search's ILIKE '%term%' filters and similarity ranking.
+        *(sa.Index(f"ix_products_{column}_trgm", column, postgresql_using="gin", postgresql_ops={column: "gin_trgm_ops"}).ddl_if(dialect="postgresql")
+          for column in ("sku", "name", "barcode")),
+    )
+
+sa.event.listen(Product.__table__, "before_create", sa.DDL("CREATE EXTENSION IF NOT EXISTS pg_trgm").execute_if(dialect="postgresql"))
+
+# SQLite has no pg_trgm: product search there goes through an FTS5 trigram index over the same
+# columns, an external-content table kept in sync with products by triggers.
+# Limitation: the index is keyed on products' implicit rowid (the primary key is a UUID), and
+# VACUUM may renumber the rowids of such a table, leaving the index pointing at the wrong rows.
+# After any VACUUM of a SQLite database, rebuild it from products:
+#     INSERT INTO products_search(products_search) VALUES ('rebuild')
+PRODUCT_SEARCH_FTS_TABLE = "products_search"
+for _statement in (
+    f"CREATE VIRTUAL TABLE {PRODUCT_SEARCH_FTS_TABLE} USING fts5(sku, name, barcode, content='%(table)s', tokenize='trigram')",
+    f"""CREATE TRIGGER {PRODUCT_SEARCH_FTS_TABLE}_ai AFTER INSERT ON %(table)s BEGIN
+        INSERT INTO {PRODUCT_SEARCH_FTS_TABLE}(rowid, sku, name, barcode) VALUES (new.rowid, new.sku, new.name, new.barcode);
+    END""",
+    f"""CREATE TRIGGER {PRODUCT_SEARCH_FTS_TABLE}_ad AFTER DELETE ON %(table)s BEGIN
+        INSERT INTO {PRODUCT_SEARCH_FTS_TABLE}({PRODUCT_SEARCH_FTS_TABLE}, rowid, sku, name, barcode) VALUES ('delete', old.rowid, old.sku, old.name, old.barcode);
+    END""",
+    f"""CREATE TRIGGER {PRODUCT_SEARCH_FTS_TABLE}_au AFTER UPDATE OF sku, name, barcode ON %(table)s BEGIN
+        INSERT INTO {PRODUCT_SEARCH_FTS_TABLE}({PRODUCT_SEARCH_FTS_TABLE}, rowid, sku, name, barcode) VALUES ('delete', old.rowid, old.sku, old.name, old.barcode);
+        INSERT INTO {PRODUCT_SEARCH_FTS_TABLE}(rowid, sku, name, barcode) VALUES (new.rowid, new.sku, new.name, new.barcode);
+    END""",
+):
+    sa.event.listen(Product.__table__, "after_create", sa.DDL(_statement).execute_if(dialect="sqlite"))
 
 class ProductVariant(Base, TimestampMixin):
     __tablename__ = "product_variants"
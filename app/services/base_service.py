@@ -6,14 +6,19 @@ This provides a consistent interface and reusable logic for common CRUD
 operations, reducing boilerplate code in concrete service implementations.
 """
 from __future__ import annotations
-from typing import TYPE_CHECKING, Type, TypeVar, List, Optional, Any, AsyncIterator
+from typing import TYPE_CHECKING, Type, TypeVar, List, Optional, Any, AsyncIterator, Mapping, Sequence
 from uuid import UUID
 import sqlalchemy as sa
 from sqlalchemy.future import select
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.orm.util import identity_key
 from contextlib import asynccontextmanager
 
 from app.core.result import Result, Success, Failure
 from app.core.exceptions import CoreException 
+from app.core.pagination import Page, InvalidCursorError, apply_keyset, cursor_total, page_from_rows
+from app.core.entity_cache import EntityCache, invalidate_on_commit
+from app.core.batch_loader import BatchLoader
 
 if TYPE_CHECKING:
     from app.core.application_core import ApplicationCore
@@ -22,48 +27,124 @@ if TYPE_CHECKING:
 
 ModelType = TypeVar("ModelType", bound="Base")
 
+# Rows per executemany batch in the bulk methods. The driver further splits each batch
+# into multi-row INSERT ... VALUES statements (SQLAlchemy's "insertmanyvalues").
+BULK_BATCH_SIZE = 1000
+
+# Rows fetched per round trip (and yielded per chunk) by stream().
+STREAM_CHUNK_SIZE = 1000
+
+# Dialect-specific INSERT constructs that support ON CONFLICT.
+_UPSERT_INSERTS = {"postgresql": postgresql.insert, "sqlite": sqlite.insert}
+
 class BaseService:
     """
     Implements the Repository pattern for a given SQLAlchemy model.
     Provides generic CRUD operations.
+
+    Services of rarely-changing reference entities set cache_entities = True, so that
+    get_by_id/get_by_ids are served from an EntityCache (see ENTITY_CACHE_* settings).
     """
+    cache_entities: bool = False
+
     def __init__(self, core: "ApplicationCore", model: Type[ModelType]):
         if not isinstance(model, type):
             raise ValueError("Model must be a SQLAlchemy model class.")
         self.core = core
         self.model = model
+        self.entity_cache: Optional[EntityCache] = None
+        if self.cache_entities and core is not None and core.settings.ENTITY_CACHE_ENABLED:
+            self.entity_cache = EntityCache(model, core.settings.ENTITY_CACHE_MAX_ENTRIES, core.settings.ENTITY_CACHE_TTL_SECONDS)
+        self._loader: BatchLoader = BatchLoader(lambda ids, session: self.get_by_ids(ids, session), lambda record: record.id)
 
     @asynccontextmanager
-    async def _get_session_context(self, session: Optional[AsyncSession]) -> AsyncIterator[AsyncSession]:
-        """Provides a session, either the one passed in or a new one."""
+    async def _get_session_context(self, session: Optional[AsyncSession], readonly: bool = False) -> AsyncIterator[AsyncSession]:
+        """
+        Provides a session, either the one passed in or a new one.
+        A new readonly session may be served by the read replica (see ApplicationCore.get_session).
+        """
         if session:
             yield session
         else:
-            async with self.core.get_session() as new_session:
+            async with self.core.get_session(readonly=readonly) as new_session:
                 yield new_session
 
+    async def _get_cached(self, record_id: UUID, session: Optional[AsyncSession]) -> Optional[ModelType]:
+        """
+        Returns the record from the entity cache, or None on a miss. With a session (passed in or
+        the ambient unit of work) the instance is attached to it without a query, so changes to it
+        flush as usual; otherwise it is returned detached, with every column loaded.
+        """
+        active_session = session or self.core.ambient_session
+        if active_session is not None:
+            existing = active_session.identity_map.get(identity_key(self.model, record_id))
+            if existing is not None:
+                return existing
+        instance = self.entity_cache.get(record_id)
+        if instance is None or active_session is None:
+            return instance
+        return await active_session.merge(instance, load=False)
+
     async def get_by_id(self, record_id: UUID, session: Optional[AsyncSession] = None) -> Result[ModelType | None, str]:
         """Fetches a single record by its primary key (ID)."""
         try:
+            if self.entity_cache is not None:
+                cached = await self._get_cached(record_id, session)
+                if cached is not None:
+                    return Success(cached)
             async with self._get_session_context(session) as active_session:
                 record = await active_session.get(self.model, record_id)
+                if record is not None and self.entity_cache is not None:
+                    self.entity_cache.put(record)
                 return Success(record)
         except Exception as e:
             return Failure(f"Database error fetching {self.model.__tablename__} by ID: {e}")
 
-    async def get_by_ids(self, record_ids: List[UUID], session: Optional[AsyncSession] = None) -> Result[List[ModelType], str]:
-        """Fetches multiple records by a list of primary keys (IDs)."""
+    async def get_by_ids(self, record_ids: List[UUID], session: Optional[AsyncSession] = None, bypass_cache: bool = False) -> Result[List[ModelType], str]:
+        """
+        Fetches multiple records by a list of primary keys (IDs). With bypass_cache=True every
+        record is read from the database, overwriting any copy already in the session, for
+        callers that must act on current values (e.g. the prices a sale charges).
+        """
         if not record_ids:
             return Success([])
         try:
+            cached: List[ModelType] = []
+            missing = list(dict.fromkeys(record_ids))
+            if self.entity_cache is not None and not bypass_cache:
+                lookups = [(record_id, await self._get_cached(record_id, session)) for record_id in missing]
+                cached = [record for _, record in lookups if record is not None]
+                missing = [record_id for record_id, record in lookups if record is None]
+            if not missing:
+                return Success(cached)
             async with self._get_session_context(session) as active_session:
-                stmt = select(self.model).where(self.model.id.in_(record_ids))
+                stmt = select(self.model).where(self.model.id.in_(missing))
+                if bypass_cache:
+                    stmt = stmt.execution_options(populate_existing=True)
                 result = await active_session.execute(stmt)
                 records = result.scalars().all()
-                return Success(records)
+                if self.entity_cache is not None:
+                    for record in records:
+                        self.entity_cache.put(record)
+                return Success(cached + list(records))
         except Exception as e:
             return Failure(f"Database error fetching {self.model.__tablename__} by IDs: {e}")
 
+    async def load(self, record_id: UUID, session: Optional[AsyncSession] = None) -> Result[ModelType | None, str]:
+        """
+        Like get_by_id, but every load made in the same event-loop tick (e.g. the branches of an
+        asyncio.gather) is combined into one get_by_ids query. See app.core.batch_loader.
+        """
+        return await self._loader.load(record_id, session or self._ambient_session())
+
+    async def load_many(self, record_ids: List[UUID], session: Optional[AsyncSession] = None) -> Result[List[ModelType | None], str]:
+        """Batched load of several records; values are in id order, None where not found."""
+        return await self._loader.load_many(record_ids, session or self._ambient_session())
+
+    def _ambient_session(self) -> Optional[AsyncSession]:
+        # Resolved before batching so loads from different units of work never share a batch.
+        return self.core.ambient_session if self.core is not None else None
+
     async def get_all(
         self,
         company_id: UUID,
@@ -74,10 +155,14 @@ class BaseService:
         order_by_column: Optional[str] = None,
         **filter_conditions: Any
     ) -> Result[List[ModelType], str]:
-        """Fetches all records for the model with pagination and dynamic filtering."""
+        """
+        Fetches all records for the model with pagination and dynamic filtering.
+        Rows are always ordered (by order_by_column, then id) so that pages are deterministic;
+        prefer get_page for anything a user scrolls through, as OFFSET grows linearly.
+        """
         try:
             async with self._get_session_context(session) as active_session:
-                stmt = select(self.model).where(self.model.company_id == company_id).offset(offset).limit(limit)
+                stmt = select(self.model).where(self.model.company_id == company_id)
                 
                 for key, value in filter_conditions.items():
                     if hasattr(self.model, key):
@@ -88,6 +173,7 @@ class BaseService:
 
                 if order_by_column and hasattr(self.model, order_by_column):
                     stmt = stmt.order_by(getattr(self.model, order_by_column))
+                stmt = stmt.order_by(self.model.id).offset(offset).limit(limit)
 
                 result = await active_session.execute(stmt)
                 records = result.scalars().unique().all()
@@ -95,6 +181,83 @@ class BaseService:
         except Exception as e:
             return Failure(f"Database error fetching all {self.model.__tablename__}: {e}")
 
+    async def stream(
+        self,
+        company_id: UUID,
+        chunk_size: int = STREAM_CHUNK_SIZE,
+        order_by_column: Optional[str] = None,
+        options: Optional[List] = None,
+        session: Optional[AsyncSession] = None,
+        **filter_conditions: Any
+    ) -> AsyncIterator[List[ModelType]]:
+        """
+        Yields every matching record in chunks of up to chunk_size, read through a server-side
+        cursor so memory stays flat however many rows match. For exports and batch jobs:
+
+            async for chunk in service.stream(company_id):
+                ...
+
+        Being a generator it cannot return a Result; database errors are raised to the caller.
+        The session (and its transaction) stays open until iteration finishes.
+        """
+        async with self._get_session_context(session, readonly=True) as active_session:
+            stmt = select(self.model).where(self.model.company_id == company_id)
+            for key, value in filter_conditions.items():
+                if hasattr(self.model, key):
+                    stmt = stmt.where(getattr(self.model, key) == value)
+            if options:
+                stmt = stmt.options(*options)
+            if order_by_column and hasattr(self.model, order_by_column):
+                stmt = stmt.order_by(getattr(self.model, order_by_column))
+
+            result = await active_session.stream(stmt.execution_options(yield_per=chunk_size))
+            async for chunk in result.scalars().partitions():
+                yield chunk
+
+    async def get_page(
+        self,
+        company_id: UUID,
+        limit: int = 100,
+        cursor: Optional[str] = None,
+        order_by_column: str = "id",
+        options: Optional[List] = None,
+        session: Optional[AsyncSession] = None,
+        with_total: bool = False,
+        **filter_conditions: Any
+    ) -> Result[Page[ModelType], str]:
+        """
+        Fetches one keyset page of records ordered by (order_by_column, id). Pass the
+        returned page's next_cursor to fetch the following page; it is None on the last one.
+        order_by_column must be a NOT NULL column. With with_total, the first page's query
+        also counts all matching records into page.total, which the cursors carry forward.
+        """
+        if not hasattr(self.model, order_by_column):
+            return Failure(f"{self.model.__tablename__} has no column '{order_by_column}' to order by.")
+        order_column = getattr(self.model, order_by_column)
+        ordering = f"{self.model.__tablename__}.{order_by_column}"
+        try:
+            async with self._get_session_context(session, readonly=True) as active_session:
+                stmt = select(self.model).where(self.model.company_id == company_id)
+                for key, value in filter_conditions.items():
+                    if hasattr(self.model, key):
+                        stmt = stmt.where(getattr(self.model, key) == value)
+                if options:
+                    stmt = stmt.options(*options)
+                stmt = apply_keyset(stmt, order_column, self.model.id, limit, cursor, ordering, with_total)
+
+                result = await active_session.execute(stmt)
+                rows = result.unique().all()
+                records = [row[0] for row in rows]
+                if cursor:
+                    total = cursor_total(cursor)
+                else:
+                    total = (rows[0][-1] if rows else 0) if with_total else None
+                return Success(page_from_rows(records, limit, ordering, lambda r: (getattr(r, order_by_column), r.id), total))
+        except InvalidCursorError as e:
+            return Failure(str(e))
+        except Exception as e:
+            return Failure(f"Database error fetching a page of {self.model.__tablename__}: {e}")
+
     async def create(self, model_instance: ModelType, session: Optional[AsyncSession] = None) -> Result[ModelType, str]:
         """Saves a new model instance to the database."""
         try:
@@ -108,12 +271,99 @@ class BaseService:
         except Exception as e:
             return Failure(f"Database error creating {self.model.__tablename__}: {e}")
 
+    async def bulk_create(self, rows: Sequence[Mapping[str, Any]], session: Optional[AsyncSession] = None, batch_size: int = BULK_BATCH_SIZE) -> Result[List[UUID], str]:
+        """
+        Inserts many records from column-value dicts in batched multi-row INSERTs and returns
+        their ids in input order. Unlike create, no ORM instances are added to the session
+        or refreshed, so server-side defaults are not loaded back.
+        """
+        return await self._bulk_insert(self.model, rows, session, batch_size)
+
+    async def bulk_update(self, rows: Sequence[Mapping[str, Any]], session: Optional[AsyncSession] = None, batch_size: int = BULK_BATCH_SIZE) -> Result[int, str]:
+        """
+        Updates many records by primary key with an executemany UPDATE. Every dict must contain
+        'id' plus the columns to change. Instances already loaded in the session are not refreshed.
+        """
+        if not rows:
+            return Success(0)
+        try:
+            async with self._get_session_context(session) as active_session:
+                for start in range(0, len(rows), batch_size):
+                    await active_session.execute(sa.update(self.model), list(rows[start:start + batch_size]))
+                if self.entity_cache is not None:
+                    invalidate_on_commit(active_session.sync_session, self.model, [row["id"] for row in rows])
+                return Success(len(rows))
+        except sa.exc.IntegrityError as e:
+            return Failure(f"Data integrity error updating {self.model.__tablename__}: {e.orig}")
+        except Exception as e:
+            return Failure(f"Database error bulk updating {self.model.__tablename__}: {e}")
+
+    async def bulk_upsert(
+        self,
+        rows: Sequence[Mapping[str, Any]],
+        conflict_columns: Sequence[str],
+        update_columns: Optional[Sequence[str]] = None,
+        session: Optional[AsyncSession] = None,
+        batch_size: int = BULK_BATCH_SIZE
+    ) -> Result[List[UUID], str]:
+        """
+        Inserts many records, updating the existing row instead wherever one already matches
+        conflict_columns (which must carry a unique constraint). update_columns defaults to every
+        other column supplied in the rows. Returns the id of each inserted or updated row.
+        """
+        if not rows:
+            return Success([])
+        try:
+            async with self._get_session_context(session) as active_session:
+                dialect = active_session.get_bind().dialect.name
+                if dialect not in _UPSERT_INSERTS:
+                    return Failure(f"Bulk upsert is not supported on the '{dialect}' database.")
+                if update_columns is None:
+                    update_columns = [c for c in rows[0] if c not in conflict_columns and c not in ("id", "created_at")]
+
+                stmt = _UPSERT_INSERTS[dialect](self.model)
+                set_ = {column: stmt.excluded[column] for column in update_columns}
+                if hasattr(self.model, "updated_at"):
+                    set_["updated_at"] = sa.func.now()
+                stmt = stmt.on_conflict_do_update(index_elements=list(conflict_columns), set_=set_).returning(self.model.id, sort_by_parameter_order=True)
+
+                ids: List[UUID] = []
+                for start in range(0, len(rows), batch_size):
+                    result = await active_session.execute(stmt, list(rows[start:start + batch_size]))
+                    ids.extend(result.scalars().all())
+                if self.entity_cache is not None:
+                    invalidate_on_commit(active_session.sync_session, self.model, ids)
+                return Success(ids)
+        except sa.exc.IntegrityError as e:
+            return Failure(f"Data integrity error upserting {self.model.__tablename__}: {e.orig}")
+        except Exception as e:
+            return Failure(f"Database error bulk upserting {self.model.__tablename__}: {e}")
+
+    async def _bulk_insert(self, model: Type[Base], rows: Sequence[Mapping[str, Any]], session: Optional[AsyncSession], batch_size: int) -> Result[List[UUID], str]:
+        """Batched INSERT ... RETURNING id for any model; lets services bulk insert into related tables."""
+        if not rows:
+            return Success([])
+        try:
+            async with self._get_session_context(session) as active_session:
+                stmt = sa.insert(model).returning(model.id, sort_by_parameter_order=True)
+                ids: List[UUID] = []
+                for start in range(0, len(rows), batch_size):
+                    result = await active_session.execute(stmt, list(rows[start:start + batch_size]))
+                    ids.extend(result.scalars().all())
+                return Success(ids)
+        except sa.exc.IntegrityError as e:
+            return Failure(f"Data integrity error creating {model.__tablename__}: Duplicate entry or missing reference. Details: {e.orig}")
+        except Exception as e:
+            return Failure(f"Database error bulk creating {model.__tablename__}: {e}")
+
     async def update(self, model_instance: ModelType, session: Optional[AsyncSession] = None) -> Result[ModelType, str]:
         """Updates an existing model instance in the database."""
         try:
             async with self._get_session_context(session) as active_session:
                 merged_instance = await active_session.merge(model_instance)
                 await active_session.flush()
+                if self.entity_cache is not None:
+                    invalidate_on_commit(active_session.sync_session, self.model, [merged_instance.id])
                 # FIX: Remove the redundant and problematic refresh call.
                 # The merged_instance is already up-to-date within the transaction.
                 return Success(merged_instance)
@@ -127,6 +377,8 @@ class BaseService:
                 record = await active_session.get(self.model, record_id)
                 if record:
                     await active_session.delete(record)
+                    if self.entity_cache is not None:
+                        invalidate_on_commit(active_session.sync_session, self.model, [record_id])
                     return Success(True)
                 return Success(False)
         except sa.exc.IntegrityError as e:
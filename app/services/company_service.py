@@ -42,6 +42,8 @@ class CompanyService(BaseService):
 
 class OutletService(BaseService):
     """Handles database interactions for Outlet models."""
+    cache_entities = True
+
     def __init__(self, core: "ApplicationCore"):
         super().__init__(core, Outlet)
 
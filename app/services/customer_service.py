@@ -15,6 +15,18 @@ if TYPE_CHECKING:
     from app.core.application_core import ApplicationCore
     from sqlalchemy.ext.asyncio import AsyncSession
 
+# Built once with bound parameters; see the note in product_service.
+_SEARCH_ACTIVE = select(Customer).where(
+    Customer.company_id == sa.bindparam("company_id"),
+    Customer.is_active == True,
+    or_(
+        Customer.customer_code.ilike(sa.bindparam("pattern")),
+        Customer.name.ilike(sa.bindparam("pattern")),
+        Customer.email.ilike(sa.bindparam("pattern")),
+        Customer.phone.ilike(sa.bindparam("pattern"))
+    )
+).offset(sa.bindparam("offset", type_=sa.Integer)).limit(sa.bindparam("limit", type_=sa.Integer))
+
 class CustomerService(BaseService):
     """Handles all database interactions for the Customer model."""
 
@@ -52,20 +64,10 @@ class CustomerService(BaseService):
     async def search(self, company_id: UUID, term: str, limit: int = 100, offset: int = 0, session: Optional[AsyncSession] = None) -> Result[List[Customer], str]:
         """Searches for active customers by code, name, email, or phone."""
         try:
-            async with self._get_session_context(session) as active_session:
-                search_pattern = f"%{term}%"
-                stmt = select(self.model).where(
-                    self.model.company_id == company_id,
-                    self.model.is_active == True,
-                    or_(
-                        self.model.customer_code.ilike(search_pattern),
-                        self.model.name.ilike(search_pattern),
-                        self.model.email.ilike(search_pattern),
-                        self.model.phone.ilike(search_pattern)
-                    )
-                ).offset(offset).limit(limit)
-
-                result = await active_session.execute(stmt)
+            async with self._get_session_context(session, readonly=True) as active_session:
+                result = await active_session.execute(_SEARCH_ACTIVE, {
+                    "company_id": company_id, "pattern": f"%{term}%", "offset": offset, "limit": limit,
+                })
                 records = result.scalars().all()
                 return Success(records)
         except Exception as e:
@@ -8,16 +8,33 @@ import sqlalchemy as sa
 from sqlalchemy.future import select
 
 from app.core.result import Result, Success, Failure
+from app.core.pagination import Page, InvalidCursorError, apply_keyset, page_from_rows, pop_total
 from app.models.inventory import Inventory, StockMovement
 from app.models.product import Product
 from app.models.user import User
 from app.models.company import Outlet
-from app.services.base_service import BaseService
+from app.services.base_service import BaseService, BULK_BATCH_SIZE
 
 if TYPE_CHECKING:
     from app.core.application_core import ApplicationCore
     from sqlalchemy.ext.asyncio import AsyncSession
 
+# Hot-path statements, built once with bound parameters (see the note in product_service).
+# "variant_id = NULL" never matches, so products without a variant need their own
+# "IS NULL" form; _stock_statement picks the right one for each call.
+def _stock_where(stmt, with_variant: bool):
+    stmt = stmt.where(Inventory.outlet_id == sa.bindparam("outlet_id"), Inventory.product_id == sa.bindparam("product_id"))
+    return stmt.where(Inventory.variant_id == sa.bindparam("variant_id") if with_variant else Inventory.variant_id.is_(None))
+
+_SELECT_STOCK_LEVEL = {v: _stock_where(select(Inventory.quantity_on_hand), v) for v in (True, False)}
+_LOCK_STOCK_ROW = {v: _stock_where(select(Inventory), v).with_for_update() for v in (True, False)}
+
+def _stock_statement(statements: dict, outlet_id: UUID, product_id: UUID, variant_id: Optional[UUID]):
+    params = {"outlet_id": outlet_id, "product_id": product_id}
+    if variant_id is not None:
+        params["variant_id"] = variant_id
+    return statements[variant_id is not None], params
+
 class InventoryService(BaseService):
     """
     Handles direct database interactions for inventory levels and stock movements.
@@ -29,12 +46,8 @@ class InventoryService(BaseService):
         """Gets the current quantity_on_hand for a product/variant at an outlet."""
         try:
             async with self._get_session_context(session) as active_session:
-                stmt = select(Inventory.quantity_on_hand).where(
-                    Inventory.outlet_id == outlet_id,
-                    Inventory.product_id == product_id,
-                    Inventory.variant_id == variant_id
-                )
-                result = await active_session.execute(stmt)
+                stmt, params = _stock_statement(_SELECT_STOCK_LEVEL, outlet_id, product_id, variant_id)
+                result = await active_session.execute(stmt, params)
                 quantity = result.scalar_one_or_none()
                 return Success(quantity if quantity is not None else Decimal("0"))
         except Exception as e:
@@ -46,13 +59,8 @@ class InventoryService(BaseService):
         This method does not manage its own session.
         """
         try:
-            stmt = select(Inventory).where(
-                Inventory.outlet_id == outlet_id,
-                Inventory.product_id == product_id,
-                Inventory.variant_id == variant_id
-            ).with_for_update()
-            
-            result = await session.execute(stmt)
+            stmt, params = _stock_statement(_LOCK_STOCK_ROW, outlet_id, product_id, variant_id)
+            result = await session.execute(stmt, params)
             inventory_item = result.scalar_one_or_none()
 
             if inventory_item:
@@ -88,10 +96,20 @@ class InventoryService(BaseService):
         except Exception as e:
             return Failure(f"Failed to log stock movement: {e}")
 
-    async def get_inventory_summary(self, company_id: UUID, outlet_id: Optional[UUID], limit: int, offset: int, search_term: Optional[str], session: Optional[AsyncSession] = None) -> Result[List[dict], str]:
-        """Retrieves a summary of inventory levels for display."""
+    async def log_movements(self, movements: List[dict], session: AsyncSession, batch_size: int = BULK_BATCH_SIZE) -> Result[List[UUID], str]:
+        """
+        Logs many stock movement records (as column-value dicts) in batched inserts.
+        MUST be called within an existing transaction.
+        """
+        return await self._bulk_insert(StockMovement, movements, session, batch_size)
+
+    async def get_inventory_summary(self, company_id: UUID, outlet_id: Optional[UUID], limit: int, cursor: Optional[str], search_term: Optional[str], session: Optional[AsyncSession] = None, with_total: bool = False) -> Result[Page[dict], str]:
+        """
+        Retrieves one keyset page (by product name, then id) of inventory levels for display.
+        With with_total, page.total counts every product matching the search term.
+        """
         try:
-            async with self._get_session_context(session) as active_session:
+            async with self._get_session_context(session, readonly=True) as active_session:
                 stmt = select(
                     Product.id.label("product_id"),
                     Product.name.label("product_name"),
@@ -115,9 +133,13 @@ class InventoryService(BaseService):
                         Product.name.ilike(search_pattern)
                     ))
                 
-                stmt = stmt.order_by(Product.name).offset(offset).limit(limit)
+                stmt = apply_keyset(stmt, Product.name, Product.id, limit, cursor, "inventory_summary.name", with_total)
                 result = await active_session.execute(stmt)
-                return Success([row._asdict() for row in result.all()])
+                rows = [row._asdict() for row in result.all()]
+                total = pop_total(rows, cursor) if with_total or cursor else None
+                return Success(page_from_rows(rows, limit, "inventory_summary.name", lambda r: (r["product_name"], r["product_id"]), total))
+        except InvalidCursorError as e:
+            return Failure(str(e))
         except Exception as e:
             return Failure(f"Database error getting inventory summary: {e}")
 
@@ -14,11 +14,19 @@ if TYPE_CHECKING:
     from app.core.application_core import ApplicationCore
     from sqlalchemy.ext.asyncio import AsyncSession
 
+# Built once with bound parameters; see the note in product_service.
+_SELECT_ACTIVE_METHODS = select(PaymentMethod).where(
+    PaymentMethod.company_id == sa.bindparam("company_id"),
+    PaymentMethod.is_active == True
+).order_by(PaymentMethod.name)
+
 class PaymentMethodService(BaseService):
     """
     Handles database interactions for PaymentMethod models.
     Inherits generic CRUD from BaseService.
     """
+    cache_entities = True
+
     def __init__(self, core: "ApplicationCore"):
         super().__init__(core, PaymentMethod)
 
@@ -40,11 +48,7 @@ class PaymentMethodService(BaseService):
         """Fetches all active payment methods for a given company."""
         try:
             async with self._get_session_context(session) as active_session:
-                stmt = select(PaymentMethod).where(
-                    PaymentMethod.company_id == company_id,
-                    PaymentMethod.is_active == True
-                ).order_by(PaymentMethod.name)
-                result = await active_session.execute(stmt)
+                result = await active_session.execute(_SELECT_ACTIVE_METHODS, {"company_id": company_id})
                 methods = result.scalars().all()
                 return Success(methods)
         except Exception as e:
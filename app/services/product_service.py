@@ -1,22 +1,87 @@
 # File: app/services/product_service.py
 """Data Access Service (Repository) for Product entities."""
 from __future__ import annotations
-from typing import TYPE_CHECKING, List, Optional
+from datetime import datetime
+from typing import TYPE_CHECKING, List, Optional, Tuple
 from uuid import UUID
 import sqlalchemy as sa
 from sqlalchemy.future import select
 from sqlalchemy import or_
 
 from app.core.result import Result, Success, Failure
-from app.models.product import Product
+from app.core.pagination import Page, InvalidCursorError, apply_keyset, page_from_rows, pop_total
+from app.models.product import Product, PRODUCT_SEARCH_FTS_TABLE
 from app.services.base_service import BaseService
 
 if TYPE_CHECKING:
     from app.core.application_core import ApplicationCore
     from sqlalchemy.ext.asyncio import AsyncSession
 
+# Hot-path statements are built once with bound parameters instead of on every call.
+# Each execution only binds values; SQLAlchemy reuses the cached compiled form.
+_SELECT_BY_SKU = select(Product).where(
+    Product.company_id == sa.bindparam("company_id"),
+    Product.sku == sa.bindparam("sku")
+)
+_TERM = sa.bindparam("term", type_=sa.String)
+
+# Exact SKU (in any case) or barcode matches sort first: a typed or scanned code beats names containing it.
+_EXACT_MATCH_FIRST = sa.case((or_(sa.func.lower(Product.sku) == sa.func.lower(_TERM), Product.barcode == _TERM), 0), else_=1)
+
+_CONTAINS_TERM = or_(
+    Product.sku.ilike(sa.bindparam("pattern")),
+    Product.name.ilike(sa.bindparam("pattern")),
+    Product.barcode.ilike(sa.bindparam("pattern"))
+)
+
+# PostgreSQL: the pg_trgm GIN indexes serve the ILIKE filters, and trigram similarity ranks the matches.
+_TRIGRAM_SIMILARITY = sa.func.greatest(
+    sa.func.similarity(Product.sku, _TERM),
+    sa.func.similarity(Product.name, _TERM),
+    sa.func.similarity(sa.func.coalesce(Product.barcode, ""), _TERM),
+)
+
+# SQLite: the FTS5 trigram table (see app/models/product.py) finds the same substring matches; bm25 ranks them.
+_FTS_TABLE = sa.table(PRODUCT_SEARCH_FTS_TABLE, sa.column("rowid"))
+_FTS_MATCH = sa.literal_column(PRODUCT_SEARCH_FTS_TABLE).op("MATCH")(sa.bindparam("match", type_=sa.String))
+_FTS_RANK = sa.func.bm25(sa.literal_column(PRODUCT_SEARCH_FTS_TABLE))
+# FTS5 trigram queries need at least this many characters; shorter terms use the plain ILIKE scan.
+_FTS_MIN_TERM_LENGTH = 3
+
+def _search_active(stmt, *rank):
+    return stmt.where(
+        Product.company_id == sa.bindparam("company_id"),
+        Product.is_active == True,
+    ).order_by(_EXACT_MATCH_FIRST, *rank, Product.name, Product.id).offset(
+        sa.bindparam("offset", type_=sa.Integer)
+    ).limit(sa.bindparam("limit", type_=sa.Integer))
+
+def _search_statements(columns):
+    """Ranked search statements selecting columns, by dialect name; None is the unindexed ILIKE fallback."""
+    stmt = select(*columns)
+    fts_join = stmt.join(_FTS_TABLE, _FTS_TABLE.c.rowid == sa.literal_column(f"{Product.__tablename__}.rowid"))
+    return {
+        "postgresql": _search_active(stmt.where(_CONTAINS_TERM), _TRIGRAM_SIMILARITY.desc()),
+        "sqlite": _search_active(fts_join.where(_FTS_MATCH), _FTS_RANK),
+        None: _search_active(stmt.where(_CONTAINS_TERM)),
+    }
+
+# The columns list and search screens show (ProductListItemDTO). Selecting just these skips the
+# wide text columns and builds plain rows instead of entities tracked in the identity map.
+_LIST_COLUMNS = (
+    Product.id, Product.sku, Product.name, Product.barcode,
+    Product.selling_price, Product.cost_price, Product.gst_rate, Product.is_active,
+)
+
+# Names of the _LIST_COLUMNS, in order: the fields of the rows returned by get_catalog_rows.
+CATALOG_FIELDS = tuple(column.key for column in _LIST_COLUMNS)
+
+_SEARCH_ACTIVE = _search_statements((Product,))
+_SEARCH_ACTIVE_ROWS = _search_statements(_LIST_COLUMNS)
+
 class ProductService(BaseService):
     """Handles all database interactions for the Product model."""
+    cache_entities = True
 
     def __init__(self, core: "ApplicationCore"):
         super().__init__(core, Product)
@@ -25,37 +90,80 @@ class ProductService(BaseService):
         """Fetches a product by its unique SKU for a given company."""
         try:
             async with self._get_session_context(session) as active_session:
-                stmt = select(Product).where(
-                    Product.company_id == company_id,
-                    Product.sku == sku
-                )
-                result = await active_session.execute(stmt)
+                result = await active_session.execute(_SELECT_BY_SKU, {"company_id": company_id, "sku": sku})
                 product = result.scalar_one_or_none()
                 return Success(product)
         except Exception as e:
             return Failure(f"Database error fetching product by SKU: {e}")
 
     async def search(self, company_id: UUID, term: str, limit: int = 100, offset: int = 0, session: Optional[AsyncSession] = None) -> Result[List[Product], str]:
-        """Searches for active products by SKU, barcode, or name for a given company."""
+        """
+        Searches for active products whose SKU, barcode, or name contains the term, for a given company.
+        Exact SKU/barcode matches come first, then the closest matches (trigram similarity on
+        PostgreSQL, FTS5 bm25 on SQLite), then by name.
+        """
         try:
-            async with self._get_session_context(session) as active_session:
-                search_pattern = f"%{term}%"
-                stmt = select(self.model).where(
-                    self.model.company_id == company_id,
-                    self.model.is_active == True,
-                    or_(
-                        self.model.sku.ilike(search_pattern),
-                        self.model.name.ilike(search_pattern),
-                        self.model.barcode.ilike(search_pattern)
-                    )
-                ).offset(offset).limit(limit)
-                
-                result = await active_session.execute(stmt)
+            async with self._get_session_context(session, readonly=True) as active_session:
+                result = await self._execute_search(active_session, _SEARCH_ACTIVE, company_id, term, limit, offset)
                 records = result.scalars().all()
                 return Success(records)
         except Exception as e:
             return Failure(f"Database error searching products: {e}")
 
+    async def get_list_rows_page(self, company_id: UUID, limit: int = 100, cursor: Optional[str] = None, session: Optional[AsyncSession] = None, with_total: bool = False) -> Result[Page[dict], str]:
+        """
+        Fetches one keyset page (by name, then id) of product list columns as dicts. Cursors are
+        interchangeable with get_page(order_by_column="name"), as is with_total.
+        """
+        try:
+            async with self._get_session_context(session, readonly=True) as active_session:
+                stmt = apply_keyset(select(*_LIST_COLUMNS).where(Product.company_id == company_id), Product.name, Product.id, limit, cursor, "products.name", with_total)
+                result = await active_session.execute(stmt)
+                rows = [dict(row) for row in result.mappings()]
+                total = pop_total(rows, cursor) if with_total or cursor else None
+                return Success(page_from_rows(rows, limit, "products.name", lambda r: (r["name"], r["id"]), total))
+        except InvalidCursorError as e:
+            return Failure(str(e))
+        except Exception as e:
+            return Failure(f"Database error fetching product list: {e}")
+
+    async def search_list_rows(self, company_id: UUID, term: str, limit: int = 100, offset: int = 0, session: Optional[AsyncSession] = None) -> Result[List[dict], str]:
+        """Like search, but returns only the product list columns as dicts."""
+        try:
+            async with self._get_session_context(session, readonly=True) as active_session:
+                result = await self._execute_search(active_session, _SEARCH_ACTIVE_ROWS, company_id, term, limit, offset)
+                return Success([dict(row) for row in result.mappings()])
+        except Exception as e:
+            return Failure(f"Database error searching products: {e}")
+
+    @staticmethod
+    async def _execute_search(session: AsyncSession, statements: dict, company_id: UUID, term: str, limit: int, offset: int):
+        """Runs the search statement suited to the session's database."""
+        dialect = session.get_bind().dialect.name
+        if dialect not in statements or (dialect == "sqlite" and len(term) < _FTS_MIN_TERM_LENGTH):
+            dialect = None
+        return await session.execute(statements[dialect], {
+            "company_id": company_id, "term": term, "pattern": f"%{term}%",
+            "match": '"' + term.replace('"', '""') + '"', "offset": offset, "limit": limit,
+        })
+
+    async def get_catalog_rows(self, company_id: UUID, updated_since: Optional[datetime] = None, session: Optional[AsyncSession] = None) -> Result[List[Tuple], str]:
+        """
+        Fetches rows for the POS catalog index as tuples of the CATALOG_FIELDS followed by updated_at:
+        every active product, or with updated_since every product changed since then, active or not.
+        """
+        try:
+            async with self._get_session_context(session, readonly=True) as active_session:
+                stmt = select(*_LIST_COLUMNS, Product.updated_at).where(Product.company_id == company_id)
+                if updated_since is None:
+                    stmt = stmt.where(Product.is_active == True)
+                else:
+                    stmt = stmt.where(Product.updated_at >= updated_since)
+                result = await active_session.execute(stmt)
+                return Success([tuple(row) for row in result])
+        except Exception as e:
+            return Failure(f"Database error fetching catalog rows: {e}")
+
     async def create_product(self, product: Product, session: Optional[AsyncSession] = None) -> Result[Product, str]:
         """Saves a new product instance to the database."""
         return await self.create(product, session)
@@ -45,15 +45,16 @@ class PurchaseOrderService(BaseService):
 
     async def get_all_with_supplier(self, company_id: UUID, outlet_id: Optional[UUID] = None, limit: int = 100, offset: int = 0, session: Optional[AsyncSession] = None) -> Result[List[PurchaseOrder], str]:
         """
-        Fetches all purchase orders with their supplier information eagerly loaded
-        using a JOIN for optimal performance.
+        Fetches all purchase orders with their supplier (JOIN) and items (one extra
+        SELECT ... IN) eagerly loaded, so callers can build DTOs after the session closes.
         """
         try:
             async with self._get_session_context(session) as active_session:
                 stmt = select(self.model).where(
                     self.model.company_id == company_id
                 ).options(
-                    joinedload(self.model.supplier)
+                    joinedload(self.model.supplier),
+                    selectinload(self.model.items)
                 ).order_by(
                     self.model.order_date.desc()
                 ).offset(offset).limit(limit)
@@ -7,7 +7,7 @@ directly against the database to generate the raw data needed for business repor
 It primarily uses SQLAlchemy Core for performance-critical aggregation.
 """
 from __future__ import annotations
-from typing import TYPE_CHECKING, List, Dict, Any, Optional
+from typing import TYPE_CHECKING, List, Dict, Any, Optional, AsyncIterator
 from datetime import date, datetime, timedelta, timezone
 from decimal import Decimal
 import uuid
@@ -20,6 +20,9 @@ from app.models import SalesTransaction, SalesTransactionItem, Product, Inventor
 if TYPE_CHECKING:
     from app.core.application_core import ApplicationCore
 
+# Rows fetched per round trip (and yielded per chunk) by the stream_* methods.
+STREAM_CHUNK_SIZE = 2000
+
 class ReportService:
     """Handles all database aggregation queries for reporting."""
 
@@ -29,7 +32,7 @@ class ReportService:
     async def get_dashboard_stats_raw_data(self, company_id: uuid.UUID) -> Result[Dict[str, Any], str]:
         """Fetches raw data points required for the main dashboard KPIs."""
         try:
-            async with self.core.get_session() as session:
+            async with self.core.get_session(readonly=True) as session:
                 today_start = datetime.now(timezone.utc).replace(hour=0, minute=0, second=0, microsecond=0)
                 today_end = today_start + timedelta(days=1)
                 
@@ -84,7 +87,7 @@ class ReportService:
     async def get_sales_summary_raw_data(self, company_id: uuid.UUID, start_date: date, end_date: date) -> Result[List[Dict[str, Any]], str]:
         """Fetches aggregated sales data grouped by day."""
         try:
-            async with self.core.get_session() as session:
+            async with self.core.get_session(readonly=True) as session:
                 end_datetime = datetime.combine(end_date, datetime.max.time())
                 stmt = (
                     sa.select(
@@ -108,7 +111,7 @@ class ReportService:
     async def get_product_performance_raw_data(self, company_id: uuid.UUID, start_date: date, end_date: date, limit: int = 10) -> Result[List[Dict[str, Any]], str]:
         """Fetches product performance data (quantity sold, revenue, cost, margin)."""
         try:
-            async with self.core.get_session() as session:
+            async with self.core.get_session(readonly=True) as session:
                 end_datetime = datetime.combine(end_date, datetime.max.time())
                 stmt = (
                     sa.select(
@@ -133,22 +136,54 @@ class ReportService:
     async def get_inventory_valuation_raw_data(self, company_id: uuid.UUID, outlet_id: Optional[uuid.UUID] = None) -> Result[List[Dict[str, Any]], str]:
         """Fetches raw data for inventory valuation report."""
         try:
-            async with self.core.get_session() as session:
-                stmt = select(
-                    Product.id.label("product_id"), Product.sku, Product.name,
-                    Product.cost_price, Inventory.quantity_on_hand
-                ).join(Inventory, Inventory.product_id == Product.id).where(Product.company_id == company_id)
-                if outlet_id:
-                    stmt = stmt.where(Inventory.outlet_id == outlet_id)
-                result = await session.execute(stmt)
+            async with self.core.get_session(readonly=True) as session:
+                result = await session.execute(self._inventory_valuation_stmt(company_id, outlet_id))
                 return Success([row._asdict() for row in result.all()])
         except Exception as e:
             return Failure(f"Database error generating inventory valuation: {e}")
 
+    def stream_sales_lines(self, company_id: uuid.UUID, start_date: date, end_date: date, chunk_size: int = STREAM_CHUNK_SIZE) -> AsyncIterator[List[Dict[str, Any]]]:
+        """Streams every completed sales line in the period (oldest first) in chunks."""
+        stmt = (
+            sa.select(
+                SalesTransaction.transaction_number, SalesTransaction.transaction_date,
+                Product.sku, Product.name, SalesTransactionItem.quantity, SalesTransactionItem.unit_price,
+                SalesTransactionItem.cost_price, SalesTransactionItem.line_total
+            ).join(SalesTransactionItem, SalesTransactionItem.sales_transaction_id == SalesTransaction.id)
+             .join(Product, SalesTransactionItem.product_id == Product.id)
+             .where(
+                SalesTransaction.company_id == company_id,
+                SalesTransaction.transaction_date >= datetime.combine(start_date, datetime.min.time()),
+                SalesTransaction.transaction_date <= datetime.combine(end_date, datetime.max.time()),
+                SalesTransaction.status == 'COMPLETED'
+             ).order_by(SalesTransaction.transaction_date, SalesTransactionItem.id)
+        )
+        return self._stream_rows(stmt, chunk_size)
+
+    async def _stream_rows(self, stmt: sa.Select, chunk_size: int) -> AsyncIterator[List[Dict[str, Any]]]:
+        """
+        Runs stmt through a server-side cursor and yields its rows as dicts, chunk_size at a
+        time, so only one chunk is held in memory. Database errors are raised to the caller.
+        """
+        async with self.core.get_session(readonly=True) as session:
+            result = await session.stream(stmt.execution_options(yield_per=chunk_size))
+            async for chunk in result.mappings().partitions():
+                yield [dict(row) for row in chunk]
+
+    @staticmethod
+    def _inventory_valuation_stmt(company_id: uuid.UUID, outlet_id: Optional[uuid.UUID]) -> sa.Select:
+        stmt = sa.select(
+            Product.id.label("product_id"), Product.sku, Product.name,
+            Product.cost_price, Inventory.quantity_on_hand
+        ).join(Inventory, Inventory.product_id == Product.id).where(Product.company_id == company_id)
+        if outlet_id:
+            stmt = stmt.where(Inventory.outlet_id == outlet_id)
+        return stmt
+
     async def get_gst_f5_raw_data(self, company_id: uuid.UUID, start_date: date, end_date: date) -> Result[Dict[str, Any], str]:
         """Fetches all necessary data points for the IRAS GST F5 form."""
         try:
-            async with self.core.get_session() as session:
+            async with self.core.get_session(readonly=True) as session:
                 end_datetime = datetime.combine(end_date, datetime.max.time())
                 sales_stmt = (
                     sa.select(
@@ -17,6 +17,8 @@ if TYPE_CHECKING:
 
 class UserService(BaseService):
     """Handles database interactions for the User model."""
+    cache_entities = True
+
     def __init__(self, core: "ApplicationCore"):
         super().__init__(core, User)
 
@@ -105,7 +105,7 @@ class PaymentDialog(QDialog):
                 QMessageBox.warning(self, "Load Failed", f"Could not load payment methods: {result.error}")
                 self.add_payment_button.setEnabled(False)
 
-        coro = self.core.payment_method_service.get_all_active_methods(self.core.current_company_id)
+        coro = self.core.payment_method_manager.get_active_payment_methods(self.core.current_company_id)
         self.core.async_worker.run_task(coro, on_done_callback=_on_done)
 
     @Slot()
@@ -14,7 +14,7 @@ from PySide6.QtWidgets import (
 )
 
 from app.business_logic.dto.inventory_dto import PurchaseOrderCreateDTO, PurchaseOrderItemCreateDTO, SupplierDTO
-from app.business_logic.dto.product_dto import ProductDTO
+from app.business_logic.dto.product_dto import ProductListItemDTO
 from app.core.application_core import ApplicationCore
 from app.core.result import Success, Failure
 from app.core.async_bridge import AsyncWorker
@@ -22,7 +22,7 @@ from app.ui.utils import format_error_for_user
 
 class POLineItem(QObject):
     """Helper class to hold and represent PO line item data for the TableModel."""
-    def __init__(self, product: ProductDTO, parent: Optional[QObject] = None):
+    def __init__(self, product: ProductListItemDTO, parent: Optional[QObject] = None):
         super().__init__(parent)
         self.product = product
         self.quantity: Decimal = Decimal("1.0000")
@@ -25,7 +25,7 @@ from PySide6.QtWidgets import (
 )
 
 from app.business_logic.dto.inventory_dto import StockAdjustmentDTO, StockAdjustmentItemDTO
-from app.business_logic.dto.product_dto import ProductDTO
+from app.business_logic.dto.product_dto import ProductListItemDTO
 from app.core.application_core import ApplicationCore
 from app.core.result import Success, Failure
 from app.core.async_bridge import AsyncWorker
@@ -33,7 +33,7 @@ from app.ui.utils import format_error_for_user
 
 class AdjustmentLineItem(QObject):
     """Helper class to hold and represent adjustment line item data for the TableModel."""
-    def __init__(self, product: ProductDTO, system_qty: Decimal, parent: Optional[QObject] = None):
+    def __init__(self, product: ProductListItemDTO, system_qty: Decimal, parent: Optional[QObject] = None):
         super().__init__(parent)
         self.product = product
         self.system_qty = system_qty
@@ -153,7 +153,7 @@ class StockAdjustmentDialog(QDialog):
                 user_friendly_error = format_error_for_user(error or result)
                 QMessageBox.warning(self, "Product Lookup Failed", f"Could not find product: {user_friendly_error}"); return
             if isinstance(result, Success):
-                products: List[ProductDTO] = result.value
+                products: List[ProductListItemDTO] = result.value
                 if not products: QMessageBox.warning(self, "Not Found", f"No product found for '{search_term}'."); return
                 p = products[0]
                 def _on_stock_fetch_done(stock_res, stock_err):
@@ -5,28 +5,25 @@ This QMainWindow acts as the shell, hosting different views like the POS screen,
 inventory management, etc., and providing navigation.
 
 This version implements lazy loading for all non-default views to improve
-startup performance.
+startup performance: their modules (and the dialogs and libraries they pull in)
+are only imported the first time the view is shown.
 """
 import sys
-from typing import Dict, Optional, Type
+import importlib
+import time
+from typing import Dict, Optional, Any
 
 from PySide6.QtWidgets import (
-    QMainWindow, QWidget,
-    QStackedWidget, QMenuBar
+    QMainWindow,
+    QStackedWidget, QMenuBar, QMessageBox, QApplication, QLabel
 )
 from PySide6.QtCore import Slot, QEvent
 
 from app.core.application_core import ApplicationCore
 from app.core.async_bridge import AsyncWorker
 
-# Import all view classes that will be lazy-loaded
+# Only the default view is imported eagerly; the others are listed in MainWindow.views.
 from app.ui.views.pos_view import POSView
-from app.ui.views.dashboard_view import DashboardView
-from app.ui.views.product_view import ProductView
-from app.ui.views.customer_view import CustomerView
-from app.ui.views.inventory_view import InventoryView
-from app.ui.views.reports_view import ReportsView
-from app.ui.views.settings_view import SettingsView
 
 class MainWindow(QMainWindow):
     """The main application window."""
@@ -41,27 +38,45 @@ class MainWindow(QMainWindow):
         self.setCentralWidget(self.stacked_widget)
 
         # --- Lazy Loading Implementation ---
-        # 1. A dictionary to hold view definitions and cache instances
-        self.views: Dict[str, Dict[str, Optional[Type[QWidget]]]] = {
-            "dashboard": {"class": DashboardView, "instance": None},
-            "product":   {"class": ProductView,   "instance": None},
-            "customer":  {"class": CustomerView,  "instance": None},
-            "inventory": {"class": InventoryView, "instance": None},
-            "reports":   {"class": ReportsView,   "instance": None},
-            "settings":  {"class": SettingsView,  "instance": None},
+        # 1. A registry of view modules and class names; instances are cached on first use
+        self.views: Dict[str, Dict[str, Any]] = {
+            "dashboard": {"module": "app.ui.views.dashboard_view", "class": "DashboardView", "instance": None},
+            "product":   {"module": "app.ui.views.product_view",   "class": "ProductView",   "instance": None},
+            "customer":  {"module": "app.ui.views.customer_view",  "class": "CustomerView",  "instance": None},
+            "inventory": {"module": "app.ui.views.inventory_view", "class": "InventoryView", "instance": None},
+            "reports":   {"module": "app.ui.views.reports_view",   "class": "ReportsView",   "instance": None},
+            "settings":  {"module": "app.ui.views.settings_view",  "class": "SettingsView",  "instance": None},
         }
 
         # 2. Eagerly create and show only the default view
+        started = time.perf_counter()
         self.pos_view = POSView(self.core)
+        self.core.record_startup_phase("pos_view", started)
         self.stacked_widget.addWidget(self.pos_view)
         self.stacked_widget.setCurrentWidget(self.pos_view)
         
         # 3. Create the menu, which will connect actions to the lazy loader
         self._create_menu()
 
+        # 4. With a staged startup the database may still be connecting: keep POS actions
+        #    and data screens disabled until the core reports ready (see on_core_ready).
+        if not self.core.is_ready:
+            self._set_core_actions_enabled(False)
+            self.statusBar().showMessage("Connecting to database...")
+
+        # Show a busy state while any lane is refusing work, instead of letting clicks pile up.
+        # It has its own label so it never replaces (or clears) other status messages.
+        self._saturated_lanes = set()
+        self.busy_label = QLabel()
+        self.busy_label.hide()
+        self.statusBar().addPermanentWidget(self.busy_label)
+        for worker in self.core.async_worker_pool.workers.values():
+            worker.saturation_changed.connect(self._on_saturation_changed)
+
     def _create_menu(self):
         """Creates the main menu bar with navigation actions wired for lazy loading."""
         menu_bar = self.menuBar()
+        self._core_menus = []
         
         file_menu = menu_bar.addMenu("&File")
         file_menu.addAction("E&xit", self.close)
@@ -85,6 +100,32 @@ class MainWindow(QMainWindow):
         settings_menu = menu_bar.addMenu("&Settings")
         settings_menu.addAction("Application Settings", lambda: self._show_view("settings"))
 
+        # Every menu except File opens a screen that needs the database.
+        self._core_menus = [dashboard_menu, pos_menu, data_menu, inventory_menu, reports_menu, settings_menu]
+
+    def _set_core_actions_enabled(self, enabled: bool):
+        for menu in self._core_menus:
+            menu.menuAction().setEnabled(enabled)
+        self.pos_view.set_actions_enabled(enabled)
+
+    def on_core_ready(self, error: Optional[Exception]):
+        """
+        Called on the main thread when ApplicationCore.initialize_async finishes. Enables
+        the POS and shows the startup phase timings, or reports the failure and exits.
+        """
+        if error is not None:
+            QMessageBox.critical(
+                self,
+                "SG-POS Startup Error",
+                f"A critical error occurred during startup:\n\n{error}\n\nThe application will now exit."
+            )
+            QApplication.exit(1)
+            return
+
+        self._set_core_actions_enabled(True)
+        timings = ", ".join(f"{phase.replace('_', ' ')} {ms:.0f} ms" for phase, ms in self.core.startup_timings.items())
+        self.statusBar().showMessage(f"Ready ({timings})", 15000)
+
     def _show_view(self, view_key: str):
         """
         Generic handler for showing a view. Creates the view on first request.
@@ -97,15 +138,26 @@ class MainWindow(QMainWindow):
 
         view_info = self.views[view_key]
         
-        # If the view instance hasn't been created yet, create and cache it
+        # If the view instance hasn't been created yet, import its module, then create and cache it
         if view_info["instance"] is None:
-            view_class = view_info["class"]
+            view_class = getattr(importlib.import_module(view_info["module"]), view_info["class"])
             view_info["instance"] = view_class(self.core)
             self.stacked_widget.addWidget(view_info["instance"])
 
         # Set the current widget to the now-guaranteed-to-exist instance
         self.stacked_widget.setCurrentWidget(view_info["instance"])
 
+    @Slot(str, bool)
+    def _on_saturation_changed(self, lane: str, saturated: bool):
+        """Shows a status bar notice while a worker lane is saturated."""
+        if saturated:
+            self._saturated_lanes.add(lane)
+        else:
+            self._saturated_lanes.discard(lane)
+
+        self.busy_label.setText(f"System busy ({', '.join(sorted(self._saturated_lanes))}) - please wait...")
+        self.busy_label.setVisible(bool(self._saturated_lanes))
+
     def closeEvent(self, event: QEvent) -> None:
         """Handles window close event to gracefully shut down the application core."""
         if self.core:
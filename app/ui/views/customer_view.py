@@ -1,33 +1,28 @@
 # File: app/ui/views/customer_view.py
 """The main view for managing customers."""
 import uuid
-from typing import List, Any, Optional
+from typing import Any, Optional
 
 from PySide6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QPushButton, QTableView,
     QMessageBox, QLineEdit, QHeaderView, QSizePolicy
 )
-from PySide6.QtCore import Slot, Signal, QAbstractTableModel, QModelIndex, Qt, QObject, QTimer
+from PySide6.QtCore import Slot, Signal, QModelIndex, Qt, QObject, QTimer
 
 from app.core.application_core import ApplicationCore
 from app.core.result import Success, Failure
+from app.core.pagination import Page
 from app.business_logic.dto.customer_dto import CustomerDTO
 from app.ui.dialogs.customer_dialog import CustomerDialog
 from app.core.async_bridge import AsyncWorker
 from app.ui.widgets.managed_table_view import ManagedTableView
+from app.ui.widgets.paged_table_model import PagedTableModel
 
-class CustomerTableModel(QAbstractTableModel):
-    """A Qt Table Model for displaying CustomerDTOs."""
+class CustomerTableModel(PagedTableModel):
+    """A Qt Table Model for displaying CustomerDTOs, fetched page by page as the user scrolls."""
     
     HEADERS = ["Code", "Name", "Email", "Phone", "Loyalty Points", "Credit Limit", "Active"]
 
-    def __init__(self, customers: List[CustomerDTO], parent: Optional[QObject] = None):
-        super().__init__(parent)
-        self._customers = customers
-
-    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
-        return len(self._customers)
-
     def columnCount(self, parent: QModelIndex = QModelIndex()) -> int:
         return len(self.HEADERS)
 
@@ -40,7 +35,7 @@ class CustomerTableModel(QAbstractTableModel):
         if not index.isValid():
             return None
         
-        customer = self._customers[index.row()]
+        customer = self._rows[index.row()]
         col = index.column()
 
         if role == Qt.ItemDataRole.DisplayRole:
@@ -62,15 +57,7 @@ class CustomerTableModel(QAbstractTableModel):
 
     def get_customer_at_row(self, row: int) -> Optional[CustomerDTO]:
         """Returns the CustomerDTO at the given row index."""
-        if 0 <= row < len(self._customers):
-            return self._customers[row]
-        return None
-
-    def refresh_data(self, new_customers: List[CustomerDTO]):
-        """Updates the model with new data and notifies views."""
-        self.beginResetModel()
-        self._customers = new_customers
-        self.endResetModel()
+        return self.row_at(row)
 
 class CustomerView(QWidget):
     """A view widget to display and manage the customer list."""
@@ -130,6 +117,7 @@ class CustomerView(QWidget):
         # REFACTOR: Connect search input to the timer for debouncing
         self.search_input.textChanged.connect(self.search_timer.start)
         self.search_timer.timeout.connect(self._trigger_search)
+        self.customer_model.fetch_more_requested.connect(self._load_more_customers)
         
         self.managed_table.table().doubleClicked.connect(self._on_edit_customer)
 
@@ -158,15 +146,30 @@ class CustomerView(QWidget):
                 self.managed_table.show_empty(f"Error loading customers: {error or result.error}")
                 QMessageBox.critical(self, "Load Error", f"Failed to load customers: {error or result.error}")
             elif isinstance(result, Success):
-                customers = result.value
-                self.customer_model.refresh_data(customers)
-                if customers:
+                # Searches return a list; the full customer list is paged (see _load_more_customers).
+                page = result.value if isinstance(result.value, Page) else Page(result.value)
+                self.customer_model.refresh_page(page)
+                if page.items:
                     self.managed_table.show_table()
                 else:
                     self.managed_table.show_empty("No customers found.")
         
         coro = self.core.customer_manager.search_customers(company_id, search_term) if search_term else self.core.customer_manager.get_all_customers(company_id)
-        self.async_worker.run_task(coro, on_done_callback=_on_done)
+        # A newer keystroke supersedes (and cancels) any load still in flight.
+        self.async_worker.run_latest("customer_view.load", coro, on_done_callback=_on_done)
+
+    @Slot(str)
+    def _load_more_customers(self, cursor: str):
+        """Appends the next page of customers when the table is scrolled to the end."""
+        def _on_done(result: Any, error: Optional[Exception]):
+            if error or isinstance(result, Failure):
+                self.customer_model.fetch_failed()
+                QMessageBox.critical(self, "Load Error", f"Failed to load more customers: {error or result.error}")
+            elif isinstance(result, Success):
+                self.customer_model.append_page(result.value)
+
+        # Shares the load key, so a new search cancels a page still in flight.
+        self.async_worker.run_latest("customer_view.load", self.core.customer_manager.get_all_customers(self.core.current_company_id, cursor=cursor), on_done_callback=_on_done)
 
     @Slot()
     def _on_add_customer(self):
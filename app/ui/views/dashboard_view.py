@@ -11,6 +11,7 @@ from PySide6.QtCore import Qt, QObject, Slot
 
 from app.core.application_core import ApplicationCore
 from app.core.result import Success, Failure
+from app.core.async_bridge import TaskLane, TaskPriority
 from app.business_logic.dto.reporting_dto import DashboardStatsDTO
 from app.ui.widgets.kpi_widget import KpiWidget
 
@@ -20,7 +21,7 @@ class DashboardView(QWidget):
     def __init__(self, core: ApplicationCore, parent: Optional[QObject] = None):
         super().__init__(parent)
         self.core = core
-        self.async_worker = core.async_worker
+        self.async_worker = core.get_async_worker(TaskLane.BACKGROUND)
         
         self._setup_ui()
         self._connect_signals()
@@ -91,4 +92,4 @@ class DashboardView(QWidget):
                 self.low_stock_kpi.set_kpi_value(f"{stats.low_stock_item_count}")
         
         coro = self.core.reporting_manager.generate_dashboard_stats(self.core.current_company_id)
-        self.core.async_worker.run_task(coro, on_done_callback=on_done)
+        self.async_worker.run_task(coro, on_done_callback=on_done, priority=TaskPriority.BACKGROUND)
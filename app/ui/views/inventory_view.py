@@ -14,23 +14,22 @@ from PySide6.QtGui import QAction, QCursor
 
 from app.core.application_core import ApplicationCore
 from app.core.result import Success, Failure
-from app.business_logic.dto.inventory_dto import InventorySummaryDTO, PurchaseOrderDTO, StockMovementDTO
+from app.business_logic.dto.inventory_dto import PurchaseOrderDTO, StockMovementDTO
 from app.ui.dialogs.stock_adjustment_dialog import StockAdjustmentDialog
 from app.ui.dialogs.purchase_order_dialog import PurchaseOrderDialog
 from app.ui.dialogs.receive_po_dialog import ReceivePODialog
 from app.core.async_bridge import AsyncWorker
 from app.ui.widgets.managed_table_view import ManagedTableView
+from app.ui.widgets.paged_table_model import PagedTableModel
 
-class InventoryTableModel(QAbstractTableModel):
+class InventoryTableModel(PagedTableModel):
     HEADERS = ["SKU", "Name", "Category", "On Hand", "Reorder Pt.", "Cost", "Selling Price", "Active"]
-    def __init__(self, items: List[InventorySummaryDTO], parent: Optional[QObject] = None): super().__init__(parent); self._items = items
-    def rowCount(self, p=QModelIndex()): return len(self._items)
     def columnCount(self, p=QModelIndex()): return len(self.HEADERS)
     def headerData(self, s, o, r=Qt.DisplayRole):
         if r == Qt.DisplayRole and o == Qt.Horizontal: return self.HEADERS[s]
     def data(self, i, r=Qt.DisplayRole):
         if not i.isValid(): return
-        item = self._items[i.row()]
+        item = self._rows[i.row()]
         col = i.column()
         if r == Qt.DisplayRole:
             if col == 0: return item.sku
@@ -45,8 +44,7 @@ class InventoryTableModel(QAbstractTableModel):
         if r == Qt.TextAlignmentRole:
             if col in [3, 4, 5, 6]: return Qt.AlignRight | Qt.AlignVCenter
             if col == 7: return Qt.AlignCenter
-    def get_item_at_row(self, r): return self._items[r] if 0 <= r < len(self._items) else None
-    def refresh_data(self, new_items): self.beginResetModel(); self._items = new_items; self.endResetModel()
+    def get_item_at_row(self, r): return self.row_at(r)
 
 class PurchaseOrderTableModel(QAbstractTableModel):
     HEADERS = ["PO Number", "Supplier", "Order Date", "Expected", "Total (S$)", "Status"]
@@ -107,6 +105,7 @@ class InventoryView(QWidget):
         self.inventory_search_timer = QTimer(self)
         self.inventory_search_timer.setSingleShot(True)
         self.inventory_search_timer.setInterval(350)
+        self._inventory_search_term = ""
 
         self._setup_ui()
         self._connect_signals()
@@ -182,6 +181,7 @@ class InventoryView(QWidget):
         
         self.inventory_search_input.textChanged.connect(self.inventory_search_timer.start)
         self.inventory_search_timer.timeout.connect(self._trigger_inventory_search)
+        self.inventory_model.fetch_more_requested.connect(self._load_more_inventory)
 
         self.adjust_stock_button.clicked.connect(self._on_adjust_stock)
         self.inventory_managed_table.table().doubleClicked.connect(self._on_view_product_stock_history)
@@ -204,14 +204,27 @@ class InventoryView(QWidget):
 
     def _load_inventory_summary(self, search_term: str = ""):
         self.inventory_managed_table.show_loading()
+        self._inventory_search_term = search_term # Later pages continue the same search.
         def _on_done(r, e):
             if e or isinstance(r, Failure):
                 self.inventory_model.refresh_data([])
                 self.inventory_managed_table.show_empty(f"Error: {e or r.error}")
             elif isinstance(r, Success):
-                self.inventory_model.refresh_data(r.value)
-                self.inventory_managed_table.show_table() if r.value else self.inventory_managed_table.show_empty("No inventory items found.")
-        self.async_worker.run_task(self.core.inventory_manager.get_inventory_summary(self.company_id, self.outlet_id, search_term=search_term), on_done_callback=_on_done)
+                self.inventory_model.refresh_page(r.value)
+                self.inventory_managed_table.show_table() if r.value.items else self.inventory_managed_table.show_empty("No inventory items found.")
+        # A newer keystroke supersedes (and cancels) any load still in flight.
+        self.async_worker.run_latest("inventory_view.summary", self.core.inventory_manager.get_inventory_summary(self.company_id, self.outlet_id, search_term=search_term), on_done_callback=_on_done)
+
+    @Slot(str)
+    def _load_more_inventory(self, cursor: str):
+        def _on_done(r, e):
+            if e or isinstance(r, Failure):
+                self.inventory_model.fetch_failed()
+                QMessageBox.critical(self, "Load Error", f"Failed to load more inventory: {e or r.error}")
+            elif isinstance(r, Success):
+                self.inventory_model.append_page(r.value)
+        coro = self.core.inventory_manager.get_inventory_summary(self.company_id, self.outlet_id, cursor=cursor, search_term=self._inventory_search_term)
+        self.async_worker.run_latest("inventory_view.summary", coro, on_done_callback=_on_done)
 
     @Slot()
     def _on_adjust_stock(self):
@@ -14,14 +14,13 @@ from PySide6.QtCore import Slot, Signal, QAbstractTableModel, QModelIndex, Qt, Q
 from app.core.application_core import ApplicationCore
 from app.core.result import Result, Success, Failure
 from app.business_logic.dto.sales_dto import SaleCreateDTO, FinalizedSaleDTO
-from app.business_logic.dto.product_dto import ProductDTO, ProductBaseDTO
+from app.business_logic.dto.product_dto import ProductListItemDTO, ProductBaseDTO
 from app.business_logic.dto.customer_dto import CustomerDTO
-from app.ui.dialogs.payment_dialog import PaymentDialog
-from app.core.async_bridge import AsyncWorker
+from app.core.async_bridge import AsyncWorker, TaskPriority
 
 class CartItemDisplay(QObject):
     """Helper class to hold and represent cart item data for the TableModel."""
-    def __init__(self, product: ProductDTO, quantity: Decimal, parent: Optional[QObject] = None):
+    def __init__(self, product: ProductListItemDTO, quantity: Decimal, parent: Optional[QObject] = None):
         super().__init__(parent)
         self.product = product
         self.quantity = quantity
@@ -36,7 +35,7 @@ class CartItemDisplay(QObject):
         return {
             "product_id": self.product.id,
             "quantity": self.quantity,
-            "unit_price_override": self.product.selling_price,
+            "unit_price_override": None, # Charge the price finalize_sale reads, not the possibly stale cart row.
             "variant_id": None, # TODO: Handle variants
             "sku": self.product.sku,
             "product": self.product
@@ -88,7 +87,7 @@ class CartTableModel(QAbstractTableModel):
         flags = super().flags(index)
         if index.column() == self.COLUMN_QTY: flags |= Qt.ItemFlag.ItemIsEditable
         return flags
-    def add_item(self, product_dto: ProductDTO, quantity: Decimal = Decimal("1")):
+    def add_item(self, product_dto: ProductListItemDTO, quantity: Decimal = Decimal("1")):
         for item_display in self._items:
             if item_display.product.id == product_dto.id:
                 item_display.quantity += quantity
@@ -101,6 +100,19 @@ class CartTableModel(QAbstractTableModel):
         self._items.append(CartItemDisplay(product_dto, quantity))
         self.endInsertRows()
         self.cart_changed.emit()
+    def reprice(self, current: List[ProductListItemDTO]) -> bool:
+        """Replaces the cart rows' product data with current rows; True if any line's price or tax changed."""
+        by_id = {product.id: product for product in current}
+        changed = False
+        for row, item in enumerate(self._items):
+            product = by_id.get(item.product.id)
+            if product is None: continue
+            if (product.selling_price, product.gst_rate) != (item.product.selling_price, item.product.gst_rate): changed = True
+            item.product = product; item.recalculate()
+            self.dataChanged.emit(self.createIndex(row, 0), self.createIndex(row, self.columnCount() - 1))
+        if changed: self.cart_changed.emit()
+        return changed
+    def product_ids(self) -> List[uuid.UUID]: return [item.product.id for item in self._items]
     def clear_cart(self):
         self.beginResetModel(); self._items.clear(); self.endResetModel(); self.cart_changed.emit()
     def get_cart_summary(self) -> Tuple[Decimal, Decimal, Decimal]:
@@ -156,6 +168,14 @@ class POSView(QWidget):
         self.void_sale_button.clicked.connect(self._void_sale_clicked); self.cart_model.cart_changed.connect(self._update_totals)
         self.select_customer_button.clicked.connect(self._on_select_customer_clicked); self.clear_customer_button.clicked.connect(self._clear_customer_selection)
 
+    def set_actions_enabled(self, enabled: bool):
+        """Enables or disables every control that needs the database (used while the core is still starting)."""
+        for widget in (self.product_search_input, self.add_item_button, self.customer_search_input, self.select_customer_button,
+                       self.clear_customer_button, self.new_sale_button, self.void_sale_button, self.pay_button, self.cart_table):
+            widget.setEnabled(enabled)
+        if enabled:
+            self.product_search_input.setFocus()
+
     @Slot()
     def _update_totals(self):
         subtotal, tax_amount, total_amount = self.cart_model.get_cart_summary()
@@ -171,6 +191,9 @@ class POSView(QWidget):
     def _on_add_item_clicked(self):
         search_term = self.product_search_input.text().strip();
         if not search_term: return
+        scanned = self.core.product_manager.find_scanned_product(search_term)
+        if scanned: # Exact barcode/SKU: resolved from the in-memory catalog index, no database round trip.
+            self.cart_model.add_item(scanned); self.product_search_input.clear(); self.product_search_input.setFocus(); return
         def _on_done(result: Any, error: Optional[Exception]):
             if error or isinstance(result, Failure):
                 QMessageBox.warning(self, "Product Lookup Failed", f"Could not find product: {error or result.error}")
@@ -185,6 +208,7 @@ class POSView(QWidget):
     def _on_pay_clicked(self):
         if not self.cart_model.rowCount(): QMessageBox.warning(self, "Empty Cart", "Cannot process payment for an empty cart."); return
         _, _, total_amount = self.cart_model.get_cart_summary()
+        from app.ui.dialogs.payment_dialog import PaymentDialog # Deferred: only needed once a sale is tendered.
         payment_dialog = PaymentDialog(self.core, total_amount, parent=self)
         if payment_dialog.exec():
             payment_info_dtos = payment_dialog.get_payment_info()
@@ -197,16 +221,30 @@ class POSView(QWidget):
             def _on_done(result: Any, error: Optional[Exception]):
                 self.pay_button.setEnabled(True)
                 if error or isinstance(result, Failure):
-                    QMessageBox.warning(self, "Sale Failed", f"Could not finalize sale: {error or result.error}")
+                    self._reprice_cart_after_failure(f"Could not finalize sale: {error or result.error}")
                 elif isinstance(result, Success):
                     finalized_dto: FinalizedSaleDTO = result.value
                     QMessageBox.information(self, "Sale Completed", f"Transaction {finalized_dto.transaction_number} completed!\nTotal: S${finalized_dto.total_amount:.2f}\nChange Due: S${finalized_dto.change_due:.2f}")
                     self._reset_sale_clicked()
             self.pay_button.setEnabled(False)
-            self.async_worker.run_task(self.core.sales_manager.finalize_sale(sale_create_dto), on_done_callback=_on_done)
+            self.async_worker.run_task(self.core.sales_manager.finalize_sale(sale_create_dto), on_done_callback=_on_done, priority=TaskPriority.CRITICAL)
         else:
             QMessageBox.information(self, "Payment Cancelled", "Payment process cancelled.")
 
+    def _reprice_cart_after_failure(self, message: str):
+        """
+        The sale is charged at the database price, while cart rows (often from the catalog index)
+        may predate a price change. Re-reads the cart's products; if any price moved, the cart
+        shows the new total so the cashier can tender again.
+        """
+        def _on_done(result: Any, error: Optional[Exception]):
+            if isinstance(result, Success) and self.cart_model.reprice(result.value):
+                _, _, total_amount = self.cart_model.get_cart_summary()
+                QMessageBox.warning(self, "Prices Changed", f"{message}\n\nPrices changed since the items were scanned; the cart has been updated.\nNew total: S${total_amount:.2f}")
+            else:
+                QMessageBox.warning(self, "Sale Failed", message)
+        self.async_worker.run_task(self.core.product_manager.get_current_list_items(self.cart_model.product_ids()), on_done_callback=_on_done)
+
     @Slot()
     def _reset_sale_clicked(self):
         self.cart_model.clear_cart(); self.product_search_input.clear(); self._clear_customer_selection(); self.product_search_input.setFocus()
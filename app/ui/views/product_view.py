@@ -1,33 +1,28 @@
 # File: app/ui/views/product_view.py
 """The main view for managing products."""
 from __future__ import annotations
-from typing import List, Any, Optional
+from typing import Any, Optional
 from decimal import Decimal
 
 from PySide6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QPushButton, QTableView,
     QMessageBox, QLineEdit, QHeaderView, QSizePolicy
 )
-from PySide6.QtCore import Slot, Signal, QAbstractTableModel, QModelIndex, Qt, QObject, QTimer
+from PySide6.QtCore import Slot, Signal, QModelIndex, Qt, QObject, QTimer
 
 from app.core.application_core import ApplicationCore
 from app.core.result import Success, Failure
-from app.business_logic.dto.product_dto import ProductDTO
+from app.core.pagination import Page
+from app.business_logic.dto.product_dto import ProductListItemDTO
 from app.ui.dialogs.product_dialog import ProductDialog
 from app.core.async_bridge import AsyncWorker
 from app.ui.widgets.managed_table_view import ManagedTableView
+from app.ui.widgets.paged_table_model import PagedTableModel
 
-class ProductTableModel(QAbstractTableModel):
-    """A Qt Table Model for displaying ProductDTOs."""
+class ProductTableModel(PagedTableModel):
+    """A Qt Table Model for displaying product list rows, fetched page by page as the user scrolls."""
     HEADERS = ["SKU", "Name", "Selling Price", "Cost Price", "GST Rate", "Active"]
 
-    def __init__(self, products: List[ProductDTO] = None, parent: Optional[QObject] = None):
-        super().__init__(parent)
-        self._products = products or []
-
-    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
-        return len(self._products)
-
     def columnCount(self, parent: QModelIndex = QModelIndex()) -> int:
         return len(self.HEADERS)
 
@@ -38,7 +33,7 @@ class ProductTableModel(QAbstractTableModel):
 
     def data(self, index: QModelIndex, role: int = Qt.DisplayRole) -> Any:
         if not index.isValid(): return None
-        product = self._products[index.row()]
+        product = self._rows[index.row()]
         col = index.column()
         if role == Qt.DisplayRole:
             if col == 0: return product.sku
@@ -52,13 +47,8 @@ class ProductTableModel(QAbstractTableModel):
             if col == 5: return Qt.AlignCenter
         return None
 
-    def get_product_at_row(self, row: int) -> Optional[ProductDTO]:
-        return self._products[row] if 0 <= row < len(self._products) else None
-
-    def refresh_data(self, new_products: List[ProductDTO]):
-        self.beginResetModel()
-        self._products = new_products
-        self.endResetModel()
+    def get_product_at_row(self, row: int) -> Optional[ProductListItemDTO]:
+        return self.row_at(row)
 
 class ProductView(QWidget):
     """A view widget to display and manage the product catalog."""
@@ -111,10 +101,11 @@ class ProductView(QWidget):
         self.delete_button.clicked.connect(self._on_deactivate_product)
         self.search_input.textChanged.connect(self.search_timer.start)
         self.search_timer.timeout.connect(self._load_products)
+        self.product_model.fetch_more_requested.connect(self._load_more_products)
         # Connect to the table inside the managed widget
         self.managed_table.table().doubleClicked.connect(self._on_edit_product)
 
-    def _get_selected_product(self) -> Optional[ProductDTO]:
+    def _get_selected_product(self) -> Optional[ProductListItemDTO]:
         selected_indexes = self.managed_table.table().selectionModel().selectedRows()
         return self.product_model.get_product_at_row(selected_indexes[0].row()) if selected_indexes else None
 
@@ -139,15 +130,30 @@ class ProductView(QWidget):
                 self.product_model.refresh_data([])
                 self.managed_table.show_empty(f"Error: {error or result.error}")
             elif isinstance(result, Success):
-                products = result.value
-                self.product_model.refresh_data(products)
-                if products:
+                # Searches return a list; the full catalogue is paged (see _load_more_products).
+                page = result.value if isinstance(result.value, Page) else Page(result.value)
+                self.product_model.refresh_page(page)
+                if page.items:
                     self.managed_table.show_table()
                 else:
                     self.managed_table.show_empty("No products found.")
         
         coro = self.core.product_manager.search_products(self.core.current_company_id, search_term) if search_term else self.core.product_manager.get_all_products(self.core.current_company_id)
-        self.async_worker.run_task(coro, on_done_callback=_on_done)
+        # A newer keystroke supersedes (and cancels) any load still in flight.
+        self.async_worker.run_latest("product_view.load", coro, on_done_callback=_on_done)
+
+    @Slot(str)
+    def _load_more_products(self, cursor: str):
+        """Appends the next page of the catalogue when the table is scrolled to the end."""
+        def _on_done(result: Any, error: Optional[Exception]):
+            if error or isinstance(result, Failure):
+                self.product_model.fetch_failed()
+                QMessageBox.critical(self, "Load Error", f"Failed to load more products: {error or result.error}")
+            elif isinstance(result, Success):
+                self.product_model.append_page(result.value)
+
+        # Shares the load key, so a new search cancels a page still in flight.
+        self.async_worker.run_latest("product_view.load", self.core.product_manager.get_all_products(self.core.current_company_id, cursor=cursor), on_done_callback=_on_done)
 
     @Slot()
     def _on_add_product(self):
@@ -161,9 +167,16 @@ class ProductView(QWidget):
         if not selected_product:
             QMessageBox.information(self, "No Selection", "Please select a product to edit.")
             return
-        dialog = ProductDialog(self.core, product=selected_product, parent=self)
-        dialog.product_operation_completed.connect(self._handle_operation_completed)
-        dialog.exec()
+
+        # The table only holds list columns; the dialog edits the full record.
+        def _on_done(result: Any, error: Optional[Exception]):
+            if error or isinstance(result, Failure):
+                QMessageBox.critical(self, "Load Error", f"Failed to load product: {error or result.error}")
+                return
+            dialog = ProductDialog(self.core, product=result.value, parent=self)
+            dialog.product_operation_completed.connect(self._handle_operation_completed)
+            dialog.exec()
+        self.async_worker.run_task(self.core.product_manager.get_product(selected_product.id), on_done_callback=_on_done)
 
     @Slot()
     def _on_deactivate_product(self):
@@ -21,7 +21,7 @@ from app.business_logic.dto.reporting_dto import (
     SalesSummaryReportDTO, GstReportDTO, InventoryValuationReportDTO,
     SalesByPeriodDTO, ProductPerformanceDTO, InventoryValuationItemDTO
 )
-from app.core.async_bridge import AsyncWorker
+from app.core.async_bridge import AsyncWorker, TaskLane, TaskPriority
 
 class SalesByPeriodTableModel(QAbstractTableModel):
     HEADERS = ["Date", "Total Sales (S$)", "Transactions", "Avg. Tx Value (S$)"]
@@ -85,7 +85,8 @@ class ReportsView(QWidget):
     def __init__(self, core: ApplicationCore, parent: Optional[QObject] = None):
         super().__init__(parent)
         self.core = core
-        self.async_worker: AsyncWorker = core.async_worker
+        # Reports and exports run on the background lane so they never hold up the POS.
+        self.async_worker: AsyncWorker = core.get_async_worker(TaskLane.BACKGROUND)
         self.company_id = self.core.current_company_id
         self.outlet_id = self.core.current_outlet_id
         self.current_report_data: Optional[Any] = None
@@ -154,7 +155,7 @@ class ReportsView(QWidget):
         if report_name == "Sales Summary Report": coro = self.core.reporting_manager.generate_sales_summary_report(self.company_id, start_date, end_date)
         elif report_name == "Inventory Valuation Report": coro = self.core.reporting_manager.generate_inventory_valuation_report(self.company_id, self.outlet_id)
         elif report_name == "GST Form 5": coro = self.core.gst_manager.generate_gst_f5_report(self.company_id, start_date, end_date)
-        if coro: self.async_worker.run_task(coro, on_done_callback=_on_done)
+        if coro: self.async_worker.run_task(coro, on_done_callback=_on_done, priority=TaskPriority.BACKGROUND)
         else: self.generate_button.setEnabled(True); self._clear_display_area(); self.current_report_data = None
 
     def _display_sales_summary_report(self, dto: SalesSummaryReportDTO):
@@ -214,7 +215,7 @@ class ReportsView(QWidget):
                     if reply == QMessageBox.Open:
                         QDesktopServices.openUrl(QUrl.fromLocalFile(file_path))
 
-            self.async_worker.run_task(self.core.reporting_manager.export_report_to_pdf(self.current_report_data, file_path), on_done_callback=_on_done)
+            self.async_worker.run_task(self.core.reporting_manager.export_report_to_pdf(self.current_report_data, file_path), on_done_callback=_on_done, priority=TaskPriority.BACKGROUND)
 
     @Slot()
     def _on_export_csv_clicked(self):
@@ -234,4 +235,4 @@ class ReportsView(QWidget):
                     if reply == QMessageBox.Open:
                         QDesktopServices.openUrl(QUrl.fromLocalFile(file_path))
             
-            self.async_worker.run_task(self.core.reporting_manager.export_report_to_csv(self.current_report_data, file_path), on_done_callback=_on_done)
+            self.async_worker.run_task(self.core.reporting_manager.export_report_to_csv(self.current_report_data, file_path), on_done_callback=_on_done, priority=TaskPriority.BACKGROUND)
@@ -16,6 +16,7 @@ class ManagedTableView(QWidget):
     A container widget that wraps a QTableView and provides methods to switch
     between a loading state, an empty state, and the table view itself.
     This promotes a consistent user experience for all data tables.
+    Models with a counts_changed signal (see PagedTableModel) also get a result count below the table.
     """
     def __init__(self, parent: Optional[QWidget] = None):
         super().__init__(parent)
@@ -29,7 +30,16 @@ class ManagedTableView(QWidget):
         self._stacked_layout.addWidget(self._empty_widget)
         self._stacked_layout.addWidget(self._table_view)
 
-        self.setLayout(self._stacked_layout)
+        self._count_label = QLabel()
+        self._count_label.setAlignment(Qt.AlignmentFlag.AlignRight)
+        self._count_label.setStyleSheet("QLabel { color: #888; }")
+        self._count_label.hide()
+
+        layout = QVBoxLayout()
+        layout.setContentsMargins(0, 0, 0, 0)
+        layout.addLayout(self._stacked_layout, 1)
+        layout.addWidget(self._count_label)
+        self.setLayout(layout)
         self.show_loading()
 
     def _create_state_widget(self, default_text: str) -> QWidget:
@@ -57,6 +67,16 @@ class ManagedTableView(QWidget):
     def set_model(self, model: QAbstractItemModel) -> None:
         """Sets the data model for the underlying table view."""
         self._table_view.setModel(model)
+        if hasattr(model, "counts_changed"):
+            model.counts_changed.connect(self._update_count_label)
+
+    def _update_count_label(self, loaded: int, total: Optional[int]) -> None:
+        """Shows 'N results' (or 'X of N results' while pages remain); hidden when the total is unknown."""
+        if total is None:
+            self._count_label.hide()
+            return
+        self._count_label.setText(f"{total:,} results" if loaded >= total else f"{loaded:,} of {total:,} results")
+        self._count_label.show()
 
     def show_loading(self) -> None:
         """Switches the view to show the loading indicator."""
@@ -0,0 +1,77 @@
+# File: app/ui/widgets/paged_table_model.py
+"""
+A table model base class for lists loaded one keyset page at a time.
+"""
+from __future__ import annotations
+from typing import Any, List, Optional
+
+from PySide6.QtCore import QAbstractTableModel, QModelIndex, QObject, Signal
+
+from app.core.pagination import Page
+
+class PagedTableModel(QAbstractTableModel):
+    """
+    Holds the rows loaded so far plus the cursor of the next page. Qt calls
+    canFetchMore/fetchMore as the user scrolls near the end of the table; the model
+    then emits fetch_more_requested(cursor) and the owning view loads that page
+    asynchronously and hands it back through append_page.
+
+    counts_changed(loaded, total) is emitted whenever rows are loaded; total is the
+    page's match count, or None when the listing was not counted (e.g. search results).
+    """
+    fetch_more_requested = Signal(str)
+    counts_changed = Signal(int, object)
+
+    def __init__(self, rows: Optional[List[Any]] = None, parent: Optional[QObject] = None):
+        super().__init__(parent)
+        self._rows: List[Any] = rows or []
+        self._next_cursor: Optional[str] = None
+        self._total: Optional[int] = None
+        self._fetching = False
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return len(self._rows)
+
+    def total_count(self) -> Optional[int]:
+        """The number of rows across all pages, or None if unknown."""
+        return self._total
+
+    def row_at(self, row: int) -> Optional[Any]:
+        return self._rows[row] if 0 <= row < len(self._rows) else None
+
+    def canFetchMore(self, parent: QModelIndex = QModelIndex()) -> bool:
+        return not parent.isValid() and self._next_cursor is not None and not self._fetching
+
+    def fetchMore(self, parent: QModelIndex = QModelIndex()) -> None:
+        if self.canFetchMore(parent):
+            self._fetching = True
+            self.fetch_more_requested.emit(self._next_cursor)
+
+    def refresh_data(self, rows: List[Any], next_cursor: Optional[str] = None, total: Optional[int] = None):
+        """Replaces all rows, e.g. with the first page of a new load or search."""
+        self.beginResetModel()
+        self._rows = list(rows)
+        self._next_cursor = next_cursor
+        self._total = total
+        self._fetching = False
+        self.endResetModel()
+        self.counts_changed.emit(len(self._rows), self._total)
+
+    def refresh_page(self, page: Page):
+        self.refresh_data(page.items, page.next_cursor, page.total)
+
+    def append_page(self, page: Page):
+        """Appends the page requested through fetch_more_requested."""
+        self._fetching = False
+        if page.items:
+            self.beginInsertRows(QModelIndex(), len(self._rows), len(self._rows) + len(page.items) - 1)
+            self._rows.extend(page.items)
+            self.endInsertRows()
+        self._next_cursor = page.next_cursor
+        if page.total is not None:
+            self._total = page.total
+        self.counts_changed.emit(len(self._rows), self._total)
+
+    def fetch_failed(self):
+        """Clears the in-flight flag after a failed page load so scrolling can retry it."""
+        self._fetching = False
@@ -0,0 +1,78 @@
+# File: migrations/versions/7c1e9a4b2d50_add_product_search_indexes.py
+"""
+Add indexes for ranked product search.
+
+ProductService.search matches the term anywhere in sku, name and barcode
+(ILIKE '%term%'), which no B-tree index can serve. On PostgreSQL this enables
+pg_trgm and adds a trigram GIN index per column; they serve the ILIKE filters
+and the similarity() ranking. On SQLite it creates the FTS5 trigram table and
+sync triggers that the SQLite search path queries, and indexes existing rows.
+
+The PostgreSQL indexes are built CONCURRENTLY, outside the migration's transaction,
+so writes to products are not blocked while a large catalogue is indexed. If a
+concurrent build fails it leaves an INVALID index behind; drop it and re-run.
+
+The FTS5 table is keyed on the implicit rowid of products, whose primary key is a
+UUID, and VACUUM may renumber such rowids. Rebuild the index after any VACUUM:
+INSERT INTO products_search(products_search) VALUES ('rebuild').
+
+Revision ID: 7c1e9a4b2d50
+Revises: d5a6759ef2f7
+Create Date: 2026-10-17 10:00:00.000000
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = '7c1e9a4b2d50'
+down_revision = 'd5a6759ef2f7'
+branch_labels = None
+depends_on = None
+
+SEARCH_COLUMNS = ('sku', 'name', 'barcode')
+
+SQLITE_UPGRADE = (
+    "CREATE VIRTUAL TABLE products_search USING fts5(sku, name, barcode, content='products', tokenize='trigram')",
+    """CREATE TRIGGER products_search_ai AFTER INSERT ON products BEGIN
+        INSERT INTO products_search(rowid, sku, name, barcode) VALUES (new.rowid, new.sku, new.name, new.barcode);
+    END""",
+    """CREATE TRIGGER products_search_ad AFTER DELETE ON products BEGIN
+        INSERT INTO products_search(products_search, rowid, sku, name, barcode) VALUES ('delete', old.rowid, old.sku, old.name, old.barcode);
+    END""",
+    """CREATE TRIGGER products_search_au AFTER UPDATE OF sku, name, barcode ON products BEGIN
+        INSERT INTO products_search(products_search, rowid, sku, name, barcode) VALUES ('delete', old.rowid, old.sku, old.name, old.barcode);
+        INSERT INTO products_search(rowid, sku, name, barcode) VALUES (new.rowid, new.sku, new.name, new.barcode);
+    END""",
+    # Index the rows that already exist.
+    "INSERT INTO products_search(products_search) VALUES ('rebuild')",
+)
+
+
+def upgrade() -> None:
+    dialect = op.get_bind().dialect.name
+    if dialect == 'postgresql':
+        # Needs CREATE privilege on the database (or a superuser) the first time it runs.
+        op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+        # CREATE INDEX CONCURRENTLY cannot run inside a transaction block.
+        with op.get_context().autocommit_block():
+            for column in SEARCH_COLUMNS:
+                op.create_index(
+                    f'ix_products_{column}_trgm', 'products', [column], unique=False, schema='sgpos',
+                    postgresql_using='gin', postgresql_ops={column: 'gin_trgm_ops'}, postgresql_concurrently=True,
+                )
+    elif dialect == 'sqlite':
+        for statement in SQLITE_UPGRADE:
+            op.execute(statement)
+
+
+def downgrade() -> None:
+    dialect = op.get_bind().dialect.name
+    if dialect == 'postgresql':
+        with op.get_context().autocommit_block():
+            for column in reversed(SEARCH_COLUMNS):
+                op.drop_index(f'ix_products_{column}_trgm', table_name='products', schema='sgpos', postgresql_concurrently=True)
+        # pg_trgm is left installed: other objects in the database may depend on it.
+    elif dialect == 'sqlite':
+        for trigger in ('products_search_au', 'products_search_ad', 'products_search_ai'):
+            op.execute(f"DROP TRIGGER IF EXISTS {trigger}")
+        op.execute("DROP TABLE IF EXISTS products_search")
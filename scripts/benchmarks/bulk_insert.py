@@ -0,0 +1,95 @@
+# File: scripts/benchmarks/bulk_insert.py
+"""
+Benchmark: inserting products, customers and stock movements in bulk.
+
+"before" saves one record at a time through BaseService.create (add, flush and
+refresh: three round trips per row), as imports do today; because that path is
+slow it runs on a sample of --baseline-rows records and is reported as a rate.
+"after" inserts --rows records per table through bulk_create / log_movements,
+which send batched multi-row INSERT ... RETURNING statements.
+
+Usage:  python scripts/benchmarks/bulk_insert.py [--rows N] [--baseline-rows N] [--batch-size N]
+"""
+import argparse
+import asyncio
+import time
+from decimal import Decimal
+
+import _common  # noqa: F401  (sets up sys.path and test mode; must come first)
+from _common import make_engine, new_id
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.result import Success
+from app.models.customer import Customer
+from app.models.inventory import StockMovement
+from app.models.product import Product
+from app.services.base_service import BULK_BATCH_SIZE
+from app.services.customer_service import CustomerService
+from app.services.inventory_service import InventoryService
+from app.services.product_service import ProductService
+
+COMPANY_ID = new_id()
+OUTLET_ID = new_id()
+
+def product_row(i, prefix):
+    return {"id": new_id(), "company_id": COMPANY_ID, "sku": f"{prefix}-{i:06d}", "name": f"Product {i}",
+            "cost_price": Decimal("1.00"), "selling_price": Decimal("2.00")}
+
+def customer_row(i, prefix):
+    return {"id": new_id(), "company_id": COMPANY_ID, "customer_code": f"{prefix}{i:06d}", "name": f"Customer {i}"}
+
+def movement_row(i, product_ids):
+    return {"id": new_id(), "company_id": COMPANY_ID, "outlet_id": OUTLET_ID, "product_id": product_ids[i % len(product_ids)],
+            "movement_type": "ADJUSTMENT_IN", "quantity_change": Decimal("1")}
+
+async def timed(coro) -> float:
+    started = time.perf_counter()
+    await coro
+    return time.perf_counter() - started
+
+async def one_by_one(session, service, model, rows):
+    for row in rows:
+        result = await service.create(model(**row), session)
+        assert isinstance(result, Success), result.error
+
+async def bulk(session, insert, rows, batch_size):
+    result = await insert(rows, session, batch_size)
+    assert isinstance(result, Success), result.error
+    return result.value
+
+async def main(rows: int, baseline_rows: int, batch_size: int):
+    engine = await make_engine([Product, Customer, StockMovement])
+    products_svc, customers_svc, inventory_svc = ProductService(None), CustomerService(None), InventoryService(None)
+    timings = []
+
+    async with AsyncSession(engine, expire_on_commit=False) as session:
+        sample_ids = await bulk(session, products_svc.bulk_create, [product_row(i, "SEED") for i in range(1000)], batch_size)
+
+        cases = [
+            ("products", lambda n, p: [product_row(i, p) for i in range(n)],
+             lambda r: one_by_one(session, products_svc, Product, r), lambda r: bulk(session, products_svc.bulk_create, r, batch_size)),
+            ("customers", lambda n, p: [customer_row(i, p) for i in range(n)],
+             lambda r: one_by_one(session, customers_svc, Customer, r), lambda r: bulk(session, customers_svc.bulk_create, r, batch_size)),
+            ("stock movements", lambda n, p: [movement_row(i, sample_ids) for i in range(n)],
+             lambda r: one_by_one(session, inventory_svc, StockMovement, r), lambda r: bulk(session, inventory_svc.log_movements, r, batch_size)),
+        ]
+        for name, make_rows, before, after in cases:
+            before_s = await timed(before(make_rows(baseline_rows, "ONE")))
+            after_s = await timed(after(make_rows(rows, "BULK")))
+            await session.commit()
+            timings.append((name, baseline_rows / before_s, rows / after_s, after_s))
+
+    await engine.dispose()
+    print(f"SQLite in memory; one-by-one on {baseline_rows} rows, bulk on {rows} rows per table")
+    print(f"\n  {'table':<18}{'one-by-one':>14}{'bulk':>14}{'speed-up':>10}{'bulk total':>12}")
+    for name, before_rate, after_rate, after_s in timings:
+        print(f"  {name:<18}{before_rate:>10.0f}r/s{after_rate:>10.0f}r/s{after_rate / before_rate:>9.1f}x{after_s:>11.2f}s")
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=100_000)
+    parser.add_argument("--baseline-rows", type=int, default=2_000)
+    parser.add_argument("--batch-size", type=int, default=BULK_BATCH_SIZE, help="Rows per executemany batch")
+    args = parser.parse_args()
+    asyncio.run(main(args.rows, args.baseline_rows, args.batch_size))
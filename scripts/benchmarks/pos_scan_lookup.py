@@ -0,0 +1,96 @@
+# File: scripts/benchmarks/pos_scan_lookup.py
+"""
+Benchmark: resolving POS barcode scans via the database search vs. the catalog index.
+
+"before" is what the till did for every scan: ProductManager.search_products with
+limit=1, i.e. an ILIKE '%code%' query over SKU, name and barcode, mapped to a
+ProductListItemDTO. "after" is ProductManager.find_scanned_product's path: a dict
+lookup in the resident CatalogIndex plus the same DTO.
+
+Reports scans per second for each path, plus how long the index takes to load and
+the memory it holds per product. SQLite in memory has no network round trip, so
+against PostgreSQL the database path is slower still.
+
+Usage:  python scripts/benchmarks/pos_scan_lookup.py [--products N] [--scans N]
+"""
+import argparse
+import asyncio
+import itertools
+import random
+import time
+import tracemalloc
+from decimal import Decimal
+
+import _common  # noqa: F401  (sets up sys.path and test mode; must come first)
+from _common import make_engine, new_id, time_async, time_sync
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.catalog_index import CatalogIndex
+from app.core.result import Success
+from app.business_logic.dto.product_dto import ProductListItemDTO
+from app.models.product import Product
+from app.services.product_service import CATALOG_FIELDS, ProductService
+
+COMPANY_ID = new_id()
+
+async def seed(engine, service: ProductService, products: int):
+    rows = [{"id": new_id(), "company_id": COMPANY_ID, "sku": f"SKU-{i:06d}", "name": f"Product {i:06d}",
+             "barcode": f"888{i:09d}", "cost_price": Decimal("1.00"), "selling_price": Decimal("2.00")} for i in range(products)]
+    async with AsyncSession(engine) as session:
+        result = await service.bulk_create(rows, session)
+        assert isinstance(result, Success), result.error
+        await session.commit()
+
+async def load_index(engine, service: ProductService):
+    """Loads a fresh index; returns it with the load time in ms and the bytes it holds."""
+    async def fetch_rows(since):
+        async with AsyncSession(engine) as session:
+            return await service.get_catalog_rows(COMPANY_ID, since, session)
+
+    index = CatalogIndex(fetch_rows, CATALOG_FIELDS)
+    started = time.perf_counter()
+    await index.refresh()
+    load_ms = (time.perf_counter() - started) * 1000
+
+    tracemalloc.start()
+    try:
+        baseline = tracemalloc.get_traced_memory()[0]
+        traced = CatalogIndex(fetch_rows, CATALOG_FIELDS)
+        await traced.refresh()
+        held = tracemalloc.get_traced_memory()[0] - baseline
+    finally:
+        tracemalloc.stop()
+    return index, load_ms, held
+
+async def main(products: int, scans: int):
+    engine = await make_engine([Product])
+    service = ProductService(None)
+    await seed(engine, service, products)
+    codes = itertools.cycle(random.sample([f"888{i:09d}" for i in range(products)], min(products, 1000)))
+
+    async with AsyncSession(engine) as session:
+        async def scan_via_search():
+            rows = (await service.search_list_rows(COMPANY_ID, next(codes), limit=1, session=session)).value
+            return ProductListItemDTO(**rows[0])
+        # Each database scan is a table scan, so it gets far fewer iterations than the index.
+        search_us = await time_async(scan_via_search, max(1, scans // 100), warmup=5)
+
+    index, load_ms, held = await load_index(engine, service)
+    def scan_via_index():
+        return ProductListItemDTO(**index.lookup(next(codes)))
+    index_us = time_sync(scan_via_index, scans)
+
+    await engine.dispose()
+    print(f"{products} products, SQLite in memory")
+    print(f"\n  {'path':<30}{'us/scan':>12}{'scans/s':>14}")
+    for name, us in (("search_products(limit=1)", search_us), ("catalog index lookup", index_us)):
+        print(f"  {name:<30}{us:>12.1f}{1e6 / us:>14.0f}")
+    print(f"\n  speed-up {search_us / index_us:.0f}x; index load {load_ms:.0f} ms, {held / products:.0f} bytes per product")
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--products", type=int, default=50_000)
+    parser.add_argument("--scans", type=int, default=100_000)
+    args = parser.parse_args()
+    asyncio.run(main(args.products, args.scans))
@@ -0,0 +1,102 @@
+# File: scripts/benchmarks/product_list_projection.py
+"""
+Benchmark: loading the product list as full entities vs. a column projection.
+
+"before" pages through the catalogue as the product list used to: full Product
+entities (every column, tracked in the session's identity map) converted with
+ProductDTO.from_orm. "after" is the current path: a Core select of the list
+columns mapped straight into ProductListItemDTO.
+
+Reports rows per second for a walk over the whole catalogue, page by page, and
+the peak memory allocated per row while one page is loaded (tracemalloc, measured
+in a separate pass because tracing slows everything down).
+
+Usage:  python scripts/benchmarks/product_list_projection.py [--products N] [--page-size N]
+"""
+import argparse
+import asyncio
+import time
+import tracemalloc
+from decimal import Decimal
+
+import _common  # noqa: F401  (sets up sys.path and test mode; must come first)
+from _common import make_engine, new_id
+
+import sqlalchemy as sa
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.result import Success
+from app.business_logic.dto.product_dto import ProductDTO, ProductListItemDTO
+from app.models.product import Product
+from app.services.product_service import ProductService
+
+COMPANY_ID = new_id()
+DESCRIPTION = "A representative product description that list screens never show. " * 4
+
+async def seed(engine, service: ProductService, products: int):
+    rows = [{"id": new_id(), "company_id": COMPANY_ID, "sku": f"SKU-{i:06d}", "name": f"Product {i:06d}", "description": DESCRIPTION,
+             "barcode": f"888{i:09d}", "cost_price": Decimal("1.00"), "selling_price": Decimal("2.00")} for i in range(products)]
+    async with AsyncSession(engine) as session:
+        result = await service.bulk_create(rows, session)
+        assert isinstance(result, Success), result.error
+        await session.commit()
+
+async def load_entities_page(engine, service, page_size, cursor):
+    async with AsyncSession(engine) as session:
+        page = (await service.get_page(COMPANY_ID, page_size, cursor, order_by_column="name", session=session)).value
+        return page.map(ProductDTO.from_orm)
+
+async def load_projected_page(engine, service, page_size, cursor):
+    async with AsyncSession(engine) as session:
+        page = (await service.get_list_rows_page(COMPANY_ID, page_size, cursor, session=session)).value
+        return page.map(lambda row: ProductListItemDTO(**row))
+
+async def walk(load, engine, service, page_size) -> float:
+    """Pages through the whole catalogue; returns rows per second."""
+    rows, cursor = 0, None
+    started = time.perf_counter()
+    while True:
+        page = await load(engine, service, page_size, cursor)
+        rows += len(page.items)
+        cursor = page.next_cursor
+        if cursor is None:
+            return rows / (time.perf_counter() - started)
+
+async def bytes_per_row(load, engine, service, page_size) -> float:
+    tracemalloc.start()
+    try:
+        tracemalloc.reset_peak()
+        baseline = tracemalloc.get_traced_memory()[0]
+        page = await load(engine, service, page_size, None)
+        peak = tracemalloc.get_traced_memory()[1]
+        return (peak - baseline) / len(page.items)
+    finally:
+        tracemalloc.stop()
+
+async def main(products: int, page_size: int):
+    engine = await make_engine([Product])
+    async with engine.begin() as conn:
+        # Without an index SQLite sorts the whole table for every page, which would swamp the row-loading cost.
+        await conn.execute(sa.text("CREATE INDEX ix_bench_products_name ON products (company_id, name, id)"))
+    service = ProductService(None)
+    await seed(engine, service, products)
+
+    results = []
+    for name, load in (("entities + from_orm", load_entities_page), ("projection + slim DTO", load_projected_page)):
+        await load(engine, service, page_size, None)  # warm the statement cache
+        results.append((name, await walk(load, engine, service, page_size), await bytes_per_row(load, engine, service, page_size)))
+
+    await engine.dispose()
+    print(f"{products} products, pages of {page_size}, SQLite in memory")
+    print(f"\n  {'path':<26}{'rows/s':>12}{'peak bytes/row':>16}")
+    for name, rate, per_row in results:
+        print(f"  {name:<26}{rate:>12.0f}{per_row:>16.0f}")
+    (_, before_rate, before_mem), (_, after_rate, after_mem) = results
+    print(f"\n  throughput {after_rate / before_rate:.2f}x, memory per row {after_mem / before_mem:.2f}x")
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--products", type=int, default=200_000)
+    parser.add_argument("--page-size", type=int, default=1000)
+    args = parser.parse_args()
+    asyncio.run(main(args.products, args.page_size))
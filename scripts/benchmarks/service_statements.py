@@ -0,0 +1,124 @@
+# File: scripts/benchmarks/service_statements.py
+"""
+Micro-benchmark: per-call overhead of the hot service queries.
+
+"before" builds each select() inline on every call, as the services used to;
+"after" calls the services, which execute statements built once at import time
+with bound parameters. Two measurements per query:
+
+  * build  - Python time to construct the statement inline (no database work),
+             which the prebuilt statements no longer pay;
+  * call   - a full execution against in-memory SQLite, including result loading.
+             Besides construction, inline statements also pay for computing their
+             compiled-cache key on every execution.
+
+Usage:  python scripts/benchmarks/service_statements.py [--iterations N]
+"""
+import argparse
+import asyncio
+import uuid
+from decimal import Decimal
+
+import _common  # noqa: F401  (sets up sys.path and test mode; must come first)
+from _common import make_engine, print_comparison, time_async, time_sync
+
+from sqlalchemy import or_
+from sqlalchemy.future import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.customer import Customer
+from app.models.inventory import Inventory
+from app.models.product import Product
+from app.models.sales import PaymentMethod
+from app.services.customer_service import CustomerService
+from app.services.inventory_service import InventoryService
+from app.services.payment_service import PaymentMethodService
+from app.services.product_service import ProductService
+
+COMPANY_ID = uuid.uuid4()
+OUTLET_ID = uuid.uuid4()
+
+# --- The statements as the services built them before (one new construct per call) ---
+def build_product_search(term, limit=1, offset=0):
+    pattern = f"%{term}%"
+    return select(Product).where(
+        Product.company_id == COMPANY_ID, Product.is_active == True,
+        or_(Product.sku.ilike(pattern), Product.name.ilike(pattern), Product.barcode.ilike(pattern))
+    ).offset(offset).limit(limit)
+
+def build_product_by_sku(sku):
+    return select(Product).where(Product.company_id == COMPANY_ID, Product.sku == sku)
+
+def build_customer_search(term, limit=1, offset=0):
+    pattern = f"%{term}%"
+    return select(Customer).where(
+        Customer.company_id == COMPANY_ID, Customer.is_active == True,
+        or_(Customer.customer_code.ilike(pattern), Customer.name.ilike(pattern),
+            Customer.email.ilike(pattern), Customer.phone.ilike(pattern))
+    ).offset(offset).limit(limit)
+
+def build_stock_level(product_id):
+    return select(Inventory.quantity_on_hand).where(
+        Inventory.outlet_id == OUTLET_ID, Inventory.product_id == product_id, Inventory.variant_id == None
+    )
+
+def build_active_methods():
+    return select(PaymentMethod).where(PaymentMethod.company_id == COMPANY_ID, PaymentMethod.is_active == True).order_by(PaymentMethod.name)
+
+async def seed(session: AsyncSession, products: int) -> uuid.UUID:
+    for i in range(products):
+        product = Product(id=uuid.uuid4(), company_id=COMPANY_ID, sku=f"SKU-{i:05d}", name=f"Product {i}", barcode=f"888{i:09d}",
+                          cost_price=Decimal("1.00"), selling_price=Decimal("2.00"), is_active=True)
+        session.add(product)
+        session.add(Inventory(outlet_id=OUTLET_ID, product_id=product.id, quantity_on_hand=Decimal("10")))
+        session.add(Customer(company_id=COMPANY_ID, customer_code=f"C{i:05d}", name=f"Customer {i}", is_active=True))
+    for name in ("Cash", "NETS", "PayNow"):
+        session.add(PaymentMethod(company_id=COMPANY_ID, name=name, type="CASH", is_active=True))
+    await session.commit()
+    return product.id
+
+async def main(iterations: int, products: int):
+    engine = await make_engine([Product, Inventory, Customer, PaymentMethod])
+    products_svc, customers_svc = ProductService(None), CustomerService(None)
+    inventory_svc, methods_svc = InventoryService(None), PaymentMethodService(None)
+
+    async with AsyncSession(engine, expire_on_commit=False) as session:
+        product_id = await seed(session, products)
+
+        async def run(stmt):
+            return (await session.execute(stmt)).scalars().all()
+
+        cases = [
+            ("ProductService.search", lambda: build_product_search("Product 42"),
+             lambda: run(build_product_search("Product 42")), lambda: products_svc.search(COMPANY_ID, "Product 42", limit=1, session=session)),
+            ("ProductService.get_by_sku", lambda: build_product_by_sku("SKU-00042"),
+             lambda: run(build_product_by_sku("SKU-00042")), lambda: products_svc.get_by_sku(COMPANY_ID, "SKU-00042", session)),
+            ("CustomerService.search", lambda: build_customer_search("C00042"),
+             lambda: run(build_customer_search("C00042")), lambda: customers_svc.search(COMPANY_ID, "C00042", limit=1, session=session)),
+            ("InventoryService.get_stock_level", lambda: build_stock_level(product_id),
+             lambda: run(build_stock_level(product_id)), lambda: inventory_svc.get_stock_level(OUTLET_ID, product_id, None, session)),
+            ("PaymentMethodService.active", build_active_methods,
+             lambda: run(build_active_methods()), lambda: methods_svc.get_all_active_methods(COMPANY_ID, session)),
+        ]
+
+        build_costs, call_rows = [], []
+        for name, build, before_call, after_call in cases:
+            # Both paths must return the same (non-empty) rows before timing means anything.
+            before_rows, after_value = list(await before_call()), (await after_call()).value
+            assert before_rows and before_rows == (after_value if isinstance(after_value, list) else [after_value]), name
+            build_costs.append((name, time_sync(build, iterations)))
+            call_rows.append((name, await time_async(before_call, iterations), await time_async(after_call, iterations)))
+
+    await engine.dispose()
+    print(f"{iterations} iterations, {products} products/customers, SQLite in memory")
+    print("\nInline statement construction (saved per call)")
+    for name, build_us in build_costs:
+        print(f"  {name:<34}{build_us:>10.1f}us")
+    print_comparison("Full call (build + execute + load rows)", call_rows)
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--iterations", type=int, default=2000)
+    parser.add_argument("--products", type=int, default=500)
+    args = parser.parse_args()
+    asyncio.run(main(args.iterations, args.products))
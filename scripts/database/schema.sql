@@ -12,6 +12,8 @@ SET search_path TO sgpos;
 -- Enable the pgcrypto extension to generate UUIDs.
 -- This should be run once by a superuser on the target database.
 CREATE EXTENSION IF NOT EXISTS "pgcrypto";
+-- Trigram matching for ranked product search (ProductService.search).
+CREATE EXTENSION IF NOT EXISTS "pg_trgm";
 
 
 -- =============================================================================
@@ -411,6 +413,9 @@ CREATE INDEX idx_products_company_id ON sgpos.products(company_id);
 CREATE INDEX idx_products_category_id ON sgpos.products(category_id);
 CREATE INDEX idx_products_supplier_id ON sgpos.products(supplier_id);
 CREATE INDEX idx_products_barcode ON sgpos.products(barcode) WHERE barcode IS NOT NULL;
+CREATE INDEX ix_products_sku_trgm ON sgpos.products USING gin (sku gin_trgm_ops);
+CREATE INDEX ix_products_name_trgm ON sgpos.products USING gin (name gin_trgm_ops);
+CREATE INDEX ix_products_barcode_trgm ON sgpos.products USING gin (barcode gin_trgm_ops);
 CREATE INDEX idx_product_variants_product_id ON sgpos.product_variants(product_id);
 CREATE INDEX idx_inventory_outlet_id ON sgpos.inventory(outlet_id);
 CREATE INDEX idx_inventory_product_id ON sgpos.inventory(product_id);
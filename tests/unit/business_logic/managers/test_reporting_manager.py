@@ -0,0 +1,42 @@
+# File: tests/unit/business_logic/managers/test_reporting_manager.py
+"""
+Unit tests for the ReportingManager class.
+"""
+import csv
+import pytest
+from datetime import date, datetime
+from decimal import Decimal
+import uuid
+
+from app.core.result import Success
+from app.models import Product, SalesTransaction, SalesTransactionItem
+
+pytestmark = pytest.mark.asyncio
+
+class TestReportingManager:
+    """Test suite for report generation and export."""
+
+    async def test_export_sales_lines_to_csv_writes_every_line(self, test_core, db_session, tmp_path):
+        """Verify that the streamed export writes a header plus one formatted row per sales line."""
+        # --- Arrange ---
+        company_id = uuid.uuid4()
+        product = Product(company_id=company_id, sku="CSV-1", name="Csv Product", cost_price=Decimal("1.00"), selling_price=Decimal("2.50"))
+        sale = SalesTransaction(company_id=company_id, outlet_id=uuid.uuid4(), cashier_id=uuid.uuid4(), transaction_number="T-0001",
+                                transaction_date=datetime(2024, 3, 5, 9, 30), subtotal=Decimal("12.50"), tax_amount=Decimal("0.00"),
+                                total_amount=Decimal("12.50"), status="COMPLETED")
+        db_session.add_all([product, sale])
+        await db_session.flush()
+        db_session.add_all([SalesTransactionItem(sales_transaction_id=sale.id, product_id=product.id, quantity=Decimal("1"),
+                                                 unit_price=Decimal("2.50"), cost_price=Decimal("1.00"), line_total=Decimal("2.50")) for _ in range(5)])
+        await db_session.flush()
+        file_path = tmp_path / "lines.csv"
+
+        # --- Act ---
+        result = await test_core.reporting_manager.export_sales_lines_to_csv(company_id, date(2024, 3, 1), date(2024, 3, 31), str(file_path))
+
+        # --- Assert ---
+        assert isinstance(result, Success)
+        with open(file_path, newline='', encoding='utf-8') as f:
+            rows = list(csv.reader(f))
+        assert len(rows) == 6
+        assert rows[1] == ["T-0001", "2024-03-05 09:30:00", "CSV-1", "Csv Product", "1.0000", "2.5000", "1.0000", "2.50"]
@@ -5,6 +5,7 @@ Unit tests for the SalesManager class.
 import pytest
 from decimal import Decimal
 import uuid
+import sqlalchemy as sa
 
 from app.core.result import Success, Failure
 from app.business_logic.dto.sales_dto import SaleCreateDTO, CartItemDTO, PaymentInfoDTO
@@ -138,3 +139,63 @@ class TestSalesManager:
         
         tx_count = await db_session.scalar(SalesTransaction.count())
         assert tx_count == 0
+
+    async def _cached_product_repriced_elsewhere(self, test_core, db_session, **changes):
+        """Adds a product, caches it, then changes it with a Core UPDATE in another session, as another terminal would."""
+        product = Product(company_id=uuid.uuid4(), sku="REPRICED", name="Repriced", cost_price=Decimal("1.00"),
+                          selling_price=Decimal("2.50"), gst_rate=Decimal("0.00"), track_inventory=False)
+        db_session.add(product)
+        await db_session.flush()
+        db_session.expunge(product)
+        await test_core.product_service.get_by_id(product.id) # Now in the entity cache.
+        async with test_core.get_session() as session:
+            await session.execute(sa.update(Product.__table__).where(Product.__table__.c.id == product.id).values(**changes))
+        return product
+
+    def _sale_of(self, product, amount):
+        return SaleCreateDTO(
+            company_id=product.company_id, outlet_id=uuid.uuid4(), cashier_id=uuid.uuid4(),
+            cart_items=[CartItemDTO(product_id=product.id, quantity=Decimal("2"))],
+            payments=[PaymentInfoDTO(payment_method_id=uuid.uuid4(), amount=amount)]
+        )
+
+    async def test_finalize_sale_charges_the_current_price_not_the_cached_one(self, test_core, db_session):
+        """Verify that a product repriced by another terminal is charged at the database price while the cache is stale."""
+        # --- Arrange ---
+        product = await self._cached_product_repriced_elsewhere(test_core, db_session, selling_price=Decimal("3.00"))
+        assert (await test_core.product_service.get_by_id(product.id)).value.selling_price == Decimal("2.50")
+
+        # --- Act ---
+        result = await test_core.sales_manager.finalize_sale(self._sale_of(product, Decimal("10.00")))
+
+        # --- Assert ---
+        assert isinstance(result, Success), result
+        assert result.value.items[0].unit_price == Decimal("3.00")
+        assert result.value.total_amount == Decimal("6.00")
+
+    async def test_finalize_sale_rejects_a_product_deactivated_elsewhere(self, test_core, db_session):
+        """Verify that a product deactivated by another terminal cannot be sold from a stale cache entry."""
+        # --- Arrange ---
+        product = await self._cached_product_repriced_elsewhere(test_core, db_session, is_active=False)
+
+        # --- Act ---
+        result = await test_core.sales_manager.finalize_sale(self._sale_of(product, Decimal("10.00")))
+
+        # --- Assert ---
+        assert isinstance(result, Failure)
+        assert "No longer available" in result.error
+
+    async def test_finalize_sale_records_the_first_sale_on_its_own_core(self, test_core, db_session):
+        """Verify that the first-sale latency is recorded per core, once, alongside its startup timings."""
+        # --- Arrange ---
+        product = await self._cached_product_repriced_elsewhere(test_core, db_session, selling_price=Decimal("3.00"))
+        assert "first_sale" not in test_core.startup_timings
+
+        # --- Act ---
+        first = await test_core.sales_manager.finalize_sale(self._sale_of(product, Decimal("10.00")))
+        first_sale_ms = test_core.startup_timings["first_sale"]
+        second = await test_core.sales_manager.finalize_sale(self._sale_of(product, Decimal("10.00")))
+
+        # --- Assert ---
+        assert isinstance(first, Success) and isinstance(second, Success)
+        assert test_core.startup_timings["first_sale"] == first_sale_ms
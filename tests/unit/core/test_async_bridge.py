@@ -0,0 +1,430 @@
+# File: tests/unit/core/test_async_bridge.py
+"""
+Unit tests for the asyncio/Qt bridge (AsyncWorker and AsyncWorkerPool).
+"""
+import asyncio
+import pytest
+from PySide6.QtCore import QObject, Slot
+
+from app.core.application_core import CallbackExecutor
+from app.core.async_bridge import AsyncWorkerPool, AsyncWorkerThread, BackpressurePolicy, TaskLane, TaskPriority, remaining_task_time
+from app.core.exceptions import TaskRejectedError, TaskTimeoutError
+
+@pytest.fixture
+def worker_pool(qapp):
+    """Starts a worker pool with every lane and stops it after the test."""
+    pool = AsyncWorkerPool(TaskLane.ALL)
+    pool.start_and_wait()
+    yield pool
+    pool.stop_and_wait()
+
+@pytest.fixture
+def limited_worker(qapp):
+    """Starts a single worker that runs one BACKGROUND and one INTERACTIVE task at a time."""
+    thread = AsyncWorkerThread(concurrency_limits={TaskPriority.INTERACTIVE: 1, TaskPriority.BACKGROUND: 1})
+    thread.start_and_wait()
+    yield thread.worker
+    thread.stop_and_wait()
+
+@pytest.fixture
+def bounded_worker_factory(qapp):
+    """Starts single workers that admit at most two tasks, with the given backpressure policy."""
+    threads = []
+    def _factory(policy, **admission):
+        thread = AsyncWorkerThread(
+            concurrency_limits={TaskPriority.INTERACTIVE: 1},
+            admission={"max_queued_tasks": 2, "backpressure_policy": policy, **admission},
+        )
+        thread.start_and_wait()
+        threads.append(thread)
+        return thread.worker
+    yield _factory
+    for thread in threads:
+        thread.stop_and_wait()
+
+@pytest.fixture
+def callback_executor(qapp):
+    """A main-thread executor that drains worker callbacks, as ApplicationCore wires it."""
+    return CallbackExecutor()
+
+class _SaturationRecorder(QObject):
+    """Main-thread receiver for saturation_changed, as MainWindow connects it."""
+    def __init__(self):
+        super().__init__()
+        self.states = []
+
+    @Slot(str, bool)
+    def record(self, lane, saturated):
+        self.states.append(saturated)
+
+async def _current_loop():
+    return asyncio.get_running_loop()
+
+class TestAsyncWorkerPool:
+    """Test suite for lane routing in the worker pool."""
+
+    def test_each_lane_runs_its_own_loop(self, worker_pool):
+        """Verify that every lane executes coroutines on a distinct event loop."""
+        # --- Act ---
+        loops = {lane: worker_pool.worker(lane).run_task_and_wait(_current_loop()) for lane in TaskLane.ALL}
+
+        # --- Assert ---
+        assert len(set(loops.values())) == len(TaskLane.ALL)
+
+    def test_unknown_lane_falls_back_to_interactive(self, qapp):
+        """Verify that a lane that is not configured routes to the interactive lane."""
+        # --- Arrange ---
+        pool = AsyncWorkerPool([TaskLane.INTERACTIVE])
+        pool.start_and_wait()
+        try:
+            # --- Act & Assert ---
+            assert pool.lanes == [TaskLane.INTERACTIVE]
+            assert pool.worker(TaskLane.BACKGROUND) is pool.worker(TaskLane.INTERACTIVE)
+        finally:
+            pool.stop_and_wait()
+
+    def test_run_task_delivers_callback(self, worker_pool, callback_executor, qtbot):
+        """Verify that run_task on a lane delivers the result through the callback signal."""
+        # --- Arrange ---
+        results = []
+        worker = worker_pool.worker(TaskLane.BACKGROUND)
+        worker.callbacks_ready.connect(callback_executor.execute_batch)
+
+        async def _answer():
+            return 42
+
+        # --- Act ---
+        worker_pool.run_task(_answer(), lambda r, e: results.append((r, e)), lane=TaskLane.BACKGROUND)
+
+        # --- Assert ---
+        qtbot.waitUntil(lambda: len(results) == 1, timeout=2000)
+        assert results == [(42, None)]
+
+
+class TestTaskPriority:
+    """Test suite for priority-aware scheduling in AsyncWorker.run_task."""
+
+    def test_background_tasks_respect_concurrency_limit(self, limited_worker, callback_executor, qtbot):
+        """Verify that queued BACKGROUND tasks start one at a time, in submission order."""
+        # --- Arrange ---
+        started = []
+        finished = []
+        limited_worker.callbacks_ready.connect(callback_executor.execute_batch)
+
+        async def _job(name):
+            started.append(name)
+            await asyncio.sleep(0.05)
+            return name
+
+        # --- Act ---
+        for name in ("report-1", "report-2", "report-3"):
+            limited_worker.run_task(_job(name), lambda r, e: finished.append(r), priority=TaskPriority.BACKGROUND)
+
+        # --- Assert ---
+        qtbot.waitUntil(lambda: len(finished) == 3, timeout=2000)
+        assert started == ["report-1", "report-2", "report-3"]
+        assert finished == ["report-1", "report-2", "report-3"]
+
+    def test_critical_task_is_not_blocked_by_saturated_classes(self, limited_worker, callback_executor, qtbot):
+        """Verify that a CRITICAL task starts while the lower classes are at their limits."""
+        # --- Arrange ---
+        release = asyncio.Event()
+        finished = []
+        limited_worker.callbacks_ready.connect(callback_executor.execute_batch)
+
+        async def _blocked(name):
+            await release.wait()
+            return name
+
+        async def _tender():
+            release.set()
+            return "tender"
+
+        # --- Act ---
+        limited_worker.run_task(_blocked("report"), lambda r, e: finished.append(r), priority=TaskPriority.BACKGROUND)
+        limited_worker.run_task(_blocked("search"), lambda r, e: finished.append(r), priority=TaskPriority.INTERACTIVE)
+        limited_worker.run_task(_tender(), lambda r, e: finished.append(r), priority=TaskPriority.CRITICAL)
+
+        # --- Assert ---
+        qtbot.waitUntil(lambda: len(finished) == 3, timeout=2000)
+        assert finished[0] == "tender"
+
+
+class TestRunLatest:
+    """Test suite for supersede-and-cancel semantics of AsyncWorker.run_latest."""
+
+    def test_newer_task_cancels_older_and_drops_its_callback(self, worker_pool, callback_executor, qtbot):
+        """Verify that only the latest task for a key delivers a result."""
+        # --- Arrange ---
+        worker = worker_pool.worker(TaskLane.INTERACTIVE)
+        worker.callbacks_ready.connect(callback_executor.execute_batch)
+        cancelled = []
+        delivered = []
+
+        async def _search(term, delay):
+            try:
+                await asyncio.sleep(delay)
+            except asyncio.CancelledError:
+                cancelled.append(term)
+                raise
+            return term
+
+        # --- Act ---
+        worker.run_latest("search", _search("a", 0.5), lambda r, e: delivered.append((r, e)))
+        qtbot.wait(50) # Let the first search start running.
+        worker.run_latest("search", _search("ab", 0.01), lambda r, e: delivered.append((r, e)))
+
+        # --- Assert ---
+        qtbot.waitUntil(lambda: len(delivered) == 1, timeout=2000)
+        qtbot.wait(100)
+        assert delivered == [("ab", None)]
+        assert cancelled == ["a"]
+
+    def test_different_keys_do_not_interfere(self, worker_pool, callback_executor, qtbot):
+        """Verify that tasks with different keys both complete."""
+        # --- Arrange ---
+        worker = worker_pool.worker(TaskLane.INTERACTIVE)
+        worker.callbacks_ready.connect(callback_executor.execute_batch)
+        delivered = []
+
+        async def _load(name):
+            await asyncio.sleep(0.01)
+            return name
+
+        # --- Act ---
+        worker.run_latest("products", _load("products"), lambda r, e: delivered.append((r, e)))
+        worker.run_latest("customers", _load("customers"), lambda r, e: delivered.append((r, e)))
+
+        # --- Assert ---
+        qtbot.waitUntil(lambda: len(delivered) == 2, timeout=2000)
+        assert sorted(delivered) == [("customers", None), ("products", None)]
+
+
+class TestCallbackBatching:
+    """Test suite for coalesced callback delivery across the Qt thread boundary."""
+
+    def test_burst_of_results_is_drained_in_batches(self, worker_pool, callback_executor, qtbot):
+        """Verify that a burst of completions is delivered in fewer slot invocations than callbacks."""
+        # --- Arrange ---
+        worker = worker_pool.worker(TaskLane.INTERACTIVE)
+        worker.callbacks_ready.connect(callback_executor.execute_batch)
+        delivered = []
+
+        async def _scan(n):
+            return n
+
+        # --- Act ---
+        # Submit the burst without spinning the Qt event loop, as a scanner gun would.
+        for n in range(50):
+            worker.run_task(_scan(n), lambda r, e: delivered.append(r))
+        worker.run_task_and_wait(asyncio.sleep(0.1))
+
+        # --- Assert ---
+        qtbot.waitUntil(lambda: len(delivered) == 50, timeout=2000)
+        assert sorted(delivered) == list(range(50))
+        stats = callback_executor.stats()
+        assert stats["callbacks"] == 50
+        assert stats["batches"] < 50
+        assert stats["max_batch_size"] > 1
+        assert sum(stats["batch_size_histogram"].values()) == stats["batches"]
+
+
+class TestOffloadExecutors:
+    """Test suite for offloading blocking and CPU-bound work off the lane loops."""
+
+    def test_run_blocking_keeps_loop_responsive(self, worker_pool):
+        """Verify that a blocking call runs on a pool thread while the loop keeps ticking."""
+        # --- Arrange ---
+        import threading
+        import time
+        worker = worker_pool.worker(TaskLane.INTERACTIVE)
+        ticks = []
+
+        async def _scenario():
+            async def _ticker():
+                for _ in range(5):
+                    ticks.append(1)
+                    await asyncio.sleep(0.01)
+            ticker = asyncio.create_task(_ticker())
+            thread_name = await worker.run_blocking(lambda: (time.sleep(0.1), threading.current_thread().name)[1])
+            await ticker
+            return thread_name
+
+        # --- Act ---
+        thread_name = worker.run_task_and_wait(_scenario())
+
+        # --- Assert ---
+        assert thread_name.startswith("sgpos-blocking")
+        assert len(ticks) == 5
+
+    def test_run_cpu_returns_result_from_process_pool(self, worker_pool):
+        """Verify that a picklable function runs in the process pool and its result is returned."""
+        # --- Act ---
+        result = worker_pool.worker(TaskLane.BACKGROUND).run_task_and_wait(
+            worker_pool.worker(TaskLane.BACKGROUND).run_cpu(pow, 2, 10)
+        )
+
+        # --- Assert ---
+        assert result == 1024
+
+
+class TestTaskMetrics:
+    """Test suite for per-task latency instrumentation."""
+
+    def test_tasks_are_recorded_by_qualname(self, worker_pool, callback_executor, qtbot):
+        """Verify that queue, run and callback latencies are recorded under the coroutine's qualname."""
+        # --- Arrange ---
+        worker = worker_pool.worker(TaskLane.INTERACTIVE)
+        worker.callbacks_ready.connect(callback_executor.execute_batch)
+        delivered = []
+
+        async def _lookup(n):
+            await asyncio.sleep(0.01)
+            return n
+
+        # --- Act ---
+        for n in range(3):
+            worker.run_task(_lookup(n), lambda r, e: delivered.append(r))
+        qtbot.waitUntil(lambda: len(delivered) == 3, timeout=2000)
+
+        # --- Assert ---
+        stats = worker_pool.metrics_snapshot()[TaskLane.INTERACTIVE][_lookup.__qualname__]
+        assert stats["completed"] == 3
+        assert stats["run_ms"]["p50"] >= 10
+        assert stats["queue_ms"]["p99"] is not None
+        assert stats["callback_ms"]["p95"] is not None
+
+    def test_superseded_tasks_count_as_cancelled(self, limited_worker, qtbot):
+        """Verify that run_latest supersessions are recorded as cancellations and show in the summary."""
+        # --- Arrange ---
+        async def _search(delay):
+            await asyncio.sleep(delay)
+
+        # --- Act ---
+        limited_worker.run_latest("search", _search(1))
+        limited_worker.run_task_and_wait(asyncio.sleep(0.05))
+        limited_worker.run_latest("search", _search(0))
+        qtbot.waitUntil(lambda: limited_worker.metrics.snapshot().get(_search.__qualname__, {}).get("completed") == 1, timeout=2000)
+
+        # --- Assert ---
+        assert limited_worker.metrics.snapshot()[_search.__qualname__]["cancelled"] == 1
+        summary = limited_worker.metrics.format_summary()
+        assert _search.__qualname__ in summary
+        assert limited_worker.metrics.format_summary() is None
+
+
+class TestBackpressure:
+    """Test suite for bounded admission and saturation signalling."""
+
+    def test_reject_policy_refuses_and_signals_saturation(self, bounded_worker_factory, callback_executor, qtbot):
+        """Verify that a full worker refuses new tasks with TaskRejectedError and reports saturation both ways."""
+        # --- Arrange ---
+        worker = bounded_worker_factory(BackpressurePolicy.REJECT)
+        worker.callbacks_ready.connect(callback_executor.execute_batch)
+        recorder = _SaturationRecorder()
+        worker.saturation_changed.connect(recorder.record)
+        errors = []
+
+        async def _slow_query():
+            await asyncio.sleep(0.1)
+
+        # --- Act ---
+        assert worker.run_task(_slow_query())
+        assert worker.run_task(_slow_query())
+        admitted = worker.run_task(_slow_query(), lambda r, e: errors.append(e))
+        critical_admitted = worker.run_task(_slow_query(), priority=TaskPriority.CRITICAL)
+
+        # --- Assert ---
+        assert admitted is False
+        assert critical_admitted is True
+        qtbot.waitUntil(lambda: recorder.states == [True, False], timeout=2000)
+        assert isinstance(errors[0], TaskRejectedError)
+
+    def test_drop_oldest_policy_makes_room_only_for_the_same_key(self, bounded_worker_factory, callback_executor, qtbot):
+        """Verify that a full worker admits a newer run_latest request in place of its superseded one, but never evicts unkeyed writes."""
+        # --- Arrange ---
+        worker = bounded_worker_factory(BackpressurePolicy.DROP_OLDEST)
+        worker.callbacks_ready.connect(callback_executor.execute_batch)
+        outcomes = []
+
+        async def _refresh(n):
+            await asyncio.sleep(0.05)
+            return n
+
+        async def _write(record):
+            await asyncio.sleep(0.2) # Holds its slot while the later submissions arrive.
+            return record
+
+        # --- Act ---
+        worker.run_latest("refresh", _refresh(1), lambda r, e: outcomes.append((r, type(e))))
+        worker.run_task_and_wait(asyncio.sleep(0.01)) # Let the first refresh start running.
+        worker.run_task(_write("a"), lambda r, e: outcomes.append((r, type(e)))) # The worker is now full.
+        refresh_admitted = worker.run_latest("refresh", _refresh(2), lambda r, e: outcomes.append((r, type(e))))
+        write_admitted = worker.run_task(_write("b"), lambda r, e: outcomes.append((r, type(e))))
+
+        # --- Assert ---
+        qtbot.waitUntil(lambda: len(outcomes) == 3, timeout=2000)
+        assert refresh_admitted is True
+        assert write_admitted is False
+        assert (None, TaskRejectedError) in outcomes
+        assert sorted((r for r, e in outcomes if r is not None), key=str) == [2, "a"]
+
+    def test_block_policy_waits_for_room(self, bounded_worker_factory):
+        """Verify that with the block policy the submitter waits for a slot instead of being refused."""
+        # --- Arrange ---
+        worker = bounded_worker_factory(BackpressurePolicy.BLOCK, block_timeout=2.0)
+
+        async def _slow_query():
+            await asyncio.sleep(0.05)
+
+        # --- Act ---
+        results = [worker.run_task(_slow_query()) for _ in range(4)]
+
+        # --- Assert ---
+        assert results == [True, True, True, True]
+
+
+class TestTaskDeadlines:
+    """Test suite for per-task deadlines."""
+
+    def test_task_past_deadline_fails_with_timeout_and_lane_recovers(self, worker_pool, callback_executor, qtbot):
+        """Verify that a task exceeding its timeout is cancelled with TaskTimeoutError and the lane keeps working."""
+        # --- Arrange ---
+        worker = worker_pool.worker(TaskLane.INTERACTIVE)
+        worker.callbacks_ready.connect(callback_executor.execute_batch)
+        outcomes = []
+
+        async def _hung_query():
+            await asyncio.sleep(10)
+
+        async def _quick_query():
+            return "ok"
+
+        # --- Act ---
+        worker.run_task(_hung_query(), lambda r, e: outcomes.append(e), timeout=0.05)
+        qtbot.waitUntil(lambda: len(outcomes) == 1, timeout=2000)
+        worker.run_task(_quick_query(), lambda r, e: outcomes.append(r))
+
+        # --- Assert ---
+        qtbot.waitUntil(lambda: len(outcomes) == 2, timeout=2000)
+        assert isinstance(outcomes[0], TaskTimeoutError)
+        assert outcomes[1] == "ok"
+
+    def test_deadline_is_visible_inside_the_task(self, worker_pool, callback_executor, qtbot):
+        """Verify that the remaining deadline is published to code running inside the task."""
+        # --- Arrange ---
+        worker = worker_pool.worker(TaskLane.INTERACTIVE)
+        worker.callbacks_ready.connect(callback_executor.execute_batch)
+        remaining = []
+
+        async def _read_deadline():
+            return remaining_task_time()
+
+        # --- Act ---
+        worker.run_task(_read_deadline(), lambda r, e: remaining.append(r), timeout=5)
+        worker.run_task(_read_deadline(), lambda r, e: remaining.append(r))
+
+        # --- Assert ---
+        qtbot.waitUntil(lambda: len(remaining) == 2, timeout=2000)
+        assert remaining.count(None) == 1
+        assert all(0 < r <= 5 for r in remaining if r is not None)
@@ -0,0 +1,95 @@
+# File: tests/unit/core/test_batch_loader.py
+"""
+Unit tests for the DataLoader-style BatchLoader and BaseService.load.
+"""
+import asyncio
+import uuid
+from decimal import Decimal
+import pytest
+from sqlalchemy import event
+
+from app.core.batch_loader import BatchLoader
+from app.core.result import Success, Failure
+from app.models.product import Product
+
+pytestmark = pytest.mark.asyncio
+
+class _Record:
+    def __init__(self, key): self.key = key
+
+def _recording_loader(missing=(), fail=False):
+    calls = []
+    async def fetch_many(keys, session):
+        calls.append((sorted(keys), session))
+        if fail:
+            return Failure("boom")
+        return Success([_Record(k) for k in keys if k not in missing])
+    return BatchLoader(fetch_many, lambda record: record.key), calls
+
+class TestBatchLoader:
+    """Test suite for coalescing loads into batches."""
+
+    async def test_loads_in_the_same_tick_share_one_fetch(self):
+        """Verify that gathered loads (including duplicates) are resolved by a single fetch_many call."""
+        # --- Arrange ---
+        loader, calls = _recording_loader(missing={3})
+
+        # --- Act ---
+        results = await asyncio.gather(*(loader.load(k) for k in (1, 2, 2, 3)))
+
+        # --- Assert ---
+        assert calls == [([1, 2, 3], None)]
+        assert [r.value.key if r.value else None for r in results] == [1, 2, 2, None]
+
+    async def test_sequential_loads_and_different_sessions_are_not_mixed(self):
+        """Verify that awaited loads dispatch separately and batches never span sessions."""
+        # --- Arrange ---
+        loader, calls = _recording_loader()
+        first_session, second_session = object(), object()
+
+        # --- Act ---
+        await loader.load(1, first_session)
+        await asyncio.gather(loader.load(2, first_session), loader.load(3, second_session))
+
+        # --- Assert ---
+        assert sorted(calls, key=lambda c: c[0]) == [([1], first_session), ([2], first_session), ([3], second_session)]
+
+    async def test_failure_is_delivered_to_every_waiting_load(self):
+        """Verify that a failed batch fetch resolves every load in it with the Failure."""
+        # --- Arrange ---
+        loader, _ = _recording_loader(fail=True)
+
+        # --- Act ---
+        result = await loader.load_many([1, 2])
+
+        # --- Assert ---
+        assert isinstance(result, Failure) and result.error == "boom"
+
+class TestServiceLoad:
+    """Test suite for the batched load on BaseService."""
+
+    async def test_load_many_issues_one_query(self, test_core, db_session):
+        """Verify that loading several products runs a single SELECT and keeps id order."""
+        # --- Arrange ---
+        company_id = uuid.uuid4()
+        products = [Product(company_id=company_id, sku=f"BL-{i}", name=f"Batch {i}", cost_price=Decimal("1.00"), selling_price=Decimal("2.00")) for i in range(3)]
+        db_session.add_all(products)
+        await db_session.flush()
+        db_session.expunge_all()
+        ids = [p.id for p in reversed(products)] + [uuid.uuid4()]
+        statements = []
+        engine = db_session.bind.sync_engine
+        def listener(conn, cursor, statement, *args):
+            statements.append(statement)
+        event.listen(engine, "before_cursor_execute", listener)
+
+        # --- Act ---
+        try:
+            result = await test_core.product_service.load_many(ids, db_session)
+        finally:
+            event.remove(engine, "before_cursor_execute", listener)
+
+        # --- Assert ---
+        assert isinstance(result, Success)
+        assert [p.sku if p else None for p in result.value] == ["BL-2", "BL-1", "BL-0", None]
+        assert len([s for s in statements if s.lstrip().upper().startswith("SELECT")]) == 1
@@ -0,0 +1,130 @@
+# File: tests/unit/core/test_catalog_index.py
+"""
+Unit tests for the in-memory barcode/SKU catalog index.
+"""
+import uuid
+from decimal import Decimal
+import pytest
+import sqlalchemy as sa
+
+from app.business_logic.dto.product_dto import ProductListItemDTO
+from app.business_logic.dto.sales_dto import SaleCreateDTO, PaymentInfoDTO
+from app.core.catalog_index import CatalogIndex
+from app.core.result import Success
+from app.models.product import Product
+from app.services.product_service import CATALOG_FIELDS
+from app.ui.views.pos_view import CartItemDisplay, CartTableModel
+
+pytestmark = pytest.mark.asyncio
+
+async def _index_with_products(test_core, db_session, company_id, products):
+    db_session.add_all(products)
+    await db_session.flush()
+    index = CatalogIndex(lambda since: test_core.product_service.get_catalog_rows(company_id, since, db_session), CATALOG_FIELDS)
+    assert isinstance(await index.refresh(), Success)
+    return index
+
+def _product(company_id, sku, barcode=None, is_active=True):
+    return Product(company_id=company_id, sku=sku, barcode=barcode, name=f"Product {sku}", is_active=is_active,
+                   cost_price=Decimal("1.00"), selling_price=Decimal("2.50"))
+
+class TestCatalogIndex:
+    """Test suite for loading, looking up and refreshing the catalog index."""
+
+    async def test_lookup_by_barcode_or_sku(self, test_core, db_session):
+        """Verify that active products resolve by exact barcode or case-insensitive SKU, and inactive ones do not."""
+        # --- Arrange ---
+        company_id = uuid.uuid4()
+        index = await _index_with_products(test_core, db_session, company_id, [
+            _product(company_id, "CI-APPLE", barcode="8880001"),
+            _product(company_id, "CI-OLD", barcode="8880002", is_active=False),
+        ])
+
+        # --- Act ---
+        by_barcode, by_sku = index.lookup("8880001"), index.lookup(" ci-apple ")
+
+        # --- Assert ---
+        assert by_barcode["sku"] == "CI-APPLE" and by_barcode["selling_price"] == Decimal("2.50")
+        assert by_sku["id"] == by_barcode["id"]
+        assert index.lookup("8880002") is None and index.lookup("CI-OLD") is None
+        assert index.lookup("CI-APP") is None # Partial codes are left to the database search.
+        assert index.stats()["products"] == 1
+
+    async def test_refresh_applies_changed_rows(self, test_core, db_session):
+        """Verify that an incremental refresh moves a changed barcode and drops a deactivated product."""
+        # --- Arrange ---
+        company_id = uuid.uuid4()
+        renamed, retired = _product(company_id, "CI-1", barcode="1001"), _product(company_id, "CI-2", barcode="1002")
+        index = await _index_with_products(test_core, db_session, company_id, [renamed, retired])
+        renamed.barcode = "2001"
+        retired.is_active = False
+        await db_session.flush()
+
+        # --- Act ---
+        result = await index.refresh()
+
+        # --- Assert ---
+        assert isinstance(result, Success) and result.value >= 2
+        assert index.lookup("1001") is None and index.lookup("2001")["sku"] == "CI-1"
+        assert index.lookup("1002") is None and index.lookup("CI-2") is None
+
+    async def test_forget_drops_a_product_until_the_next_refresh(self, test_core, db_session):
+        """Verify that a locally edited product misses until the index is refreshed."""
+        # --- Arrange ---
+        company_id = uuid.uuid4()
+        product = _product(company_id, "CI-EDIT", barcode="3001")
+        index = await _index_with_products(test_core, db_session, company_id, [product])
+
+        # --- Act ---
+        index.forget(product.id)
+        forgotten = index.lookup("3001")
+        await index.refresh()
+
+        # --- Assert ---
+        assert forgotten is None
+        assert index.lookup("3001")["id"] == product.id
+
+    async def test_sale_charges_the_database_price_not_the_indexed_one(self, test_core, db_session):
+        """Verify that a product repriced elsewhere after indexing and caching is charged at the database price."""
+        # --- Arrange ---
+        company_id = uuid.uuid4()
+        product = _product(company_id, "CI-PRICE", barcode="4001")
+        product.track_inventory = False
+        index = await _index_with_products(test_core, db_session, company_id, [product])
+        db_session.expunge(product)
+        await test_core.product_service.get_by_id(product.id) # Cached in the entity cache too.
+        async with test_core.get_session() as session: # Another terminal's repricing: no cache invalidation here.
+            await session.execute(sa.update(Product.__table__).where(Product.__table__.c.id == product.id).values(selling_price=Decimal("3.00")))
+        cart_item = CartItemDisplay(ProductListItemDTO(**index.lookup("4001")), Decimal("2"))
+        sale = SaleCreateDTO(
+            company_id=company_id, outlet_id=uuid.uuid4(), cashier_id=uuid.uuid4(), cart_items=[cart_item.to_cart_item_dto()],
+            payments=[PaymentInfoDTO(payment_method_id=uuid.uuid4(), amount=Decimal("20.00"))],
+        )
+
+        # --- Act ---
+        result = await test_core.sales_manager.finalize_sale(sale)
+
+        # --- Assert ---
+        assert cart_item.product.selling_price == Decimal("2.50") # The till displayed the stale price...
+        assert isinstance(result, Success), result
+        assert result.value.items[0].unit_price == Decimal("3.00") # ...but charged the current one.
+
+    async def test_cart_reprices_from_a_fresh_read(self, test_core, db_session):
+        """Verify that the cart picks up a price changed after its row was served from the index."""
+        # --- Arrange ---
+        company_id = uuid.uuid4()
+        product = _product(company_id, "CI-CART", barcode="5001")
+        index = await _index_with_products(test_core, db_session, company_id, [product])
+        cart = CartTableModel()
+        cart.add_item(ProductListItemDTO(**index.lookup("5001")), Decimal("2"))
+        async with test_core.get_session() as session:
+            await session.execute(sa.update(Product.__table__).where(Product.__table__.c.id == product.id).values(selling_price=Decimal("3.00")))
+
+        # --- Act ---
+        current = await test_core.product_manager.get_current_list_items(cart.product_ids())
+        changed = cart.reprice(current.value)
+
+        # --- Assert ---
+        assert changed is True
+        assert cart.get_cart_summary()[0] == Decimal("6.00")
+        assert cart.reprice(current.value) is False
@@ -0,0 +1,144 @@
+# File: tests/unit/core/test_database.py
+"""
+Unit tests for engine construction, connection pool metrics and replica routing.
+"""
+import asyncio
+import sqlite3
+import pytest
+import sqlalchemy as sa
+from sqlalchemy import event
+from sqlalchemy.pool import AsyncAdaptedQueuePool
+
+from app.core.application_core import ApplicationCore
+from app.core.async_bridge import task_deadline
+from app.core.database import build_engine, PoolMetrics
+
+def _make_sqlite_db(path, label):
+    """Creates a SQLite file whose single row says which database it is."""
+    with sqlite3.connect(path) as conn:
+        conn.execute("CREATE TABLE marker (label TEXT)")
+        conn.execute("INSERT INTO marker VALUES (?)", (label,))
+
+@pytest.fixture
+def replica_core_factory(qapp, test_settings, tmp_path):
+    """Starts an ApplicationCore on a primary SQLite file with the given replica URL."""
+    cores = []
+    def _factory(replica_url):
+        primary = tmp_path / "primary.db"
+        _make_sqlite_db(primary, "primary")
+        settings = test_settings.model_copy(update={
+            "DATABASE_URL": f"sqlite+aiosqlite:///{primary}",
+            "DATABASE_REPLICA_URL": replica_url,
+            "ASYNC_WORKER_LANES": ["interactive"],
+        })
+        core = ApplicationCore(settings)
+        core.initialize()
+        cores.append(core)
+        return core
+    yield _factory
+    for core in cores:
+        core.shutdown()
+
+async def _read_marker(core, readonly):
+    async with core.get_session(readonly=readonly) as session:
+        return (await session.execute(sa.text("SELECT label FROM marker"))).scalar_one()
+
+class TestBuildEngine:
+    """Test suite for building engines from the pool settings."""
+
+    async def test_postgres_engine_uses_pool_settings(self, test_settings):
+        """Verify that a PostgreSQL engine is sized and tuned from the settings."""
+        # --- Act ---
+        engine = build_engine(test_settings, "postgresql+asyncpg://user:pw@localhost:5432/sgpos")
+
+        # --- Assert ---
+        try:
+            pool = engine.pool
+            assert isinstance(pool, AsyncAdaptedQueuePool)
+            assert pool.size() == test_settings.DB_POOL_SIZE
+            assert pool._max_overflow == test_settings.DB_MAX_OVERFLOW
+            assert pool._recycle == test_settings.DB_POOL_RECYCLE_SECONDS
+            assert pool._pre_ping == test_settings.DB_POOL_PRE_PING
+        finally:
+            await engine.dispose()
+
+class TestPoolMetrics:
+    """Test suite for connection pool statistics."""
+
+    async def test_slow_checkouts_are_counted_and_logged(self, test_settings, tmp_path, caplog):
+        """Verify that checkout waits are summarized and those above the threshold are flagged."""
+        # --- Arrange ---
+        engine = build_engine(test_settings, f"sqlite+aiosqlite:///{tmp_path / 'pool.db'}")
+        metrics = PoolMetrics(engine, "interactive", slow_checkout_ms=50)
+
+        # --- Act ---
+        metrics.record_checkout_wait(0.001)
+        metrics.record_checkout_wait(0.2)
+        stats = metrics.snapshot()
+
+        # --- Assert ---
+        await engine.dispose()
+        assert stats["checkouts"] == 2
+        assert stats["slow_checkouts"] == 1
+        assert stats["max_wait_ms"] == pytest.approx(200)
+        assert stats["wait_ms"]["p50"] is not None
+        assert "waited 200.0 ms" in caplog.text
+
+class TestReplicaRouting:
+    """Test suite for routing read-only sessions to the replica."""
+
+    def test_readonly_sessions_use_the_replica(self, replica_core_factory, tmp_path):
+        """Verify that readonly sessions read from the replica while writes stay on the primary."""
+        # --- Arrange ---
+        replica = tmp_path / "replica.db"
+        _make_sqlite_db(replica, "replica")
+        core = replica_core_factory(f"sqlite+aiosqlite:///{replica}")
+
+        # --- Act ---
+        readonly_label = core.async_worker.run_task_and_wait(_read_marker(core, readonly=True))
+        primary_label = core.async_worker.run_task_and_wait(_read_marker(core, readonly=False))
+
+        # --- Assert ---
+        assert readonly_label == "replica"
+        assert primary_label == "primary"
+        assert core.pool_stats()["interactive-replica"]["checkouts"] == 1
+
+    def test_unreachable_replica_falls_back_to_primary(self, replica_core_factory, tmp_path):
+        """Verify that readonly sessions fall back to the primary when the replica cannot be reached."""
+        # --- Arrange ---
+        core = replica_core_factory(f"sqlite+aiosqlite:///{tmp_path / 'missing' / 'replica.db'}")
+
+        # --- Act ---
+        label = core.async_worker.run_task_and_wait(_read_marker(core, readonly=True))
+
+        # --- Assert ---
+        assert label == "primary"
+
+class TestTaskDeadline:
+    """Test suite for applying a task's deadline to its database transaction."""
+
+    async def test_deadline_is_set_with_one_bound_statement(self, test_core, db_session, monkeypatch):
+        """Verify that a PostgreSQL session gets statement and lock timeouts from a single parameterised set_config call."""
+        # --- Arrange ---
+        raw_connection = await (await db_session.connection()).get_raw_connection()
+        await raw_connection.driver_connection.create_function("set_config", 3, lambda name, value, is_local: value)
+        monkeypatch.setattr(db_session.bind.dialect, "name", "postgresql") # The statement is only issued on PostgreSQL.
+        statements = []
+        def _record(conn, cursor, statement, parameters, *args):
+            statements.append((statement, parameters))
+        event.listen(db_session.bind.sync_engine, "before_cursor_execute", _record)
+        task_deadline.set(asyncio.get_running_loop().time() + 5)
+
+        # --- Act ---
+        try:
+            async with test_core.get_session():
+                pass
+        finally:
+            event.remove(db_session.bind.sync_engine, "before_cursor_execute", _record)
+            task_deadline.set(None)
+
+        # --- Assert ---
+        assert len(statements) == 1
+        statement, parameters = statements[0]
+        assert statement == "SELECT set_config('statement_timeout', ?, true), set_config('lock_timeout', ?, true)"
+        assert parameters[0] == parameters[1] and 4000 < int(parameters[0]) <= 5000
@@ -0,0 +1,137 @@
+# File: tests/unit/core/test_entity_cache.py
+"""
+Unit tests for the entity cache and its use by BaseService.
+"""
+import uuid
+from decimal import Decimal
+import pytest
+import sqlalchemy as sa
+from sqlalchemy.orm import object_session
+
+from app.core import entity_cache
+from app.core.entity_cache import EntityCache
+from app.core.result import Success
+from app.models.product import Product
+
+def _product(**overrides):
+    values = dict(id=uuid.uuid4(), company_id=uuid.uuid4(), sku="EC-1", name="Cached", description=None, barcode=None,
+                  category_id=None, supplier_id=None, cost_price=Decimal("1.00"), selling_price=Decimal("2.00"),
+                  gst_rate=Decimal("9.00"), track_inventory=True, is_active=True, reorder_point=0, created_at=None, updated_at=None)
+    values.update(overrides)
+    return Product(**values)
+
+class TestEntityCache:
+    """Test suite for the snapshot cache itself."""
+
+    def test_hit_returns_a_fresh_detached_copy(self):
+        """Verify that each hit builds a new instance carrying the cached column values."""
+        # --- Arrange ---
+        cache = EntityCache(Product, max_entries=10, ttl_seconds=60)
+        product = _product()
+        cache.put(product)
+
+        # --- Act ---
+        first, second = cache.get(product.id), cache.get(product.id)
+
+        # --- Assert ---
+        assert first is not second and first is not product
+        assert (first.sku, first.selling_price) == ("EC-1", Decimal("2.00"))
+        assert sa.inspect(first).detached
+        assert cache.stats()["hits"] == 2
+
+    def test_expired_and_evicted_entries_miss(self, monkeypatch):
+        """Verify that entries past the TTL and least recently used entries beyond the limit are dropped."""
+        # --- Arrange ---
+        now = [1000.0]
+        monkeypatch.setattr(entity_cache.time, "monotonic", lambda: now[0])
+        cache = EntityCache(Product, max_entries=2, ttl_seconds=30)
+        a, b, c = _product(), _product(), _product()
+        cache.put(a); cache.put(b)
+        cache.get(a.id)  # b is now the least recently used
+
+        # --- Act ---
+        cache.put(c)
+        evicted = cache.get(b.id)
+        now[0] += 31
+        expired = cache.get(a.id)
+
+        # --- Assert ---
+        assert evicted is None and expired is None
+        stats = cache.stats()
+        assert (stats["evictions"], stats["entries"]) == (1, 1)
+        assert (stats["hits"], stats["misses"]) == (1, 2)
+
+    def test_instances_with_unloaded_columns_are_not_cached(self):
+        """Verify that a partially loaded instance never becomes a snapshot."""
+        # --- Arrange ---
+        cache = EntityCache(Product, max_entries=10, ttl_seconds=60)
+        product = Product(id=uuid.uuid4(), sku="PARTIAL")
+
+        # --- Act ---
+        cache.put(product)
+
+        # --- Assert ---
+        assert cache.stats()["entries"] == 0
+
+@pytest.mark.asyncio
+class TestServiceEntityCache:
+    """Test suite for the read-through cache in BaseService."""
+
+    async def _add_product(self, db_session):
+        product = Product(company_id=uuid.uuid4(), sku="EC-DB", name="Cached Product", cost_price=Decimal("1.00"), selling_price=Decimal("2.00"))
+        db_session.add(product)
+        await db_session.flush()
+        await db_session.refresh(product)
+        db_session.expunge(product)
+        return product.id
+
+    async def test_second_lookup_is_served_from_the_cache(self, test_core, db_session):
+        """Verify that get_by_id reads through once and then attaches cached copies to the caller's session."""
+        # --- Arrange ---
+        product_id = await self._add_product(db_session)
+        service = test_core.product_service
+
+        # --- Act ---
+        first = await service.get_by_id(product_id)
+        second = await service.get_by_id(product_id, db_session)
+        ids_result = await service.get_by_ids([product_id, product_id])
+
+        # --- Assert ---
+        assert isinstance(first, Success) and first.value.id == product_id
+        assert isinstance(second, Success) and second.value.name == "Cached Product"
+        assert object_session(second.value) is db_session.sync_session
+        assert [p.id for p in ids_result.value] == [product_id]
+        assert test_core.entity_cache_stats()["products"]["misses"] == 1
+        assert test_core.entity_cache_stats()["products"]["hits"] == 2
+
+    async def test_flushed_changes_invalidate_the_entry(self, test_core, db_session):
+        """Verify that changing a cached entity through any session drops it from the cache."""
+        # --- Arrange ---
+        product_id = await self._add_product(db_session)
+        service = test_core.product_service
+        await service.get_by_id(product_id)
+
+        # --- Act ---
+        product = (await service.get_by_id(product_id, db_session)).value
+        product.selling_price = Decimal("3.50")
+        await db_session.flush()
+        db_session.expunge_all()
+        refreshed = await service.get_by_id(product_id)
+
+        # --- Assert ---
+        assert refreshed.value.selling_price == Decimal("3.50")
+        assert test_core.entity_cache_stats()["products"]["misses"] == 2
+
+    async def test_bulk_update_invalidates_the_entry(self, test_core, db_session):
+        """Verify that bulk statements, which bypass the unit of work, also invalidate."""
+        # --- Arrange ---
+        product_id = await self._add_product(db_session)
+        service = test_core.product_service
+        await service.get_by_id(product_id)
+
+        # --- Act ---
+        await service.bulk_update([{"id": product_id, "name": "Renamed"}], db_session)
+        refreshed = await service.get_by_id(product_id)
+
+        # --- Assert ---
+        assert refreshed.value.name == "Renamed"
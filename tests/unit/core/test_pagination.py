@@ -0,0 +1,86 @@
+# File: tests/unit/core/test_pagination.py
+"""
+Unit tests for the keyset pagination cursor helpers.
+"""
+import uuid
+from datetime import datetime
+from decimal import Decimal
+import pytest
+
+from app.core.pagination import InvalidCursorError, cursor_total, decode_cursor, encode_cursor, page_from_rows, pop_total
+
+class TestCursor:
+    """Test suite for encoding and decoding opaque cursors."""
+
+    def test_round_trip_preserves_value_types(self):
+        """Verify that the sort key decodes to exactly the values that were encoded."""
+        # --- Arrange ---
+        key = ("Widget", uuid.uuid4(), Decimal("1.10"), datetime(2024, 5, 1, 12, 30), 7, None)
+
+        # --- Act ---
+        cursor = encode_cursor("products.name", key)
+
+        # --- Assert ---
+        assert decode_cursor(cursor, "products.name") == key
+
+    def test_cursor_from_another_ordering_is_rejected(self):
+        """Verify that a cursor cannot be replayed against a different ordering."""
+        # --- Arrange ---
+        cursor = encode_cursor("products.name", ("Widget", uuid.uuid4()))
+
+        # --- Act & Assert ---
+        with pytest.raises(InvalidCursorError):
+            decode_cursor(cursor, "customers.name")
+
+    def test_total_travels_with_the_cursor(self):
+        """Verify that a counted listing's total is read back from its cursor, and is None when not counted."""
+        # --- Act ---
+        counted = encode_cursor("products.name", ("Widget", 1), total=42)
+        uncounted = encode_cursor("products.name", ("Widget", 1))
+
+        # --- Assert ---
+        assert cursor_total(counted) == 42
+        assert decode_cursor(counted, "products.name") == ("Widget", 1)
+        assert cursor_total(uncounted) is None
+
+    def test_malformed_cursor_is_rejected(self):
+        """Verify that garbage input raises InvalidCursorError rather than a decoding error."""
+        # --- Act & Assert ---
+        with pytest.raises(InvalidCursorError):
+            decode_cursor("not-a-cursor", "products.name")
+
+class TestPageFromRows:
+    """Test suite for turning limit + 1 rows into a Page."""
+
+    def test_extra_row_yields_cursor_for_last_kept_row(self):
+        """Verify that the lookahead row is dropped and the cursor points at the last row returned."""
+        # --- Arrange ---
+        rows = [("a", 1), ("b", 2), ("c", 3)]
+
+        # --- Act ---
+        page = page_from_rows(rows, 2, "t.name", lambda r: r)
+
+        # --- Assert ---
+        assert page.items == [("a", 1), ("b", 2)]
+        assert decode_cursor(page.next_cursor, "t.name") == ("b", 2)
+
+    def test_short_page_is_the_last_page(self):
+        """Verify that a page with no lookahead row has no next cursor."""
+        # --- Act ---
+        page = page_from_rows([("a", 1)], 2, "t.name", lambda r: r)
+
+        # --- Assert ---
+        assert page.items == [("a", 1)] and page.next_cursor is None
+
+    def test_total_is_carried_to_the_next_page(self):
+        """Verify that the first page's total is popped from its rows and handed on through the cursor."""
+        # --- Arrange ---
+        rows = [{"name": n, "id": i, "page_total": 5} for i, n in enumerate("abc")]
+
+        # --- Act ---
+        first = page_from_rows(rows, 2, "t.name", lambda r: (r["name"], r["id"]), pop_total(rows, None))
+        second_total = pop_total([{"name": "d", "id": 3}], first.next_cursor)
+
+        # --- Assert ---
+        assert first.total == 5 and "page_total" not in first.items[0]
+        assert second_total == 5
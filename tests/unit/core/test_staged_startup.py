@@ -0,0 +1,56 @@
+# File: tests/unit/core/test_staged_startup.py
+"""
+Unit tests for ApplicationCore.initialize_async, the staged startup used by app.main.
+"""
+import pytest
+
+from app.core.application_core import ApplicationCore
+from app.core.exceptions import CoreException
+
+@pytest.fixture
+def staged_core_factory(qapp, test_settings):
+    """Creates ApplicationCores on the given database URL and shuts them down afterwards."""
+    cores = []
+    def _factory(database_url):
+        settings = test_settings.model_copy(update={"DATABASE_URL": database_url, "ASYNC_WORKER_LANES": ["interactive", "background"]})
+        core = ApplicationCore(settings)
+        cores.append(core)
+        return core
+    yield _factory
+    for core in cores:
+        core.shutdown()
+
+class TestStagedStartup:
+    """Test suite for initializing the core in the background."""
+
+    def test_workers_are_usable_before_the_database_is_ready(self, staged_core_factory, tmp_path, qtbot):
+        """Verify that initialize_async returns at once and reports readiness and phase timings later."""
+        # --- Arrange ---
+        core = staged_core_factory(f"sqlite+aiosqlite:///{tmp_path / 'staged.db'}")
+        outcomes = []
+
+        # --- Act ---
+        core.initialize_async(outcomes.append)
+        ready_on_return = core.is_ready
+        qtbot.waitUntil(lambda: len(outcomes) == 1, timeout=10000)
+
+        # --- Assert ---
+        assert ready_on_return is False
+        assert core.async_worker is not None
+        assert outcomes == [None]
+        assert core.is_ready
+        assert {"workers", "database"} <= set(core.startup_timings)
+
+    def test_connection_failure_is_reported_to_the_callback(self, staged_core_factory, tmp_path, qtbot):
+        """Verify that a database that cannot be opened is reported as a CoreException, not raised."""
+        # --- Arrange ---
+        core = staged_core_factory(f"sqlite+aiosqlite:///{tmp_path / 'missing' / 'staged.db'}")
+        outcomes = []
+
+        # --- Act ---
+        core.initialize_async(outcomes.append)
+        qtbot.waitUntil(lambda: len(outcomes) == 1, timeout=10000)
+
+        # --- Assert ---
+        assert isinstance(outcomes[0], CoreException)
+        assert not core.is_ready
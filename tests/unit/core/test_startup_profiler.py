@@ -0,0 +1,57 @@
+# File: tests/unit/core/test_startup_profiler.py
+"""
+Unit tests for the --profile-startup diagnostics.
+"""
+import json
+import sys
+import time
+
+from app.core.startup_profiler import StartupProfiler
+
+class TestStartupProfiler:
+    """Test suite for startup phase and import timing."""
+
+    def test_profiler_options_are_consumed_from_argv(self, tmp_path):
+        """Verify that only --profile-startup enables profiling and its options are removed from argv."""
+        # --- Arrange ---
+        output = str(tmp_path / "profile.json")
+        argv = ["app/main.py", "--profile-startup", "--profile-output", output, "-platform", "offscreen"]
+
+        # --- Act ---
+        profiler = StartupProfiler.from_argv(argv)
+        profiler.uninstall()
+        disabled = StartupProfiler.from_argv(["app/main.py"])
+
+        # --- Assert ---
+        assert profiler.output_path == output
+        assert argv == ["app/main.py", "-platform", "offscreen"]
+        assert disabled is None
+
+    def test_report_includes_phases_and_import_times(self, tmp_path, monkeypatch):
+        """Verify that imports made while installed are timed and the JSON report is written."""
+        # --- Arrange ---
+        (tmp_path / "sgpos_slow_parent.py").write_text("import time\ntime.sleep(0.02)\nimport sgpos_slow_child\n")
+        (tmp_path / "sgpos_slow_child.py").write_text("import time\ntime.sleep(0.03)\n")
+        monkeypatch.syspath_prepend(str(tmp_path))
+        profiler = StartupProfiler(str(tmp_path / "profile.json"))
+        profiler.install()
+
+        # --- Act ---
+        try:
+            started = time.perf_counter()
+            import sgpos_slow_parent # noqa: F401
+            profiler.record_phase("imports", started)
+        finally:
+            profiler.uninstall()
+            sys.modules.pop("sgpos_slow_parent", None)
+            sys.modules.pop("sgpos_slow_child", None)
+        report = profiler.finish({"database": 12.5})
+
+        # --- Assert ---
+        written = json.loads((tmp_path / "profile.json").read_text())
+        assert written["phases_ms"]["database"] == 12.5
+        assert written["phases_ms"]["imports"] >= 50
+        timings = {entry["module"]: entry for entry in report["imports"]["top_cumulative"]}
+        assert timings["sgpos_slow_parent"]["cumulative_ms"] >= 50
+        assert 15 <= timings["sgpos_slow_parent"]["self_ms"] < timings["sgpos_slow_parent"]["cumulative_ms"]
+        assert timings["sgpos_slow_child"]["self_ms"] >= 25
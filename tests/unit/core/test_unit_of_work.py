@@ -0,0 +1,91 @@
+# File: tests/unit/core/test_unit_of_work.py
+"""
+Unit tests for the ambient unit of work on ApplicationCore.
+"""
+import uuid
+from decimal import Decimal
+import pytest
+
+from app.core.result import Success, Failure
+from app.models.product import Product
+
+pytestmark = pytest.mark.asyncio
+
+def _product(company_id, sku):
+    return Product(company_id=company_id, sku=sku, name=f"Product {sku}", cost_price=Decimal("1.00"), selling_price=Decimal("2.00"))
+
+class TestUnitOfWork:
+    """Test suite for sharing one session across nested service calls."""
+
+    async def test_sessions_inside_unit_of_work_are_shared(self, test_core):
+        """Verify that get_session (readonly or not) and nested units reuse the unit's session."""
+        # --- Act ---
+        async with test_core.unit_of_work() as uow_session:
+            async with test_core.get_session() as first:
+                pass
+            async with test_core.get_session(readonly=True) as second:
+                pass
+            async with test_core.unit_of_work() as nested:
+                pass
+
+        # --- Assert ---
+        assert first is uow_session
+        assert second is uow_session
+        assert nested is uow_session
+
+    async def test_sessions_outside_unit_of_work_are_independent(self, test_core):
+        """Verify that without a unit of work each get_session opens its own session, and the ambient one is cleared."""
+        # --- Arrange ---
+        async with test_core.unit_of_work() as uow_session:
+            pass
+
+        # --- Act ---
+        async with test_core.get_session() as first:
+            pass
+        async with test_core.get_session() as second:
+            pass
+
+        # --- Assert ---
+        assert first is not second
+        assert uow_session not in (first, second)
+
+    async def test_service_calls_reuse_the_ambient_session(self, test_core, monkeypatch):
+        """Verify that a service call without an explicit session runs on the unit's session."""
+        # --- Arrange ---
+        seen = []
+
+        async with test_core.unit_of_work() as uow_session:
+            original_execute = uow_session.execute
+
+            async def _recording_execute(*args, **kwargs):
+                seen.append(uow_session)
+                return await original_execute(*args, **kwargs)
+            monkeypatch.setattr(uow_session, "execute", _recording_execute)
+
+            # --- Act ---
+            result = await test_core.product_service.get_by_sku(uuid.uuid4(), "NO-SUCH-SKU")
+
+        # --- Assert ---
+        assert result.value is None
+        assert seen == [uow_session]
+
+    async def test_failure_from_a_failed_flush_leaves_the_unit_cleanly(self, test_core, db_session):
+        """Verify that a unit whose flush hit a unique violation rolls back on exit instead of raising on commit."""
+        # --- Arrange ---
+        company_id = uuid.uuid4()
+        db_session.add(_product(company_id, "DUP-SKU"))
+        await db_session.flush()
+
+        async def _create_duplicate():
+            async with test_core.unit_of_work():
+                result = await test_core.product_service.create(_product(company_id, "DUP-SKU"))
+                if isinstance(result, Failure):
+                    return result
+                return Success(result.value)
+
+        # --- Act ---
+        result = await _create_duplicate()
+
+        # --- Assert ---
+        assert isinstance(result, Failure)
+        assert "integrity" in result.error
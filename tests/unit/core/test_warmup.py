@@ -0,0 +1,120 @@
+# File: tests/unit/core/test_warmup.py
+"""
+Unit tests for the startup warm-up and the payment method reference-data cache.
+"""
+import uuid
+from decimal import Decimal
+import pytest
+from sqlalchemy import event, func, select
+from sqlalchemy.ext.asyncio import async_sessionmaker
+
+from app.core.application_core import ApplicationCore
+from app.core.database import build_engine
+from app.core.warmup import warm_up
+from app.models.base import Base
+from app.models.company import Company, Outlet
+from app.models.sales import SalesTransaction, Payment, PaymentMethod
+from app.models.user import User
+from app.models.product import Product
+
+pytestmark = pytest.mark.asyncio
+
+@pytest.fixture
+async def warmup_core(test_settings, tmp_path, monkeypatch):
+    """An ApplicationCore bound to its own SQLite file with the schema created."""
+    engine = build_engine(test_settings, f"sqlite+aiosqlite:///{tmp_path / 'warmup.db'}")
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    core = ApplicationCore(test_settings)
+    monkeypatch.setattr(core, "_session_factory", async_sessionmaker(engine, expire_on_commit=False))
+    company_id = uuid.uuid4()
+    async with core.get_session() as session:
+        session.add(Company(id=company_id, name="Warm-up Co", registration_number=f"REG-{company_id.hex[:8]}"))
+    core._current_company_id = company_id
+    core._current_outlet_id = uuid.uuid4()
+    core._current_user_id = uuid.uuid4()
+    yield core, engine
+    await engine.dispose()
+
+async def _count(engine, model):
+    async with engine.connect() as conn:
+        return (await conn.execute(select(func.count()).select_from(model))).scalar_one()
+
+class TestWarmUp:
+    """Test suite for the startup warm-up."""
+
+    async def test_warm_up_reports_timings_and_leaves_no_rows(self, warmup_core):
+        """Verify that warm-up times each phase and rolls back every write it primes."""
+        # --- Arrange ---
+        core, engine = warmup_core
+
+        # --- Act ---
+        timings = await warm_up(core, engine, connections=2)
+
+        # --- Assert ---
+        assert set(timings) == {"connections_ms", "statements_ms", "reference_data_ms", "total_ms"}
+        assert timings["total_ms"] >= timings["connections_ms"]
+        assert await _count(engine, SalesTransaction) == 0
+        assert await _count(engine, Product) == 0
+
+    async def test_warm_up_primes_sale_writes_with_real_reference_rows(self, warmup_core):
+        """Verify that, with foreign keys enforced, the sale's stock, item and payment writes all run and are rolled back."""
+        # --- Arrange ---
+        core, engine = warmup_core
+        company_id = core.current_company_id
+        async with core.get_session() as session:
+            outlet = Outlet(company_id=company_id, code="WU", name="Warm-up Outlet")
+            user = User(company_id=company_id, username="warmup", email="warmup@example.com", password_hash="x")
+            session.add_all([
+                outlet, user, PaymentMethod(company_id=company_id, name="Cash", type="CASH"),
+                Product(company_id=company_id, sku="WU-1", name="Warm-up Product", cost_price=Decimal("1.00"), selling_price=Decimal("2.00")),
+            ])
+        core._current_outlet_id, core._current_user_id = outlet.id, user.id
+        await engine.dispose() # New connections get foreign key enforcement, as PostgreSQL always has it.
+        statements = []
+        event.listen(engine.sync_engine, "connect", lambda dbapi_conn, record: dbapi_conn.execute("PRAGMA foreign_keys=ON"))
+        event.listen(engine.sync_engine, "before_cursor_execute", lambda conn, cursor, statement, *args: statements.append(statement))
+
+        # --- Act ---
+        await warm_up(core, engine, connections=1)
+
+        # --- Assert ---
+        for table in ("inventory", "sales_transaction_items", "payments"):
+            assert any(statement.startswith(f"INSERT INTO {table} ") for statement in statements), table
+        assert await _count(engine, SalesTransaction) == 0
+        assert await _count(engine, Payment) == 0
+
+    async def test_warm_up_preloads_payment_methods(self, warmup_core, monkeypatch):
+        """Verify that the payment methods loaded during warm-up are served from the cache afterwards."""
+        # --- Arrange ---
+        core, engine = warmup_core
+        await warm_up(core, engine, connections=1)
+        calls = []
+        original = core.payment_method_service.get_all_active_methods
+
+        async def _recording(*args, **kwargs):
+            calls.append(args)
+            return await original(*args, **kwargs)
+        monkeypatch.setattr(core.payment_method_service, "get_all_active_methods", _recording)
+
+        # --- Act ---
+        result = await core.payment_method_manager.get_active_payment_methods(core.current_company_id)
+
+        # --- Assert ---
+        assert result.value == []
+        assert calls == []
+
+    async def test_cached_payment_methods_expire_after_the_ttl(self, warmup_core, monkeypatch):
+        """Verify that the payment method cache re-reads the database once ENTITY_CACHE_TTL_SECONDS has passed."""
+        # --- Arrange ---
+        core, _ = warmup_core
+        monkeypatch.setattr(core.settings, "ENTITY_CACHE_TTL_SECONDS", 0.0)
+        await core.payment_method_manager.get_active_payment_methods(core.current_company_id)
+        async with core.get_session() as session:
+            session.add(PaymentMethod(company_id=core.current_company_id, name="Card", type="CARD")) # e.g. added on another terminal
+
+        # --- Act ---
+        result = await core.payment_method_manager.get_active_payment_methods(core.current_company_id)
+
+        # --- Assert ---
+        assert [method.name for method in result.value] == ["Card"]
@@ -0,0 +1,163 @@
+# File: tests/unit/services/test_base_service.py
+"""
+Unit tests for the generic BaseService operations, exercised through ProductService.
+"""
+import uuid
+import sqlalchemy as sa
+from decimal import Decimal
+import pytest
+
+from app.core.result import Failure, Success
+from app.models.product import Product
+
+pytestmark = pytest.mark.asyncio
+
+async def _add_products(db_session, company_id, names):
+    for i, name in enumerate(names):
+        db_session.add(Product(company_id=company_id, sku=f"PG-{i:03d}", name=name,
+                               cost_price=Decimal("1.00"), selling_price=Decimal("2.00")))
+    await db_session.flush()
+
+class TestGetPage:
+    """Test suite for keyset pagination."""
+
+    async def test_pages_cover_every_row_once_in_order(self, test_core, db_session):
+        """Verify that walking the cursors returns each row exactly once, even with duplicate sort values."""
+        # --- Arrange ---
+        company_id = uuid.uuid4()
+        await _add_products(db_session, company_id, ["Apple", "Banana", "Banana", "Banana", "Cherry", "Apple", "Date"])
+        service = test_core.product_service
+
+        # --- Act ---
+        seen, cursor, pages = [], None, 0
+        while True:
+            result = await service.get_page(company_id, limit=2, cursor=cursor, order_by_column="name", session=db_session)
+            assert isinstance(result, Success)
+            seen.extend(result.value.items)
+            pages += 1
+            cursor = result.value.next_cursor
+            if cursor is None:
+                break
+
+        # --- Assert ---
+        assert pages == 4
+        assert len({p.id for p in seen}) == 7
+        assert [p.name for p in seen] == sorted(p.name for p in seen)
+
+    async def test_total_counts_matching_rows_on_every_page(self, test_core, db_session):
+        """Verify that with_total counts all filtered rows on the first page and keeps that total on later pages."""
+        # --- Arrange ---
+        company_id = uuid.uuid4()
+        await _add_products(db_session, company_id, ["Apple", "Banana", "Cherry", "Date", "Elderberry"])
+        await _add_products(db_session, uuid.uuid4(), ["Other company"])
+        service = test_core.product_service
+
+        # --- Act ---
+        first = await service.get_page(company_id, limit=2, order_by_column="name", session=db_session, with_total=True)
+        second = await service.get_page(company_id, limit=2, cursor=first.value.next_cursor, order_by_column="name", session=db_session)
+        uncounted = await service.get_page(company_id, limit=2, order_by_column="name", session=db_session)
+
+        # --- Assert ---
+        assert [p.name for p in first.value.items] == ["Apple", "Banana"]
+        assert first.value.total == 5 and second.value.total == 5
+        assert uncounted.value.total is None
+
+    async def test_cursor_for_another_ordering_fails(self, test_core, db_session):
+        """Verify that a cursor issued for one ordering is refused by another."""
+        # --- Arrange ---
+        company_id = uuid.uuid4()
+        await _add_products(db_session, company_id, ["Apple", "Banana"])
+        service = test_core.product_service
+        first = await service.get_page(company_id, limit=1, order_by_column="name", session=db_session)
+
+        # --- Act ---
+        result = await service.get_page(company_id, limit=1, cursor=first.value.next_cursor, order_by_column="sku", session=db_session)
+
+        # --- Assert ---
+        assert isinstance(result, Failure)
+        assert "ordering" in result.error
+
+def _product_rows(company_id, count, price="2.00"):
+    return [{"company_id": company_id, "sku": f"BULK-{i:03d}", "name": f"Bulk {i}",
+             "cost_price": Decimal("1.00"), "selling_price": Decimal(price)} for i in range(count)]
+
+class TestBulkOperations:
+    """Test suite for the batched bulk insert, update and upsert methods."""
+
+    async def test_bulk_create_returns_ids_in_input_order(self, test_core, db_session):
+        """Verify that rows spanning several batches are all inserted and their ids come back in order."""
+        # --- Arrange ---
+        company_id = uuid.uuid4()
+        service = test_core.product_service
+
+        # --- Act ---
+        result = await service.bulk_create(_product_rows(company_id, 25), db_session, batch_size=10)
+
+        # --- Assert ---
+        assert isinstance(result, Success)
+        assert len(result.value) == 25
+        first = await db_session.get(Product, result.value[0])
+        last = await db_session.get(Product, result.value[-1])
+        assert (first.sku, last.sku) == ("BULK-000", "BULK-024")
+
+    async def test_bulk_update_changes_rows_by_id(self, test_core, db_session):
+        """Verify that bulk_update applies each row's values to the record with its id."""
+        # --- Arrange ---
+        company_id = uuid.uuid4()
+        service = test_core.product_service
+        ids = (await service.bulk_create(_product_rows(company_id, 3), db_session)).value
+
+        # --- Act ---
+        result = await service.bulk_update([{"id": pid, "selling_price": Decimal(f"{i + 5}.00")} for i, pid in enumerate(ids)], db_session)
+
+        # --- Assert ---
+        assert isinstance(result, Success) and result.value == 3
+        prices = (await db_session.execute(sa.select(Product.selling_price).where(Product.id.in_(ids)).order_by(Product.sku))).scalars().all()
+        assert prices == [Decimal("5.00"), Decimal("6.00"), Decimal("7.00")]
+
+    async def test_bulk_upsert_updates_conflicting_rows_and_inserts_new_ones(self, test_core, db_session):
+        """Verify that an upsert keyed on (company_id, sku) keeps existing ids and inserts the rest."""
+        # --- Arrange ---
+        company_id = uuid.uuid4()
+        service = test_core.product_service
+        existing_ids = (await service.bulk_create(_product_rows(company_id, 2), db_session)).value
+
+        # --- Act ---
+        result = await service.bulk_upsert(_product_rows(company_id, 3, price="9.00"), conflict_columns=["company_id", "sku"], session=db_session)
+
+        # --- Assert ---
+        assert isinstance(result, Success)
+        assert result.value[:2] == existing_ids
+        prices = (await db_session.execute(sa.select(Product.selling_price).where(Product.company_id == company_id))).scalars().all()
+        assert len(prices) == 3 and set(prices) == {Decimal("9.00")}
+
+    async def test_bulk_create_reports_integrity_errors(self, test_core, db_session):
+        """Verify that a duplicate unique key surfaces as a Failure rather than an exception."""
+        # --- Arrange ---
+        company_id = uuid.uuid4()
+        service = test_core.product_service
+        rows = _product_rows(company_id, 1) * 2
+
+        # --- Act ---
+        result = await service.bulk_create(rows, db_session)
+
+        # --- Assert ---
+        assert isinstance(result, Failure)
+        assert "integrity" in result.error.lower()
+
+class TestStream:
+    """Test suite for streaming large result sets in chunks."""
+
+    async def test_stream_yields_all_rows_in_chunks(self, test_core, db_session):
+        """Verify that stream returns every matching record, at most chunk_size per chunk."""
+        # --- Arrange ---
+        company_id = uuid.uuid4()
+        service = test_core.product_service
+        await service.bulk_create(_product_rows(company_id, 7), db_session)
+
+        # --- Act ---
+        chunks = [chunk async for chunk in service.stream(company_id, chunk_size=3, order_by_column="sku", session=db_session)]
+
+        # --- Assert ---
+        assert [len(chunk) for chunk in chunks] == [3, 3, 1]
+        assert [p.sku for chunk in chunks for p in chunk] == [f"BULK-{i:03d}" for i in range(7)]
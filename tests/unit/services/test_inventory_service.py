@@ -0,0 +1,68 @@
+# File: tests/unit/services/test_inventory_service.py
+"""
+Unit tests for the InventoryService class.
+"""
+import uuid
+from decimal import Decimal
+import pytest
+import sqlalchemy as sa
+
+from app.core.result import Success
+from app.models.inventory import Inventory, StockMovement
+
+pytestmark = pytest.mark.asyncio
+
+class TestInventoryService:
+    """Test suite for stock level reads and adjustments."""
+
+    async def test_stock_level_distinguishes_variant_and_base_product(self, test_core, db_session):
+        """Verify that the prebuilt statements match the base product (NULL variant) and a variant separately."""
+        # --- Arrange ---
+        outlet_id, product_id, variant_id = uuid.uuid4(), uuid.uuid4(), uuid.uuid4()
+        db_session.add_all([
+            Inventory(outlet_id=outlet_id, product_id=product_id, variant_id=None, quantity_on_hand=Decimal("5")),
+            Inventory(outlet_id=outlet_id, product_id=product_id, variant_id=variant_id, quantity_on_hand=Decimal("7")),
+        ])
+        await db_session.flush()
+        service = test_core.inventory_service
+
+        # --- Act ---
+        base_level = await service.get_stock_level(outlet_id, product_id, None, db_session)
+        variant_level = await service.get_stock_level(outlet_id, product_id, variant_id, db_session)
+        missing_level = await service.get_stock_level(outlet_id, uuid.uuid4(), None, db_session)
+
+        # --- Assert ---
+        assert isinstance(base_level, Success) and base_level.value == Decimal("5")
+        assert variant_level.value == Decimal("7")
+        assert missing_level.value == Decimal("0")
+
+    async def test_adjust_stock_level_updates_the_matching_row(self, test_core, db_session):
+        """Verify that adjusting a product without a variant updates its row instead of inserting another."""
+        # --- Arrange ---
+        outlet_id, product_id = uuid.uuid4(), uuid.uuid4()
+        db_session.add(Inventory(outlet_id=outlet_id, product_id=product_id, variant_id=None, quantity_on_hand=Decimal("5")))
+        await db_session.flush()
+        service = test_core.inventory_service
+
+        # --- Act ---
+        result = await service.adjust_stock_level(outlet_id, product_id, None, Decimal("-2"), db_session)
+
+        # --- Assert ---
+        assert isinstance(result, Success)
+        assert result.value == Decimal("3")
+        assert (await service.get_stock_level(outlet_id, product_id, None, db_session)).value == Decimal("3")
+
+    async def test_log_movements_inserts_every_movement(self, test_core, db_session):
+        """Verify that bulk-logged movements are all stored and their ids returned."""
+        # --- Arrange ---
+        company_id, outlet_id, product_id = uuid.uuid4(), uuid.uuid4(), uuid.uuid4()
+        movements = [{"company_id": company_id, "outlet_id": outlet_id, "product_id": product_id,
+                      "movement_type": "ADJUSTMENT_IN", "quantity_change": Decimal(i + 1)} for i in range(3)]
+
+        # --- Act ---
+        result = await test_core.inventory_service.log_movements(movements, db_session, batch_size=2)
+
+        # --- Assert ---
+        assert isinstance(result, Success) and len(result.value) == 3
+        stored = (await db_session.execute(sa.select(StockMovement.quantity_change).where(StockMovement.product_id == product_id))).scalars().all()
+        assert sorted(stored) == [Decimal("1"), Decimal("2"), Decimal("3")]
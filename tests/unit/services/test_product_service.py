@@ -2,9 +2,12 @@
 """
 Unit tests for the ProductService class.
 """
+import uuid
+from decimal import Decimal
 import pytest
 
 from app.core.result import Success
+from app.models.product import Product
 from tests.factories import ProductFactory, CompanyFactory
 
 pytestmark = pytest.mark.asyncio
@@ -80,3 +83,51 @@ class TestProductService:
         result4 = await test_core.product_service.search(company.id, "nonexistent")
         assert isinstance(result4, Success)
         assert len(result4.value) == 0
+
+    async def test_list_rows_project_only_list_columns(self, test_core, db_session):
+        """Verify that the list page and search return plain rows holding just the list columns."""
+        # --- Arrange ---
+        company_id = uuid.uuid4()
+        db_session.add_all([
+            Product(company_id=company_id, sku="ROW-1", name="Alpha Lamp", description="long text", barcode="111",
+                    cost_price=Decimal("1.00"), selling_price=Decimal("2.00")),
+            Product(company_id=company_id, sku="ROW-2", name="Beta Lamp", cost_price=Decimal("1.00"), selling_price=Decimal("3.00")),
+        ])
+        await db_session.flush()
+        service = test_core.product_service
+
+        # --- Act ---
+        page_result = await service.get_list_rows_page(company_id, limit=1, session=db_session)
+        next_result = await service.get_list_rows_page(company_id, limit=1, cursor=page_result.value.next_cursor, session=db_session)
+        search_result = await service.search_list_rows(company_id, "111", session=db_session)
+
+        # --- Assert ---
+        first = page_result.value.items[0]
+        assert set(first) == {"id", "sku", "name", "barcode", "selling_price", "cost_price", "gst_rate", "is_active"}
+        assert first["name"] == "Alpha Lamp"
+        assert [r["name"] for r in next_result.value.items] == ["Beta Lamp"] and next_result.value.next_cursor is None
+        assert [r["sku"] for r in search_result.value] == ["ROW-1"]
+
+    async def test_search_ranks_exact_code_first_and_tracks_edits(self, test_core, db_session):
+        """Verify that an exact SKU outranks names containing it, short terms still match and renamed products are found."""
+        # --- Arrange ---
+        company_id = uuid.uuid4()
+        lamp = Product(company_id=company_id, sku="LMP", name="Alpha LMP Adapter", cost_price=Decimal("1.00"), selling_price=Decimal("2.00"))
+        db_session.add_all([
+            Product(company_id=company_id, sku="ADP-1", name="Adapter for LMP", cost_price=Decimal("1.00"), selling_price=Decimal("2.00")),
+            lamp,
+        ])
+        await db_session.flush()
+        service = test_core.product_service
+
+        # --- Act ---
+        ranked = await service.search_list_rows(company_id, "lmp", session=db_session)
+        short = await service.search_list_rows(company_id, "lm", session=db_session)
+        lamp.name = "Desk Lamp"
+        await db_session.flush()
+        renamed = await service.search_list_rows(company_id, "desk", session=db_session)
+
+        # --- Assert ---
+        assert [r["sku"] for r in ranked.value] == ["LMP", "ADP-1"]
+        assert [r["sku"] for r in short.value] == ["ADP-1", "LMP"] # Too short for trigrams: ILIKE scan, by name.
+        assert [r["sku"] for r in renamed.value] == ["LMP"]
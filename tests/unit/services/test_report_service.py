@@ -0,0 +1,43 @@
+# File: tests/unit/services/test_report_service.py
+"""
+Unit tests for the ReportService class.
+"""
+import uuid
+from datetime import date, datetime
+from decimal import Decimal
+import pytest
+
+from app.models.product import Product
+from app.models.sales import SalesTransaction, SalesTransactionItem
+
+pytestmark = pytest.mark.asyncio
+
+class TestReportService:
+    """Test suite for the streamed report queries."""
+
+    async def test_stream_sales_lines_yields_completed_lines_in_chunks(self, test_core, db_session):
+        """Verify that only completed sales in the period are streamed, oldest first, chunk by chunk."""
+        # --- Arrange ---
+        company_id = uuid.uuid4()
+        product = Product(company_id=company_id, sku="LINE-1", name="Line Product", cost_price=Decimal("1.00"), selling_price=Decimal("2.00"))
+        db_session.add(product)
+        for day, status in [(3, "COMPLETED"), (1, "COMPLETED"), (2, "VOIDED"), (2, "COMPLETED")]:
+            sale = SalesTransaction(company_id=company_id, outlet_id=uuid.uuid4(), cashier_id=uuid.uuid4(),
+                                    transaction_number=f"T-{day}-{status}", transaction_date=datetime(2024, 1, day, 10),
+                                    subtotal=Decimal("4.00"), tax_amount=Decimal("0.00"), total_amount=Decimal("4.00"), status=status)
+            db_session.add(sale)
+            await db_session.flush()
+            for _ in range(2):
+                db_session.add(SalesTransactionItem(sales_transaction_id=sale.id, product_id=product.id, quantity=Decimal("1"),
+                                                    unit_price=Decimal("2.00"), cost_price=Decimal("1.00"), line_total=Decimal("2.00")))
+        await db_session.flush()
+
+        # --- Act ---
+        stream = test_core.report_service.stream_sales_lines(company_id, date(2024, 1, 1), date(2024, 1, 31), chunk_size=4)
+        chunks = [chunk async for chunk in stream]
+
+        # --- Assert ---
+        assert [len(chunk) for chunk in chunks] == [4, 2]
+        numbers = [line["transaction_number"] for chunk in chunks for line in chunk]
+        assert numbers == ["T-1-COMPLETED"] * 2 + ["T-2-COMPLETED"] * 2 + ["T-3-COMPLETED"] * 2
+        assert chunks[0][0]["sku"] == "LINE-1"
@@ -0,0 +1,61 @@
+# File: tests/unit/test_import_budget.py
+"""
+Cold-start import budget for the application entry point.
+
+Each test imports app.main in a fresh interpreter (as `python -X importtime app/main.py`
+would) so that modules already loaded by the test session do not hide regressions.
+"""
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+
+# Cumulative import time of app.main, in milliseconds. Generous enough for slow CI
+# machines; override with SGPOS_IMPORT_BUDGET_MS when profiling locally.
+IMPORT_BUDGET_MS = float(os.environ.get("SGPOS_IMPORT_BUDGET_MS", 2500))
+
+# Modules that must only be imported when the user first needs them.
+DEFERRED_MODULES = [
+    "reportlab",
+    "app.business_logic.managers.reporting_manager",
+    "app.ui.dialogs.payment_dialog",
+    "app.ui.views.dashboard_view",
+    "app.ui.views.product_view",
+    "app.ui.views.customer_view",
+    "app.ui.views.inventory_view",
+    "app.ui.views.reports_view",
+    "app.ui.views.settings_view",
+]
+
+def _run_python(*args: str) -> subprocess.CompletedProcess:
+    env = {**os.environ, "QT_QPA_PLATFORM": "offscreen", "PYTHONPATH": str(PROJECT_ROOT)}
+    return subprocess.run([sys.executable, *args], cwd=PROJECT_ROOT, env=env, capture_output=True, text=True, timeout=120)
+
+class TestImportBudget:
+    """Test suite guarding the cold-start import cost of app.main."""
+
+    def test_heavy_modules_are_not_imported_at_startup(self):
+        """Verify that views, dialogs and ReportLab are not loaded by importing app.main."""
+        # --- Act ---
+        proc = _run_python("-c", "import sys, app.main; print('\\n'.join(sys.modules))")
+
+        # --- Assert ---
+        assert proc.returncode == 0, proc.stderr
+        loaded = set(proc.stdout.split())
+        assert [m for m in DEFERRED_MODULES if m in loaded] == []
+
+    def test_cold_import_of_app_main_is_within_budget(self):
+        """Verify that the cumulative import time of app.main stays below IMPORT_BUDGET_MS."""
+        # --- Act ---
+        proc = _run_python("-X", "importtime", "-c", "import app.main")
+
+        # --- Assert ---
+        assert proc.returncode == 0, proc.stderr
+        # Lines look like "import time:   self [us] | cumulative | module"; app.main's is the last.
+        cumulative_us = next(
+            int(line.split("|")[1]) for line in reversed(proc.stderr.splitlines())
+            if line.startswith("import time:") and line.split("|")[2].strip() == "app.main"
+        )
+        assert cumulative_us / 1000 <= IMPORT_BUDGET_MS, f"app.main took {cumulative_us / 1000:.0f} ms to import"